@@ -0,0 +1,125 @@
+"""
+Background workers that run mysqldump / mysql against backup files
+"""
+
+import gzip
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+
+logger = logging.getLogger(__name__)
+
+
+class BackupWorkerSignals(QObject):
+    """Signals emitted by BackupWorker and RestoreWorker"""
+    finished = Signal(int, int, str)  # return code, file size, stderr
+
+
+# Chunk size for streaming dumps through gzip
+_STREAM_CHUNK = 1024 * 1024
+
+# Stream rows (--quick) from one consistent InnoDB snapshot instead of
+# locking every table for the length of the dump
+MYSQLDUMP_FLAGS = (
+    "--single-transaction",
+    "--quick",
+    "--skip-lock-tables",
+    "--default-character-set=utf8mb4",
+)
+
+
+class BackupWorker(QRunnable):
+    """Runs a mysqldump command into a file off the UI thread
+    
+    A backup_path ending in .gz is compressed on the fly.
+    """
+    
+    def __init__(self, command, backup_path, name):
+        super().__init__()
+        self.signals = BackupWorkerSignals()
+        self.command = command
+        self.backup_path = backup_path
+        self.name = name  # what is being backed up, for the result message
+    
+    def run(self):
+        try:
+            if self.backup_path.endswith('.gz'):
+                process, stderr = self._dump_compressed()
+            else:
+                with open(self.backup_path, 'wb') as backup_file:
+                    process = subprocess.Popen(
+                        self.command,
+                        stdout=backup_file,
+                        stderr=subprocess.PIPE
+                    )
+                    _, stderr = process.communicate()
+            
+            size = os.path.getsize(self.backup_path) if process.returncode == 0 else 0
+            self.signals.finished.emit(process.returncode, size, stderr.decode(errors="replace"))
+        
+        except Exception as e:
+            logger.exception("Backup exception: %s", e)
+            self.signals.finished.emit(-1, 0, str(e))
+    
+    def _dump_compressed(self):
+        """Pipe mysqldump through gzip; level 1 keeps up with the dump"""
+        # stderr goes to a temp file so a chatty dump can't stall on a full pipe
+        with tempfile.TemporaryFile() as err, \
+                gzip.open(self.backup_path, 'wb', compresslevel=1) as backup_file:
+            process = subprocess.Popen(self.command, stdout=subprocess.PIPE, stderr=err)
+            with process.stdout:
+                shutil.copyfileobj(process.stdout, backup_file, _STREAM_CHUNK)
+            process.wait()
+            err.seek(0)
+            return process, err.read()
+
+
+class RestoreWorker(QRunnable):
+    """Feeds a backup file into the mysql client off the UI thread
+    
+    .gz backups are decompressed while they are streamed in.
+    """
+    
+    def __init__(self, command, backup_path, name):
+        super().__init__()
+        self.signals = BackupWorkerSignals()
+        self.command = command
+        self.backup_path = backup_path
+        self.name = name  # database being restored, for the result message
+    
+    def run(self):
+        try:
+            if self.backup_path.endswith('.gz'):
+                process, stderr = self._restore_compressed()
+            else:
+                with open(self.backup_path, 'rb') as backup_file:
+                    process = subprocess.Popen(
+                        self.command,
+                        stdin=backup_file,
+                        stderr=subprocess.PIPE
+                    )
+                    _, stderr = process.communicate()
+            
+            self.signals.finished.emit(process.returncode, 0, stderr.decode(errors="replace"))
+        
+        except Exception as e:
+            logger.exception("Restore exception: %s", e)
+            self.signals.finished.emit(-1, 0, str(e))
+    
+    def _restore_compressed(self):
+        """Decompress the backup straight into mysql's stdin"""
+        with tempfile.TemporaryFile() as err, gzip.open(self.backup_path, 'rb') as backup_file:
+            process = subprocess.Popen(self.command, stdin=subprocess.PIPE, stderr=err)
+            try:
+                with process.stdin:
+                    shutil.copyfileobj(backup_file, process.stdin, _STREAM_CHUNK)
+            except BrokenPipeError:
+                pass  # mysql quit early; its exit code and stderr say why
+            process.wait()
+            err.seek(0)
+            return process, err.read()
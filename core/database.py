@@ -2,20 +2,32 @@
 Database connection manager for MySQL/XAMPP
 """
 
+import threading
+import time
+
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, pooling
+from mysql.connector.errors import PoolError
 
 
 class DatabaseManager:
     """Manages MySQL database connections"""
     
-    def __init__(self, host="localhost", port=3306, user="root", password="", database=None):
+    # System schemas hidden from the user-facing database lists
+    SYSTEM_DATABASES = frozenset({
+        'information_schema', 'mysql', 'performance_schema', 'sys', 'phpmyadmin', 'test'
+    })
+    
+    def __init__(self, host="localhost", port=3306, user="root", password="", database=None,
+                 connect_timeout=None):
         self.host = host
         self.port = port
         self.user = user
         self.password = password
         self.database = database
+        self.connect_timeout = connect_timeout  # seconds; None keeps the driver default
         self.connection = None
+        self._pooled = False  # set by DBConnectionPool for pooled connections
         
     
     def connect(self):
@@ -26,7 +38,8 @@ class DatabaseManager:
                 port=self.port,
                 user=self.user,
                 password=self.password,
-                database=self.database
+                database=self.database,
+                connection_timeout=self.connect_timeout
             )
             
             if self.connection.is_connected():
@@ -45,6 +58,39 @@ class DatabaseManager:
             self.connection.close()
             print("✓ MySQL connection closed")
     
+    def _ensure_connected(self):
+        """Reconnect if the connection has dropped
+        
+        A pooled manager hands its dead connection back and checks out a
+        new one; connect() would swap in an unpooled connection and lose
+        the pool slot for good.
+        """
+        if self.connection and self.connection.is_connected():
+            return
+        if not self._pooled:
+            self.connect()
+            return
+        
+        self.release()
+        self.connection = DBConnectionPool.get_connection(wait=DBConnectionPool.CHECKOUT_WAIT)
+        if self.connection is None:
+            raise Error("Could not check out a pooled MySQL connection")
+    
+    def release(self):
+        """Hand a pooled connection back to its pool
+        
+        Unlike disconnect(), this closes even a connection that has dropped:
+        closing a pooled connection is what returns its slot to the pool.
+        """
+        connection, self.connection = self.connection, None
+        if connection is None:
+            return
+        try:
+            connection.close()
+        except Error:
+            # The slot is returned before a dead connection's reset fails
+            pass
+    
     def test_connection(self):
         """Test if connection is working"""
         try:
@@ -63,8 +109,7 @@ class DatabaseManager:
     def get_databases(self):
         """Get list of all databases"""
         try:
-            if not self.connection or not self.connection.is_connected():
-                self.connect()
+            self._ensure_connected()
             
             cursor = self.connection.cursor()
             cursor.execute("SHOW DATABASES")
@@ -72,8 +117,7 @@ class DatabaseManager:
             cursor.close()
             
             # Filter out system databases
-            system_dbs = ['information_schema', 'mysql', 'performance_schema', 'sys', 'phpmyadmin', 'test']
-            user_databases = [db for db in databases if db not in system_dbs]
+            user_databases = [db for db in databases if db not in self.SYSTEM_DATABASES]
             
             return user_databases
             
@@ -81,47 +125,102 @@ class DatabaseManager:
             print(f"Error getting databases: {e}")
             return []
     
-    def get_database_info(self, db_name):
-        """Get information about a specific database"""
+    def get_database_info_raw(self, db_name):
+        """Get size in bytes and table count for a database in one query"""
         try:
-            if not self.connection or not self.connection.is_connected():
-                self.connect()
+            self._ensure_connected()
             
             cursor = self.connection.cursor()
-            
-            # Get table count
-            cursor.execute(f"SELECT COUNT(*) FROM information_schema.tables WHERE table_schema = '{db_name}'")
-            table_count = cursor.fetchone()[0]
-            
-            # Get database size
-            cursor.execute(f"""
+            cursor.execute("""
                 SELECT 
-                    ROUND(SUM(data_length + index_length) / 1024 / 1024, 2) as size_mb
+                    COUNT(*) as table_count,
+                    COALESCE(SUM(data_length + index_length), 0) as size_bytes
                 FROM information_schema.tables 
-                WHERE table_schema = '{db_name}'
-            """)
-            size = cursor.fetchone()[0]
-            size_str = f"{size}MB" if size else "0MB"
-            
+                WHERE table_schema = %s
+            """, (db_name,))
+            table_count, size_bytes = cursor.fetchone()
             cursor.close()
             
             return {
-                "name": db_name,
-                "tables": table_count,
-                "size": size_str,
-                "type": "MySQL",
-                "status": "Active"
+                "size_bytes": int(size_bytes),
+                "tables": int(table_count)
             }
             
         except Error as e:
             print(f"Error getting database info: {e}")
             return None
     
+    def get_database_info(self, db_name):
+        """Get information about a specific database"""
+        raw = self.get_database_info_raw(db_name)
+        if raw is None:
+            return None
+        
+        return self._database_info(db_name, raw["size_bytes"], raw["tables"])
+    
+    @staticmethod
+    def _database_info(db_name, size_bytes, tables):
+        """Display dict shared by get_database_info and get_all_database_info"""
+        size_str = f"{size_bytes / (1024 * 1024):.2f}MB" if size_bytes else "0MB"
+        
+        return {
+            "name": db_name,
+            "tables": tables,
+            "size": size_str,
+            "type": "MySQL",
+            "status": "Active"
+        }
+    
+    def get_all_database_info(self, databases=None):
+        """Get get_database_info() dicts for many databases from one stats query
+        
+        Returns {db_name: info} for databases, or for get_databases() when
+        not given. Databases without tables report 0MB and 0 tables.
+        """
+        if databases is None:
+            databases = self.get_databases()
+        
+        stats = self.get_all_database_stats()
+        return {
+            db_name: self._database_info(db_name, *stats.get(db_name, (0, 0)))
+            for db_name in databases
+        }
+    
+    def get_all_database_stats(self):
+        """Get size and table count for every user database in one query
+        
+        Returns {db_name: (size_bytes, table_count)}. Databases without
+        tables are not included.
+        """
+        try:
+            self._ensure_connected()
+            
+            cursor = self.connection.cursor()
+            cursor.execute("""
+                SELECT 
+                    table_schema,
+                    COALESCE(SUM(data_length + index_length), 0) as size_bytes,
+                    COUNT(*) as table_count
+                FROM information_schema.tables 
+                GROUP BY table_schema
+            """)
+            stats = {
+                schema: (int(size_bytes), int(table_count))
+                for schema, size_bytes, table_count in cursor.fetchall()
+                if schema not in self.SYSTEM_DATABASES
+            }
+            cursor.close()
+            
+            return stats
+            
+        except Error as e:
+            print(f"Error getting database stats: {e}")
+            return {}
+    
     def execute_query(self, query):
         """Execute a custom SQL query"""
         try:
-            if not self.connection or not self.connection.is_connected():
-                self.connect()
+            self._ensure_connected()
             
             cursor = self.connection.cursor()
             cursor.execute(query)
@@ -140,3 +239,108 @@ class DatabaseManager:
         except Error as e:
             print(f"Error executing query: {e}")
             return None
+
+
+class DBConnectionPool:
+    """Shared MySQL connection pool so pages reuse live connections
+    instead of reconnecting for every action"""
+    
+    POOL_NAME = "dash"
+    # Shared UI manager, stats worker, list/create workers and an open
+    # table data dialog can all hold a connection at the same time
+    POOL_SIZE = 8
+    CHECKOUT_WAIT = 5.0  # seconds checkout() waits for a free slot
+    RETRY_INTERVAL = 0.05
+    ALIVE_TTL = 5.0  # seconds a liveness check stays valid
+    
+    _pool = None
+    _lock = threading.Lock()
+    _manager = None
+    _alive = None
+    _alive_checked = 0.0
+    
+    @classmethod
+    def _get_pool(cls):
+        """Create the underlying pool on first use"""
+        with cls._lock:
+            if cls._pool is None:
+                cls._pool = pooling.MySQLConnectionPool(
+                    pool_name=cls.POOL_NAME,
+                    pool_size=cls.POOL_SIZE,
+                    host="localhost",
+                    port=3306,
+                    user="root",
+                    password=""
+                )
+            return cls._pool
+    
+    @classmethod
+    def get_connection(cls, wait=0.0):
+        """Check a connection out of the pool, or None if MySQL is unreachable
+        
+        An exhausted pool is retried for up to wait seconds, so a burst of
+        workers queues for a slot instead of failing like a dead server.
+        """
+        deadline = time.monotonic() + wait
+        while True:
+            try:
+                return cls._get_pool().get_connection()
+            except PoolError as e:
+                if time.monotonic() >= deadline:
+                    print(f"✗ Error getting pooled connection: {e}")
+                    return None
+                time.sleep(cls.RETRY_INTERVAL)
+            except Error as e:
+                print(f"✗ Error getting pooled connection: {e}")
+                return None
+    
+    @classmethod
+    def _pooled_manager(cls, connection):
+        """Wrap a pooled connection in a DatabaseManager that reconnects through the pool"""
+        manager = DatabaseManager()
+        manager.connection = connection
+        manager._pooled = True
+        return manager
+    
+    @classmethod
+    def acquire(cls):
+        """Return the shared DatabaseManager, reconnecting through the pool if needed"""
+        manager = cls._manager
+        if manager and manager.connection and manager.connection.is_connected():
+            return manager
+        
+        if manager:
+            # A dead shared connection still holds its pool slot until closed
+            manager.release()
+        
+        connection = cls.get_connection()
+        if connection is None:
+            cls._manager = None
+            return None
+        
+        manager = cls._pooled_manager(connection)
+        cls._manager = manager
+        return manager
+    
+    @classmethod
+    def checkout(cls):
+        """Return a DatabaseManager on its own pooled connection
+        
+        Meant for worker threads, which must not share the UI's connection.
+        Waits up to CHECKOUT_WAIT seconds when every slot is in use. Call
+        release() on the manager to hand the connection back.
+        """
+        connection = cls.get_connection(wait=cls.CHECKOUT_WAIT)
+        if connection is None:
+            return None
+        
+        return cls._pooled_manager(connection)
+    
+    @classmethod
+    def is_alive(cls):
+        """Cached check that the MySQL server is reachable"""
+        now = time.monotonic()
+        if cls._alive is None or now - cls._alive_checked > cls.ALIVE_TTL:
+            cls._alive = cls.acquire() is not None
+            cls._alive_checked = now
+        return cls._alive
@@ -1,21 +1,53 @@
 """
 DB Manager Application Entry Point
 """
+import atexit
+import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from PySide6.QtWidgets import QApplication, QMessageBox
 from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt
 from ui.main_window import MainWindow
 from ui.dialog.login_dialog import LoginDialog
 from core.database import DatabaseManager
+from config.settings import Settings
+
+
+def setup_logging():
+    """Route log records through a queue to a background listener thread
+    
+    Handlers write to the console on the listener's thread, so logging
+    from UI slots never blocks on a slow terminal.
+    """
+    log_queue = queue.SimpleQueue()
+    
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    ))
+    
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, Settings.LOG_LEVEL))
+    root.addHandler(QueueHandler(log_queue))
+    
+    listener = QueueListener(log_queue, console_handler)
+    listener.start()
+    atexit.register(listener.stop)  # flush what is queued before exiting
 
 
 def main():
+    setup_logging()
     app = QApplication(sys.argv)
     
     # Set application font
     font = QFont("Segoe UI", 10)
     app.setFont(font)
     
+    # Combo popups open instantly instead of animating in
+    app.setEffectEnabled(Qt.UI_AnimateCombo, False)
+    
     # Initialize database manager
     db_manager = DatabaseManager(
         host="localhost",
@@ -261,7 +261,7 @@ QLineEdit::placeholder {
 }
 
 /* Tables */
-QTableWidget, QTreeWidget {
+QTableView, QTreeWidget {
     background-color: #252235;
     color: #e6d9ff;
     border: 1px solid #33304a;
@@ -269,12 +269,12 @@ QTableWidget, QTreeWidget {
     gridline-color: #33304a;
 }
 
-QTableWidget::item, QTreeWidget::item {
+QTableView::item, QTreeWidget::item {
     padding: 14px 10px;
     border-bottom: 1px solid #33304a;
 }
 
-QTableWidget::item:selected, QTreeWidget::item:selected {
+QTableView::item:selected, QTreeWidget::item:selected {
     background-color: #33304a;
     color: #e6d9ff;
 }
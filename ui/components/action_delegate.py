@@ -0,0 +1,162 @@
+"""
+Table column delegate that paints a row of action buttons
+"""
+
+from PySide6.QtWidgets import QStyledItemDelegate, QToolTip
+from PySide6.QtCore import Qt, Signal, QEvent, QRect
+from PySide6.QtGui import QCursor, QColor, QFont, QPainter, QPen
+
+
+_POINTING_CURSOR = None
+
+
+def pointing_cursor():
+    """Shared pointing-hand cursor, created on first use once Qt is running"""
+    global _POINTING_CURSOR
+    if _POINTING_CURSOR is None:
+        _POINTING_CURSOR = QCursor(Qt.PointingHandCursor)
+    return _POINTING_CURSOR
+
+
+# Painted button colors mirroring the pages' ActionButton styles:
+# button_type -> ((background, border, text) for idle/hover/pressed, font px)
+_ACTION_PAINT = {
+    "normal": ((("#4A5578", "#5A6588", "#E0E7FF"),
+                ("#0EA5E9", "#0EA5E9", "#FFFFFF"),
+                ("#0284C7", "#0EA5E9", "#FFFFFF")), 16),
+    "destructive": ((("#4A5578", "#5A6588", "#FF6B6B"),
+                     ("#EF4444", "#DC2626", "#FFFFFF"),
+                     ("#DC2626", "#DC2626", "#FFFFFF")), 18),
+}
+
+
+class ActionColumnDelegate(QStyledItemDelegate):
+    """Paints a column of action buttons and reports which one was clicked
+    
+    Replaces one ActionButton widget per row and action with plain painting;
+    hover is tracked through an event filter on the view's viewport.
+    """
+    
+    action_clicked = Signal(str, int)  # action key, row
+    
+    BUTTON_SIZE = 36
+    SPACING = 8
+    
+    def __init__(self, view, column, actions):
+        super().__init__(view)
+        self._view = view
+        self._column = column
+        self._actions = tuple(actions)
+        self._paint = [self._resolve_paint(button_type) for _k, _g, _t, button_type in self._actions]
+        self._hover = None    # (row, position) under the mouse
+        self._pressed = None  # (row, position) of a pending click
+        
+        view.setItemDelegateForColumn(column, self)
+        view.setMouseTracking(True)
+        view.viewport().installEventFilter(self)
+    
+    def _button_rects(self, rect):
+        size, spacing = self.BUTTON_SIZE, self.SPACING
+        total = len(self._actions) * (size + spacing) - spacing
+        x = rect.x() + (rect.width() - total) // 2
+        y = rect.y() + (rect.height() - size) // 2
+        return [QRect(x + i * (size + spacing), y, size, size) for i in range(len(self._actions))]
+    
+    def _hit(self, rect, pos):
+        for position, button_rect in enumerate(self._button_rects(rect)):
+            if button_rect.contains(pos):
+                return position
+        return None
+    
+    def _resolve_paint(self, button_type):
+        """Build the pens, brushes and font for a button type once, not per paint"""
+        states, pixel_size = _ACTION_PAINT[button_type]
+        font = QFont(self._view.font())
+        font.setPixelSize(pixel_size)
+        font.setBold(True)
+        return (
+            tuple((QColor(background), QPen(QColor(border), 1), QColor(text))
+                  for background, border, text in states),
+            font
+        )
+    
+    def paint(self, painter, option, index):
+        # Row background, selection and separator from the view's style
+        super().paint(painter, option, index)
+        
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        row = index.row()
+        for position, rect in enumerate(self._button_rects(option.rect)):
+            states, font = self._paint[position]
+            if self._pressed == (row, position):
+                background, border, text = states[2]
+            elif self._hover == (row, position):
+                background, border, text = states[1]
+            else:
+                background, border, text = states[0]
+            
+            painter.setPen(border)
+            painter.setBrush(background)
+            painter.drawRoundedRect(rect.adjusted(0, 0, -1, -1), 6, 6)
+            painter.setPen(text)
+            painter.setFont(font)
+            painter.drawText(rect, Qt.AlignCenter, self._actions[position][1])
+        painter.restore()
+    
+    def editorEvent(self, event, model, option, index):
+        if event.type() not in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease):
+            return super().editorEvent(event, model, option, index)
+        if event.button() != Qt.LeftButton:
+            return False
+        
+        position = self._hit(option.rect, event.position().toPoint())
+        if event.type() == QEvent.MouseButtonPress:
+            self._pressed = (index.row(), position) if position is not None else None
+            self._view.viewport().update(option.rect)
+            return position is not None
+        
+        pressed, self._pressed = self._pressed, None
+        self._view.viewport().update(option.rect)
+        if position is not None and pressed == (index.row(), position):
+            self.action_clicked.emit(self._actions[position][0], index.row())
+        return position is not None
+    
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.ToolTip:
+            position = self._hit(option.rect, event.pos())
+            if position is not None:
+                QToolTip.showText(event.globalPos(), self._actions[position][2], view)
+                return True
+            QToolTip.hideText()
+        return super().helpEvent(event, view, option, index)
+    
+    def eventFilter(self, watched, event):
+        event_type = event.type()
+        if event_type == QEvent.MouseMove:
+            pos = event.position().toPoint()
+            index = self._view.indexAt(pos)
+            hover = None
+            if index.isValid() and index.column() == self._column:
+                position = self._hit(self._view.visualRect(index), pos)
+                if position is not None:
+                    hover = (index.row(), position)
+            self._set_hover(hover)
+        elif event_type == QEvent.Leave:
+            self._set_hover(None)
+        return False
+    
+    def _set_hover(self, hover):
+        if hover == self._hover:
+            return
+        
+        viewport = self._view.viewport()
+        model = self._view.model()
+        for state in (self._hover, hover):
+            if state is not None:
+                viewport.update(self._view.visualRect(model.index(state[0], self._column)))
+        self._hover = hover
+        if hover is None:
+            viewport.unsetCursor()
+        else:
+            viewport.setCursor(pointing_cursor())
@@ -349,8 +349,7 @@ class MainWindow(QMainWindow):
             cursor.close()
 
             # Reload users list
-            if hasattr(self.users_page, '_load_users_from_database'):
-                self.users_page._load_users_from_database()
+            self.users_page.refresh()
 
             print(f"✓ Deleted user: {username}")
 
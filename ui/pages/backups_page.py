@@ -5,14 +5,76 @@ Backups management page with modern card-based design - Auto-Refresh Enabled
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame,
     QLineEdit, QComboBox, QPushButton, QTableWidget, 
-    QTableWidgetItem, QHeaderView, QMessageBox, QCheckBox
+    QTableWidgetItem, QHeaderView, QMessageBox, QCheckBox,
+    QAbstractItemView
 )
 from PySide6.QtCore import Qt, Signal, QTimer
 from PySide6.QtGui import QCursor
+import logging
 import os
+from collections import namedtuple
 from datetime import datetime
 
 
+logger = logging.getLogger(__name__)
+
+
+# Extensions recognised as backup files (str.endswith accepts a tuple)
+_BACKUP_EXTS = ('.sql', '.sql.gz')
+
+# Metadata captured for each backup file during the directory scan
+BackupRow = namedtuple("BackupRow", "name source mtime size path")
+
+
+# Action glyphs and button styles, built once and shared by every row
+RESTORE_GLYPH = "↻"
+DELETE_GLYPH = "⌧"
+DETAILS_GLYPH = "i"
+
+_ACTION_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #4A5578;
+        border: 1px solid #5A6588;
+        border-radius: 6px;
+        color: #E0E7FF;
+        font-size: 16px;
+        font-weight: 700;
+        padding: 0px;
+    }
+    QPushButton:hover {
+        background-color: #0EA5E9;
+        border-color: #0EA5E9;
+        color: #FFFFFF;
+    }
+    QPushButton:pressed {
+        background-color: #0284C7;
+    }
+"""
+
+_DESTRUCTIVE_BUTTON_STYLE = """
+    QPushButton {
+        background-color: #4A5578;
+        border: 1px solid #5A6588;
+        border-radius: 6px;
+        color: #FF6B6B;
+        font-size: 18px;
+        font-weight: 700;
+        padding: 0px;
+    }
+    QPushButton:hover {
+        background-color: #EF4444;
+        border-color: #DC2626;
+        color: #FFFFFF;
+    }
+    QPushButton:pressed {
+        background-color: #DC2626;
+    }
+"""
+
+_STATUS_OK_STYLE = "color: #6ee7b7; font-size: 13px; font-weight: 600;"
+_STATUS_EMPTY_STYLE = "color: #fca5a5; font-size: 13px; font-weight: 600;"
+
+
 class ActionButton(QPushButton):
     """Custom action button with icon and enhanced hover effects"""
     
@@ -24,45 +86,9 @@ class ActionButton(QPushButton):
         self.button_type = button_type
         
         if button_type == "destructive":
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #4A5578;
-                    border: 1px solid #5A6588;
-                    border-radius: 6px;
-                    color: #FF6B6B;
-                    font-size: 18px;
-                    font-weight: 700;
-                    padding: 0px;
-                }
-                QPushButton:hover {
-                    background-color: #EF4444;
-                    border-color: #DC2626;
-                    color: #FFFFFF;
-                }
-                QPushButton:pressed {
-                    background-color: #DC2626;
-                }
-            """)
+            self.setStyleSheet(_DESTRUCTIVE_BUTTON_STYLE)
         else:
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #4A5578;
-                    border: 1px solid #5A6588;
-                    border-radius: 6px;
-                    color: #E0E7FF;
-                    font-size: 16px;
-                    font-weight: 700;
-                    padding: 0px;
-                }
-                QPushButton:hover {
-                    background-color: #0EA5E9;
-                    border-color: #0EA5E9;
-                    color: #FFFFFF;
-                }
-                QPushButton:pressed {
-                    background-color: #0284C7;
-                }
-            """)
+            self.setStyleSheet(_ACTION_BUTTON_STYLE)
 
 
 class ConfirmationDialog(QMessageBox):
@@ -126,18 +152,20 @@ class BackupsPage(QWidget):
         super().__init__(parent)
         self.backup_directory = "backups"
         self.last_backup_count = 0
+        self._status_style = None
         self.auto_refresh_enabled = True
+        self._backup_rows = {}
         self._init_ui()
         self.load_real_backups()
         self._setup_auto_refresh()
-        print("[DEBUG] BackupsPage initialized with auto-refresh")
+        logger.debug("BackupsPage initialized with auto-refresh")
     
     def _setup_auto_refresh(self):
         """Setup automatic refresh timer"""
         self.refresh_timer = QTimer(self)
         self.refresh_timer.timeout.connect(self._check_for_changes)
         self.refresh_timer.start(5000)
-        print("[DEBUG] Auto-refresh timer started (5 seconds)")
+        logger.debug("Auto-refresh timer started (5 seconds)")
     
     def _check_for_changes(self):
         """Check if backup directory has changed"""
@@ -150,16 +178,16 @@ class BackupsPage(QWidget):
             
             current_count = 0
             for file in os.listdir(self.backup_directory):
-                if file.endswith('.sql') or file.endswith('.sql.gz'):
+                if file.endswith(_BACKUP_EXTS):
                     current_count += 1
             
             if current_count != self.last_backup_count:
-                print(f"[DEBUG] Backup count changed: {self.last_backup_count} -> {current_count}")
+                logger.debug("Backup count changed: %s -> %s", self.last_backup_count, current_count)
                 self.load_real_backups(silent=True)
                 self.last_backup_count = current_count
                 
         except Exception as e:
-            print(f"[ERROR] Auto-refresh check failed: {e}")
+            logger.error("Auto-refresh check failed: %s", e)
     
     def _init_ui(self):
         """Initialize backups page UI"""
@@ -249,81 +277,137 @@ class BackupsPage(QWidget):
     
     def load_real_backups(self, silent=False):
         """Load real backup files"""
-        print(f"[DEBUG] Loading backups (silent={silent})")
+        logger.debug("Loading backups (silent=%s)", silent)
         try:
             if not os.path.exists(self.backup_directory):
                 os.makedirs(self.backup_directory)
             
-            self.backups_table.setRowCount(0)
-            
-            backup_files = []
-            if os.path.exists(self.backup_directory):
-                for file in os.listdir(self.backup_directory):
-                    if file.endswith('.sql') or file.endswith('.sql.gz'):
-                        file_path = os.path.join(self.backup_directory, file)
-                        backup_files.append(file_path)
+            # Single directory pass: stat each entry once and keep a
+            # BackupRow for later lookups
+            backup_rows = []
+            with os.scandir(self.backup_directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(_BACKUP_EXTS):
+                        file_name = entry.name
+                        head, sep, _ = file_name.partition('_')
+                        source_db = head if sep else "Unknown"
+                        stat = entry.stat()
+                        backup_rows.append(BackupRow(file_name, source_db, stat.st_mtime, stat.st_size, entry.path))
             
-            self.last_backup_count = len(backup_files)
+            backup_rows.sort(key=lambda row: row.mtime, reverse=True)
+            self._backup_rows = {row.name: row for row in backup_rows}
+            self.last_backup_count = len(backup_rows)
             
-            if backup_files:
-                backup_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-                
-                for file_path in backup_files:
-                    file_name = os.path.basename(file_path)
-                    source_db = file_name.split('_')[0] if '_' in file_name else "Unknown"
-                    
-                    mod_time = os.path.getmtime(file_path)
-                    date_time = datetime.fromtimestamp(mod_time).strftime("%m/%d %H:%M")
-                    
-                    size_bytes = os.path.getsize(file_path)
-                    if size_bytes >= 1024 * 1024:
-                        size_str = f"{size_bytes / (1024 * 1024):.2f} MB"
-                    elif size_bytes >= 1024:
-                        size_str = f"{size_bytes / 1024:.2f} KB"
-                    else:
-                        size_str = f"{size_bytes} B"
-                    
-                    self._add_backup_row(file_name, source_db, date_time, size_str)
-                
-                if not silent:
-                    print(f"[SUCCESS] Loaded {len(backup_files)} backup files")
-            else:
-                if not silent:
-                    print("[INFO] No backup files found")
-                row = self.backups_table.rowCount()
-                self.backups_table.insertRow(row)
-                no_data_item = QTableWidgetItem("No backups found. Create your first backup from Databases page.")
-                no_data_item.setFlags(no_data_item.flags() & ~Qt.ItemIsEditable)
-                no_data_item.setForeground(Qt.GlobalColor.gray)
-                self.backups_table.setItem(row, 0, no_data_item)
-                self.backups_table.setSpan(row, 0, 1, 6)
+            self._begin_bulk_update()
+            try:
+                self._populate_backups(backup_rows, silent)
+            finally:
+                self._end_bulk_update()
             
-            self._update_status_label(len(backup_files))
+            self._update_status_label(len(backup_rows))
                 
         except Exception as e:
-            print(f"[ERROR] Failed to load backups: {e}")
+            logger.exception("Failed to load backups: %s", e)
             if not silent:
                 QMessageBox.warning(self, "Error", f"Could not load backup files.\n\nError: {str(e)}")
     
+    def _begin_bulk_update(self):
+        """Freeze the table while rows are inserted"""
+        table = self.backups_table
+        header = table.horizontalHeader()
+        self._saved_sorting = table.isSortingEnabled()
+        self._saved_resize_modes = [header.sectionResizeMode(col) for col in range(table.columnCount())]
+        
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        table.blockSignals(True)
+        header.setSectionResizeMode(QHeaderView.Interactive)
+    
+    def _end_bulk_update(self):
+        """Restore resize modes and repaint once after bulk insert"""
+        table = self.backups_table
+        header = table.horizontalHeader()
+        for col, mode in enumerate(self._saved_resize_modes):
+            header.setSectionResizeMode(col, mode)
+        
+        table.blockSignals(False)
+        table.setSortingEnabled(self._saved_sorting)
+        table.setUpdatesEnabled(True)
+    
+    def _populate_backups(self, backup_rows, silent):
+        """Fill the table from pre-scanned backup rows"""
+        self.backups_table.setRowCount(0)
+        
+        if backup_rows:
+            for file_name, source_db, mod_time, size_bytes, _ in backup_rows:
+                date_time = datetime.fromtimestamp(mod_time).strftime("%m/%d %H:%M")
+                
+                if size_bytes >= 1024 * 1024:
+                    size_str = f"{size_bytes / (1024 * 1024):.2f} MB"
+                elif size_bytes >= 1024:
+                    size_str = f"{size_bytes / 1024:.2f} KB"
+                else:
+                    size_str = f"{size_bytes} B"
+                
+                self._add_backup_row(file_name, source_db, date_time, size_str)
+            
+            if not silent:
+                logger.info("Loaded %s backup files", len(backup_rows))
+        else:
+            if not silent:
+                logger.info("No backup files found")
+            row = self.backups_table.rowCount()
+            self.backups_table.insertRow(row)
+            no_data_item = QTableWidgetItem("No backups found. Create your first backup from Databases page.")
+            no_data_item.setFlags(no_data_item.flags() & ~Qt.ItemIsEditable)
+            no_data_item.setForeground(Qt.GlobalColor.gray)
+            self.backups_table.setItem(row, 0, no_data_item)
+            self.backups_table.setSpan(row, 0, 1, 6)
+    
+    def get_by_name(self, backup_name):
+        """Return the cached BackupRow for a file, or None if it is gone"""
+        row = self._backup_rows.get(backup_name)
+        if row is not None:
+            return row
+        
+        # Not seen by the last scan (created since) - stat it once
+        file_path = os.path.join(self.backup_directory, backup_name)
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        
+        head, sep, _ = backup_name.partition('_')
+        source_db = head if sep else "Unknown"
+        row = BackupRow(backup_name, source_db, stat.st_mtime, stat.st_size, file_path)
+        self._backup_rows[backup_name] = row
+        return row
+    
     def _update_status_label(self, count):
         """Update status label"""
         if hasattr(self, 'status_label'):
             if count > 0:
                 self.status_label.setText(f"Showing {count} backup file{'s' if count != 1 else ''}")
-                self.status_label.setStyleSheet("color: #6ee7b7; font-size: 13px; font-weight: 600;")
+                style = _STATUS_OK_STYLE
             else:
                 self.status_label.setText("No backups available")
-                self.status_label.setStyleSheet("color: #fca5a5; font-size: 13px; font-weight: 600;")
+                style = _STATUS_EMPTY_STYLE
+            
+            # Only re-apply the stylesheet when the state actually flips;
+            # setStyleSheet re-polishes the label every time it is called
+            if style is not self._status_style:
+                self.status_label.setStyleSheet(style)
+                self._status_style = style
     
     def toggle_auto_refresh(self, enabled):
         """Toggle auto-refresh"""
         self.auto_refresh_enabled = enabled
         if enabled:
             self.refresh_timer.start(5000)
-            print("[DEBUG] Auto-refresh enabled")
+            logger.debug("Auto-refresh enabled")
         else:
             self.refresh_timer.stop()
-            print("[DEBUG] Auto-refresh disabled")
+            logger.debug("Auto-refresh disabled")
     
     def _create_controls(self):
         """Create search and filter controls"""
@@ -335,7 +419,13 @@ class BackupsPage(QWidget):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("⌕ Search backups...")
         self.search_input.setMinimumHeight(44)
-        self.search_input.textChanged.connect(self._filter_backups)
+        
+        # Debounce filtering so a burst of keystrokes runs one filter pass
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        self.search_input.textChanged.connect(lambda _: self._filter_timer.start())
         self.search_input.setStyleSheet("""
             QLineEdit {
                 background-color: #2A2F4A;
@@ -387,6 +477,10 @@ class BackupsPage(QWidget):
         
         return controls_frame
     
+    def _apply_filter(self):
+        """Apply the current search text once typing settles"""
+        self._filter_backups(self.search_input.text())
+    
     def _filter_backups(self, text):
         """Filter backups"""
         for row in range(self.backups_table.rowCount()):
@@ -437,7 +531,13 @@ class BackupsPage(QWidget):
         self.backups_table.horizontalHeader().setSectionResizeMode(5, QHeaderView.Fixed)
         self.backups_table.horizontalHeader().resizeSection(5, 160)
         
+        # Uniform row heights let the view compute row offsets instead of
+        # measuring each row, so only rows in the viewport get painted
         self.backups_table.verticalHeader().setVisible(False)
+        self.backups_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.backups_table.verticalHeader().setDefaultSectionSize(75)
+        self.backups_table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.backups_table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
         self.backups_table.setSelectionBehavior(QTableWidget.SelectRows)
         self.backups_table.setSelectionMode(QTableWidget.SingleSelection)
         self.backups_table.setShowGrid(False)
@@ -478,13 +578,13 @@ class BackupsPage(QWidget):
         actions_layout.setContentsMargins(8, 6, 8, 6)
         actions_layout.setSpacing(8)
         
-        btn_restore = ActionButton("↻", "Restore Database")
+        btn_restore = ActionButton(RESTORE_GLYPH, "Restore Database")
         btn_restore.clicked.connect(lambda checked=False, name=backup_name: self._handle_restore(name))
         
-        btn_delete = ActionButton("⌧", "Delete Backup", "destructive")
+        btn_delete = ActionButton(DELETE_GLYPH, "Delete Backup", "destructive")
         btn_delete.clicked.connect(lambda checked=False, name=backup_name: self._handle_delete(name))
         
-        btn_details = ActionButton("i", "View Details")
+        btn_details = ActionButton(DETAILS_GLYPH, "View Details")
         btn_details.clicked.connect(lambda checked=False, name=backup_name: self._handle_details(name))
         
         actions_layout.addWidget(btn_restore)
@@ -492,7 +592,15 @@ class BackupsPage(QWidget):
         actions_layout.addWidget(btn_details)
         
         self.backups_table.setCellWidget(row, 5, actions_widget)
-        self.backups_table.setRowHeight(row, 75)
+    
+    def _exec_dialog(self, dialog):
+        """Run a modal dialog with auto-refresh paused"""
+        self.refresh_timer.stop()
+        try:
+            return dialog.exec()
+        finally:
+            if self.auto_refresh_enabled:
+                self.refresh_timer.start(5000)
     
     def _handle_restore(self, backup_name: str):
         """Handle restore"""
@@ -503,10 +611,9 @@ class BackupsPage(QWidget):
             "This will create a new database or overwrite an existing one."
         )
         
-        if dialog.exec() == QMessageBox.Yes:
+        if self._exec_dialog(dialog) == QMessageBox.Yes:
             self.restore_requested.emit(backup_name)
             QMessageBox.information(self, "Restore Started", f"Restoring from: {backup_name}")
-            QTimer.singleShot(2000, self.load_real_backups)
     
     def _handle_delete(self, backup_name: str):
         """Handle delete"""
@@ -517,7 +624,7 @@ class BackupsPage(QWidget):
             "This action cannot be undone."
         )
         
-        if dialog.exec() == QMessageBox.Yes:
+        if self._exec_dialog(dialog) == QMessageBox.Yes:
             try:
                 file_path = os.path.join(self.backup_directory, backup_name)
                 if os.path.exists(file_path):
@@ -532,12 +639,11 @@ class BackupsPage(QWidget):
         """Handle details"""
         self.view_details_requested.emit(backup_name)
         
-        file_path = os.path.join(self.backup_directory, backup_name)
+        row = self.get_by_name(backup_name)
         
-        if os.path.exists(file_path):
-            size_bytes = os.path.getsize(file_path)
-            mod_time = os.path.getmtime(file_path)
-            date_time = datetime.fromtimestamp(mod_time).strftime("%m/%d/%Y %H:%M:%S")
+        if row is not None:
+            date_time = datetime.fromtimestamp(row.mtime).strftime("%m/%d/%Y %H:%M:%S")
+            size_bytes = row.size
             
             if size_bytes >= 1024 * 1024:
                 size_str = f"{size_bytes / (1024 * 1024):.2f} MB"
@@ -546,16 +652,14 @@ class BackupsPage(QWidget):
             else:
                 size_str = f"{size_bytes} B"
             
-            source_db = backup_name.split('_')[0] if '_' in backup_name else "Unknown"
-            
             QMessageBox.information(
                 self,
                 "Backup Details",
                 f"Backup: {backup_name}\n\n"
-                f"Source: {source_db}\n"
+                f"Source: {row.source}\n"
                 f"Date: {date_time}\n"
                 f"Size: {size_str}\n"
-                f"Path: {file_path}"
+                f"Path: {row.path}"
             )
         else:
             QMessageBox.warning(self, "Not Found", f"Backup file '{backup_name}' not found.")
@@ -5,17 +5,366 @@ All Quick Actions are now fully functional
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame,
-    QPushButton, QGridLayout, QMessageBox, QInputDialog, QApplication
+    QPushButton, QGridLayout, QMessageBox, QInputDialog,
+    QListView, QStyledItemDelegate, QAbstractItemView
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, Signal,
+    QAbstractListModel, QModelIndex, QSize
+)
+from PySide6.QtGui import QColor, QFont, QIcon, QPainter, QPixmap
 from ui.components.stat_card import StatCard
-from core.database import DatabaseManager
+from core.backup_workers import BackupWorker, RestoreWorker, MYSQLDUMP_FLAGS
+from core.database import DBConnectionPool
+from mysql.connector.errors import OperationalError
+import logging
 import os
-import subprocess
+import shutil
+import time
 from datetime import datetime
-import traceback
 
 
+logger = logging.getLogger(__name__)
+
+
+# Extensions recognised as backup files (str.endswith accepts a tuple)
+_BACKUP_EXTS = ('.sql', '.sql.gz')
+
+# Default XAMPP locations of the MySQL client tools
+MYSQLDUMP_PATH = r"C:\xampp\mysql\bin\mysqldump.exe"
+MYSQL_PATH = r"C:\xampp\mysql\bin\mysql.exe"
+
+# Page-level stylesheet, parsed once for every label on the dashboard
+DASHBOARD_QSS = """
+    QLabel#pageTitle {
+        font-size: 36px;
+        font-weight: 700;
+        color: #e6d9ff;
+        letter-spacing: -1.2px;
+    }
+    QLabel#pageSubtitle {
+        color: #b8a5d8;
+        font-size: 16px;
+        font-weight: 500;
+    }
+    QLabel#sectionTitle {
+        font-size: 20px;
+        font-weight: 700;
+        color: #e6d9ff;
+    }
+    QListView#dashboardList {
+        background: transparent;
+        border: none;
+    }
+    #linkButton {
+        background: transparent;
+        border: none;
+        color: #8b7ab8;
+        font-weight: 600;
+        font-size: 14px;
+        padding: 6px 12px;
+    }
+    #linkButton:hover {
+        color: #b8a5d8;
+    }
+"""
+
+# Units for relative times, largest first: (seconds, singular, plural)
+_UNITS = (
+    (86400, "day", "days"),
+    (3600, "hour", "hours"),
+    (60, "minute", "minutes"),
+)
+
+
+def _format_time_ago(seconds):
+    """Format an elapsed number of seconds as '3 hours ago' / 'Just now'"""
+    for threshold, singular, plural in _UNITS:
+        count = seconds // threshold
+        if count > 0:
+            return f"{count} {singular if count == 1 else plural} ago"
+    return "Just now"
+
+
+def _scan_backups(directory, cache=None):
+    """Return (dir mtime_ns, [(mtime, file name), ...]) for every backup file
+    
+    cache is an earlier result, returned as is while the directory's mtime
+    is unchanged. Only local state is touched, so worker threads can call it.
+    """
+    # Skip the scan entirely while the directory is unchanged
+    dir_mtime = os.stat(directory).st_mtime_ns
+    if cache and cache[0] == dir_mtime:
+        return cache
+    
+    # Single scandir pass; DirEntry.stat() reuses the enumeration data
+    with os.scandir(directory) as entries:
+        backup_files = [
+            (entry.stat().st_mtime, entry.name)
+            for entry in entries
+            if entry.name.endswith(_BACKUP_EXTS)
+        ]
+    return dir_mtime, backup_files
+
+
+# Quick action glyphs: (symbol, colour matching the button text)
+_ACTION_GLYPHS = {
+    'new_backup': ("✦", "#1a1625"),
+    'restore': ("↻", "#e6d9ff"),
+    'manage': ("⚙", "#e6d9ff"),
+    'refresh': ("⟳", "#e6d9ff"),
+}
+
+# Rendered glyph icons, filled on first use (needs a QApplication)
+_ACTION_ICONS = {}
+
+
+def _action_icon(name):
+    """Render a quick action glyph to a pixmap once and reuse the icon"""
+    icon = _ACTION_ICONS.get(name)
+    if icon is None:
+        glyph, color = _ACTION_GLYPHS[name]
+        pixmap = QPixmap(24, 24)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.TextAntialiasing)
+        font = QFont()
+        font.setPixelSize(18)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QColor(color))
+        painter.drawText(pixmap.rect(), Qt.AlignCenter, glyph)
+        painter.end()
+        
+        icon = _ACTION_ICONS[name] = QIcon(pixmap)
+    return icon
+
+
+# Card values shown when statistics could not be loaded
+_STAT_DEFAULTS = {
+    'databases': "0",
+    'backups': "0",
+    'storage': "0 GB",
+    'time': "Never"
+}
+
+
+# Colours for status values and activity dots
+_STATUS_COLORS = {
+    "success": "#6ee7b7",
+    "error": "#fca5a5",
+    "warning": "#fcd34d",
+    "info": "#b8a5d8"
+}
+
+# Extra item roles used by ActivityModel
+DETAIL_ROLE = Qt.UserRole + 1
+STATUS_ROLE = Qt.UserRole + 2
+
+
+def _font(pixel_size, weight):
+    """Build a font for delegate painting"""
+    font = QFont()
+    font.setPixelSize(pixel_size)
+    font.setWeight(weight)
+    return font
+
+
+class ActivityModel(QAbstractListModel):
+    """Read-only rows of (text, detail, status_type) for the dashboard lists"""
+    
+    def __init__(self, rows=(), parent=None):
+        super().__init__(parent)
+        self._rows = list(rows)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        text, detail, status_type = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return text
+        if role == DETAIL_ROLE:
+            return detail
+        if role == STATUS_ROLE:
+            return status_type
+        return None
+    
+    def set_rows(self, rows):
+        """Replace all rows"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+
+
+class StatusDelegate(QStyledItemDelegate):
+    """Paints a status row: label on the left, coloured value on the right"""
+    
+    ROW_HEIGHT = 68
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._label_font = _font(15, QFont.Medium)
+        self._value_font = _font(15, QFont.Bold)
+    
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+    
+    def paint(self, painter, option, index):
+        painter.save()
+        rect = option.rect
+        
+        painter.setFont(self._label_font)
+        painter.setPen(QColor("#e6d9ff"))
+        painter.drawText(rect, Qt.AlignLeft | Qt.AlignVCenter, index.data())
+        
+        painter.setFont(self._value_font)
+        painter.setPen(QColor(_STATUS_COLORS.get(index.data(STATUS_ROLE), "#b8a5d8")))
+        painter.drawText(rect, Qt.AlignRight | Qt.AlignVCenter, index.data(DETAIL_ROLE))
+        
+        painter.restore()
+
+
+class ActivityDelegate(QStyledItemDelegate):
+    """Paints an activity row: status dot, description, time and a divider"""
+    
+    ROW_HEIGHT = 56
+    DOT_WIDTH = 20
+    SPACING = 16
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._dot_font = _font(14, QFont.Normal)
+        self._text_font = _font(15, QFont.Medium)
+        self._time_font = _font(14, QFont.Normal)
+    
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+    
+    def paint(self, painter, option, index):
+        painter.save()
+        rect = option.rect
+        
+        dot_rect = rect.adjusted(0, 0, 0, 0)
+        dot_rect.setWidth(self.DOT_WIDTH)
+        painter.setFont(self._dot_font)
+        painter.setPen(QColor(_STATUS_COLORS.get(index.data(STATUS_ROLE), "#b8a5d8")))
+        painter.drawText(dot_rect, Qt.AlignLeft | Qt.AlignVCenter, "●")
+        
+        painter.setFont(self._time_font)
+        painter.setPen(QColor("#b8a5d8"))
+        painter.drawText(rect, Qt.AlignRight | Qt.AlignVCenter, index.data(DETAIL_ROLE))
+        
+        text_rect = rect.adjusted(self.DOT_WIDTH + self.SPACING, 0, 0, 0)
+        painter.setFont(self._text_font)
+        painter.setPen(QColor("#e6d9ff"))
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, index.data())
+        
+        # Divider between rows (not after the last one)
+        if index.row() < index.model().rowCount() - 1:
+            painter.setPen(QColor("#33304a"))
+            painter.drawLine(rect.bottomLeft(), rect.bottomRight())
+        
+        painter.restore()
+
+
+def _make_list_view(model, delegate):
+    """Non-interactive list view sized to show every row without scrolling"""
+    view = QListView()
+    view.setObjectName("dashboardList")
+    view.setModel(model)
+    view.setItemDelegate(delegate)
+    view.setUniformItemSizes(True)
+    view.setSelectionMode(QAbstractItemView.NoSelection)
+    view.setFocusPolicy(Qt.NoFocus)
+    view.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+    view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+    view.setFixedHeight(model.rowCount() * delegate.ROW_HEIGHT)
+    return view
+
+
+class StatsWorkerSignals(QObject):
+    """Signals emitted by StatsWorker"""
+    done = Signal(dict, object)  # card values, backup listing or None
+
+
+class StatsWorker(QRunnable):
+    """Collects dashboard statistics off the UI thread"""
+    
+    def __init__(self, backup_directory, backup_cache=None):
+        super().__init__()
+        self.signals = StatsWorkerSignals()
+        self._backup_directory = backup_directory
+        self._backup_cache = backup_cache
+    
+    def run(self):
+        """Query MySQL and scan backups, then emit the card values"""
+        stats = {}
+        try:
+            # Worker threads use their own pooled connection
+            db_manager = DBConnectionPool.checkout()
+            
+            if db_manager:
+                try:
+                    # Get real database count
+                    databases = db_manager.get_databases()
+                    
+                    # Calculate total storage used (single grouped query)
+                    db_stats = db_manager.get_all_database_stats()
+                finally:
+                    db_manager.release()
+                
+                total_size_bytes = sum(size for size, _ in db_stats.values())
+                
+                # Convert to GB if large
+                if total_size_bytes >= 1024 ** 3:
+                    storage_str = f"{total_size_bytes / 1024 ** 3:.2f} GB"
+                else:
+                    storage_str = f"{total_size_bytes / 1024 ** 2:.2f} MB"
+                
+                # Get real backup count and last backup time
+                backup_count, last_backup_time = self._backup_stats()
+                
+                stats = {
+                    'databases': str(len(databases)),
+                    'backups': str(backup_count),
+                    'storage': storage_str,
+                    'time': last_backup_time
+                }
+        
+        except Exception as e:
+            logger.exception("Failed to load dashboard stats: %s", e)
+        
+        # The listing goes back to the page, which owns the shared cache
+        self.signals.done.emit(stats, self._backup_cache)
+    
+    def _backup_stats(self):
+        """Get backup count and last backup time from backup directory"""
+        try:
+            if not os.path.exists(self._backup_directory):
+                return 0, "Never"
+            
+            self._backup_cache = _scan_backups(self._backup_directory, self._backup_cache)
+            backup_files = self._backup_cache[1]
+            backup_count = len(backup_files)
+            
+            if backup_count == 0:
+                return 0, "Never"
+            
+            # Most recent backup - O(N) max instead of a full sort
+            mod_time = max(backup_files)[0]
+            
+            # Calculate time ago with plain epoch arithmetic
+            return backup_count, _format_time_ago(int(time.time() - mod_time))
+            
+        except Exception as e:
+            logger.exception("Failed to get backup stats: %s", e)
+            return 0, "Unknown"
+
 class DashboardPage(QWidget):
     """Dashboard page with clean stats, real data, and functional quick actions"""
     
@@ -23,12 +372,23 @@ class DashboardPage(QWidget):
         super().__init__(parent)
         self.db_manager = None
         self.backup_directory = "backups"
+        self._backup_cache = None  # (dir mtime_ns, [(mtime, name), ...])
+        self._stats_worker = None
+        self._announce_refresh = False
+        self._process_worker = None  # running BackupWorker / RestoreWorker
+        self._last_ping_ts = 0.0
+        
+        # Resolve client tools once instead of probing on every action
+        self._mysqldump = self._resolve_tool(MYSQLDUMP_PATH, "mysqldump")
+        self._mysql = self._resolve_tool(MYSQL_PATH, "mysql")
         self._init_ui()
         self.load_real_stats()
-        print("[DEBUG] DashboardPage initialized with real data and functional actions")
+        logger.debug("DashboardPage initialized with real data and functional actions")
     
     def _init_ui(self):
         """Initialize dashboard UI"""
+        self.setStyleSheet(DASHBOARD_QSS)
+        
         layout = QVBoxLayout(self)
         layout.setContentsMargins(48, 48, 48, 48)
         layout.setSpacing(40)
@@ -45,10 +405,10 @@ class DashboardPage(QWidget):
         
         # Initialize with placeholder cards
         self.stat_cards = {
-            'databases': StatCard("Total Databases", "0", "database"),
-            'backups': StatCard("Active Backups", "0", "backup"),
-            'storage': StatCard("Storage Used", "0 GB", "storage"),
-            'time': StatCard("Last Backup", "Never", "time")
+            'databases': StatCard("Total Databases", "Loading…", "database"),
+            'backups': StatCard("Active Backups", "Loading…", "backup"),
+            'storage': StatCard("Storage Used", "Loading…", "storage"),
+            'time': StatCard("Last Backup", "Loading…", "time")
         }
         
         # Add cards to grid
@@ -71,144 +431,81 @@ class DashboardPage(QWidget):
         actions_frame = self._create_quick_actions()
         content_row.addWidget(actions_frame, 1)
         
-        # System status
-        status_frame = self._create_system_status()
-        content_row.addWidget(status_frame, 1)
+        # System status - built on first show, since it probes MySQL
+        self._status_slot = QVBoxLayout()
+        content_row.addLayout(self._status_slot, 1)
         
         layout.addLayout(content_row)
         
-        # Recent activity (full width)
-        activity_frame = self._create_recent_activity()
-        layout.addWidget(activity_frame)
+        # Recent activity (full width) - also built on first show
+        self._activity_slot = QVBoxLayout()
+        layout.addLayout(self._activity_slot)
+        self._panels_built = False
         
         layout.addStretch()
     
+    def showEvent(self, event):
+        """Build the deferred panels the first time the page is shown"""
+        super().showEvent(event)
+        if not self._panels_built:
+            self._panels_built = True
+            self._status_slot.addWidget(self._create_system_status())
+            self._activity_slot.addWidget(self._create_recent_activity())
+    
     def load_real_stats(self):
-        """Load real statistics from MySQL database and backup files"""
-        print("[DEBUG] Loading real dashboard statistics")
-        try:
-            # Create database manager
-            self.db_manager = DatabaseManager(
-                host="localhost",
-                port=3306,
-                user="root",
-                password=""
-            )
-            
-            # Connect to MySQL
-            if self.db_manager.connect():
-                # Get real database count
-                databases = self.db_manager.get_databases()
-                total_databases = len(databases)
-                
-                # Calculate total storage used
-                total_size_mb = 0
-                total_tables = 0
-                
-                for db_name in databases:
-                    db_info = self.db_manager.get_database_info(db_name)
-                    if db_info:
-                        # Extract size in MB
-                        size_str = db_info['size']
-                        try:
-                            size_value = float(size_str.replace('MB', '').strip())
-                            total_size_mb += size_value
-                            total_tables += db_info['tables']
-                        except:
-                            pass
-                
-                # Convert to GB if large
-                if total_size_mb >= 1024:
-                    storage_str = f"{total_size_mb / 1024:.2f} GB"
-                else:
-                    storage_str = f"{total_size_mb:.2f} MB"
-                
-                # Get real backup count and last backup time
-                backup_count, last_backup_time = self._get_backup_stats()
-                
-                # Update stat cards with real data
-                self.stat_cards['databases'].value_label.setText(str(total_databases))
-                self.stat_cards['backups'].value_label.setText(str(backup_count))
-                self.stat_cards['storage'].value_label.setText(storage_str)
-                self.stat_cards['time'].value_label.setText(last_backup_time)
-                
-                print(f"[SUCCESS] Dashboard loaded with real data:")
-                print(f"  - Total Databases: {total_databases}")
-                print(f"  - Active Backups: {backup_count}")
-                print(f"  - Storage Used: {storage_str}")
-                print(f"  - Last Backup: {last_backup_time}")
-                
-                # Disconnect after loading
-                self.db_manager.disconnect()
-                
-        except Exception as e:
-            print(f"[ERROR] Failed to load dashboard stats: {e}")
-            traceback.print_exc()
+        """Load real statistics from MySQL and backup files in the background"""
+        if self._stats_worker is not None:
+            return  # a load is already running; its result will be applied
+        
+        logger.debug("Loading real dashboard statistics")
+        self._stats_worker = StatsWorker(self.backup_directory, self._backup_cache)
+        self._stats_worker.signals.done.connect(self._apply_stats)
+        QThreadPool.globalInstance().start(self._stats_worker)
     
-    def _get_backup_stats(self):
-        """Get backup count and last backup time from backup directory"""
-        try:
-            if not os.path.exists(self.backup_directory):
-                return 0, "Never"
-            
-            backup_files = []
-            for file in os.listdir(self.backup_directory):
-                if file.endswith('.sql') or file.endswith('.sql.gz'):
-                    file_path = os.path.join(self.backup_directory, file)
-                    backup_files.append(file_path)
-            
-            backup_count = len(backup_files)
-            
-            if backup_count == 0:
-                return 0, "Never"
-            
-            # Get most recent backup file
-            backup_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-            most_recent = backup_files[0]
-            
-            # Calculate time ago
-            mod_time = os.path.getmtime(most_recent)
-            last_backup_dt = datetime.fromtimestamp(mod_time)
-            now = datetime.now()
-            
-            time_diff = now - last_backup_dt
-            
-            # Format time ago
-            if time_diff.days > 0:
-                if time_diff.days == 1:
-                    time_ago = "1 day ago"
-                else:
-                    time_ago = f"{time_diff.days} days ago"
-            elif time_diff.seconds >= 3600:
-                hours = time_diff.seconds // 3600
-                if hours == 1:
-                    time_ago = "1 hour ago"
-                else:
-                    time_ago = f"{hours} hours ago"
-            elif time_diff.seconds >= 60:
-                minutes = time_diff.seconds // 60
-                if minutes == 1:
-                    time_ago = "1 minute ago"
-                else:
-                    time_ago = f"{minutes} minutes ago"
-            else:
-                time_ago = "Just now"
-            
-            return backup_count, time_ago
+    def _apply_stats(self, stats, backup_cache):
+        """Update stat cards with values computed by StatsWorker"""
+        self._stats_worker = None
+        if backup_cache is not None:
+            # Keyed on the directory mtime, so a listing older than a
+            # backup made meanwhile is simply rescanned on next use
+            self._backup_cache = backup_cache
+        
+        if stats:
+            for key, value in stats.items():
+                self.stat_cards[key].value_label.setText(value)
             
-        except Exception as e:
-            print(f"[ERROR] Failed to get backup stats: {e}")
-            return 0, "Unknown"
+            logger.info(
+                "Dashboard loaded: %s databases, %s backups, %s used, last backup %s",
+                stats['databases'], stats['backups'], stats['storage'], stats['time']
+            )
+        else:
+            # Leave existing values alone, only clear the loading placeholders
+            for key, card in self.stat_cards.items():
+                if card.value_label.text() == "Loading…":
+                    card.value_label.setText(_STAT_DEFAULTS[key])
+        
+        if self._announce_refresh:
+            self._announce_refresh = False
+            QMessageBox.information(
+                self,
+                "✓ Refreshed",
+                "Dashboard data has been refreshed successfully!"
+            )
+    
+    def _list_backups(self):
+        """Return [(mtime, file name), ...] for every backup file
+        
+        The listing is memoized on the backup directory's mtime, so the
+        stats worker and the restore dialog share one scan.
+        """
+        self._backup_cache = _scan_backups(self.backup_directory, self._backup_cache)
+        return self._backup_cache[1]
     
     def refresh_dashboard(self):
         """Refresh dashboard with latest data"""
-        print("[DEBUG] Refreshing dashboard")
+        logger.debug("Refreshing dashboard")
+        self._announce_refresh = True
         self.load_real_stats()
-        QMessageBox.information(
-            self,
-            "✓ Refreshed",
-            "Dashboard data has been refreshed successfully!"
-        )
     
     # ========================================================================
     # UI CREATION METHODS
@@ -223,19 +520,9 @@ class DashboardPage(QWidget):
         
         title = QLabel("Dashboard Overview")
         title.setObjectName("pageTitle")
-        title.setStyleSheet("""
-            font-size: 36px;
-            font-weight: 700;
-            color: #e6d9ff;
-            letter-spacing: -1.2px;
-        """)
         
         subtitle = QLabel("Monitor your database backups and system health")
-        subtitle.setStyleSheet("""
-            color: #b8a5d8;
-            font-size: 16px;
-            font-weight: 500;
-        """)
+        subtitle.setObjectName("pageSubtitle")
         
         header_layout.addWidget(title)
         header_layout.addWidget(subtitle)
@@ -252,44 +539,43 @@ class DashboardPage(QWidget):
         
         actions_title = QLabel("Quick Actions")
         actions_title.setObjectName("sectionTitle")
-        actions_title.setStyleSheet("""
-            font-size: 20px;
-            font-weight: 700;
-            color: #e6d9ff;
-        """)
         actions_layout.addWidget(actions_title)
         actions_layout.addSpacing(8)
         
         # New Backup button
-        btn_new_backup = QPushButton("✦ New Backup")
-        btn_new_backup.setObjectName("primaryButton")
-        btn_new_backup.setMinimumHeight(52)
-        btn_new_backup.setCursor(Qt.PointingHandCursor)
-        btn_new_backup.clicked.connect(self._handle_new_backup)
+        self.btn_new_backup = QPushButton("New Backup")
+        self.btn_new_backup.setIcon(_action_icon('new_backup'))
+        self.btn_new_backup.setObjectName("primaryButton")
+        self.btn_new_backup.setMinimumHeight(52)
+        self.btn_new_backup.setCursor(Qt.PointingHandCursor)
+        self.btn_new_backup.clicked.connect(self._handle_new_backup)
         
         # Restore Database button
-        btn_restore = QPushButton("↻ Restore Database")
-        btn_restore.setObjectName("secondaryButton")
-        btn_restore.setMinimumHeight(52)
-        btn_restore.setCursor(Qt.PointingHandCursor)
-        btn_restore.clicked.connect(self._handle_restore_database)
+        self.btn_restore = QPushButton("Restore Database")
+        self.btn_restore.setIcon(_action_icon('restore'))
+        self.btn_restore.setObjectName("secondaryButton")
+        self.btn_restore.setMinimumHeight(52)
+        self.btn_restore.setCursor(Qt.PointingHandCursor)
+        self.btn_restore.clicked.connect(self._handle_restore_database)
         
         # Manage Databases button
-        btn_manage = QPushButton("⚙ Manage Databases")
+        btn_manage = QPushButton("Manage Databases")
+        btn_manage.setIcon(_action_icon('manage'))
         btn_manage.setObjectName("secondaryButton")
         btn_manage.setMinimumHeight(52)
         btn_manage.setCursor(Qt.PointingHandCursor)
         btn_manage.clicked.connect(self._handle_manage_databases)
         
         # Refresh Data button
-        btn_refresh = QPushButton("⟳ Refresh Data")
+        btn_refresh = QPushButton("Refresh Data")
+        btn_refresh.setIcon(_action_icon('refresh'))
         btn_refresh.setObjectName("secondaryButton")
         btn_refresh.setMinimumHeight(52)
         btn_refresh.setCursor(Qt.PointingHandCursor)
         btn_refresh.clicked.connect(self.refresh_dashboard)
         
-        actions_layout.addWidget(btn_new_backup)
-        actions_layout.addWidget(btn_restore)
+        actions_layout.addWidget(self.btn_new_backup)
+        actions_layout.addWidget(self.btn_restore)
         actions_layout.addWidget(btn_manage)
         actions_layout.addWidget(btn_refresh)
         actions_layout.addStretch()
@@ -306,11 +592,6 @@ class DashboardPage(QWidget):
         
         status_title = QLabel("System Status")
         status_title.setObjectName("sectionTitle")
-        status_title.setStyleSheet("""
-            font-size: 20px;
-            font-weight: 700;
-            color: #e6d9ff;
-        """)
         status_layout.addWidget(status_title)
         status_layout.addSpacing(8)
         
@@ -326,9 +607,8 @@ class DashboardPage(QWidget):
             ("Last Checked", "Just now", "info"),
         ]
         
-        for label, value, status_type in statuses:
-            item = self._create_status_item(label, value, status_type)
-            status_layout.addWidget(item)
+        self.status_model = ActivityModel(statuses, self)
+        status_layout.addWidget(_make_list_view(self.status_model, StatusDelegate(self)))
         
         status_layout.addStretch()
         
@@ -337,48 +617,10 @@ class DashboardPage(QWidget):
     def _check_mysql_status(self):
         """Check if MySQL is running"""
         try:
-            db_manager = DatabaseManager()
-            if db_manager.connect():
-                db_manager.disconnect()
-                return True
-            return False
+            return DBConnectionPool.is_alive()
         except:
             return False
     
-    def _create_status_item(self, label: str, value: str, status_type: str):
-        """Create individual status item"""
-        item_frame = QFrame()
-        item_layout = QHBoxLayout(item_frame)
-        item_layout.setContentsMargins(0, 12, 0, 12)
-        item_layout.setSpacing(16)
-        
-        status_colors = {
-            "success": "#6ee7b7",
-            "error": "#fca5a5",
-            "warning": "#fcd34d",
-            "info": "#b8a5d8"
-        }
-        
-        label_widget = QLabel(label)
-        label_widget.setStyleSheet("""
-            color: #e6d9ff;
-            font-size: 15px;
-            font-weight: 500;
-        """)
-        
-        value_widget = QLabel(value)
-        value_widget.setStyleSheet(f"""
-            color: {status_colors.get(status_type, '#b8a5d8')};
-            font-size: 15px;
-            font-weight: 700;
-        """)
-        
-        item_layout.addWidget(label_widget)
-        item_layout.addStretch()
-        item_layout.addWidget(value_widget)
-        
-        return item_frame
-    
     def _create_recent_activity(self):
         """Create recent activity section"""
         activity_frame = QFrame()
@@ -392,28 +634,10 @@ class DashboardPage(QWidget):
         
         activity_title = QLabel("Recent Activity")
         activity_title.setObjectName("sectionTitle")
-        activity_title.setStyleSheet("""
-            font-size: 20px;
-            font-weight: 700;
-            color: #e6d9ff;
-        """)
         
         view_all_btn = QPushButton("View All →")
         view_all_btn.setObjectName("linkButton")
         view_all_btn.setCursor(Qt.PointingHandCursor)
-        view_all_btn.setStyleSheet("""
-            #linkButton {
-                background: transparent;
-                border: none;
-                color: #8b7ab8;
-                font-weight: 600;
-                font-size: 14px;
-                padding: 6px 12px;
-            }
-            #linkButton:hover {
-                color: #b8a5d8;
-            }
-        """)
         
         header_layout.addWidget(activity_title)
         header_layout.addStretch()
@@ -430,71 +654,22 @@ class DashboardPage(QWidget):
             ("System health check completed", "1 minute ago", "info"),
         ]
         
-        for activity, time, status_type in activities:
-            item_frame = self._create_activity_item(activity, time, status_type)
-            activity_layout.addWidget(item_frame)
+        self.activity_model = ActivityModel(activities, self)
+        activity_layout.addWidget(_make_list_view(self.activity_model, ActivityDelegate(self)))
         
         return activity_frame
     
-    def _create_activity_item(self, activity: str, time: str, status_type: str):
-        """Create individual activity item"""
-        item_frame = QFrame()
-        item_frame.setObjectName("activityItem")
-        item_layout = QHBoxLayout(item_frame)
-        item_layout.setContentsMargins(0, 18, 0, 18)
-        item_layout.setSpacing(16)
-        
-        status_colors = {
-            "success": "#6ee7b7",
-            "error": "#fca5a5",
-            "warning": "#fcd34d",
-            "info": "#b8a5d8"
-        }
-        
-        status_dot = QLabel("●")
-        status_dot.setStyleSheet(f"""
-            color: {status_colors.get(status_type, '#b8a5d8')};
-            font-size: 14px;
-        """)
-        status_dot.setFixedWidth(20)
-        
-        activity_label = QLabel(activity)
-        activity_label.setObjectName("activityText")
-        activity_label.setStyleSheet("""
-            color: #e6d9ff;
-            font-size: 15px;
-            font-weight: 500;
-        """)
-        
-        time_label = QLabel(time)
-        time_label.setObjectName("activityTime")
-        time_label.setStyleSheet("""
-            color: #b8a5d8;
-            font-size: 14px;
-        """)
-        
-        item_layout.addWidget(status_dot)
-        item_layout.addWidget(activity_label)
-        item_layout.addStretch()
-        item_layout.addWidget(time_label)
-        
-        return item_frame
-    
     # ========================================================================
     # QUICK ACTION HANDLERS - FULLY FUNCTIONAL
     # ========================================================================
     
     def _handle_new_backup(self):
         """Handle New Backup button - Show dialog to select database"""
-        print("[DEBUG] New Backup action triggered")
+        logger.debug("New Backup action triggered")
         
         try:
             # Get list of databases
-            if not self.db_manager or not self.db_manager.connection or not self.db_manager.connection.is_connected():
-                self.db_manager = DatabaseManager()
-                self.db_manager.connect()
-            
-            databases = self.db_manager.get_databases()
+            databases = self._ensure_connected().get_databases()
             
             if not databases:
                 QMessageBox.warning(
@@ -519,8 +694,7 @@ class DashboardPage(QWidget):
                 self._perform_backup(db_name)
             
         except Exception as e:
-            print(f"[ERROR] Failed to show backup dialog: {e}")
-            traceback.print_exc()
+            logger.exception("Failed to show backup dialog: %s", e)
             QMessageBox.critical(
                 self,
                 "Error",
@@ -530,7 +704,7 @@ class DashboardPage(QWidget):
     
     def _perform_backup(self, db_name):
         """Perform the actual backup operation"""
-        print(f"[DEBUG] Starting backup for database: {db_name}")
+        logger.debug("Starting backup for database: %s", db_name)
         
         try:
             # Create backup directory
@@ -539,45 +713,87 @@ class DashboardPage(QWidget):
             
             # Generate backup filename
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_filename = f"{db_name}_backup_{timestamp}.sql"
+            backup_filename = f"{db_name}_backup_{timestamp}.sql.gz"
             backup_path = os.path.join(self.backup_directory, backup_filename)
             
             # Path to mysqldump
-            mysqldump_path = r"C:\xampp\mysql\bin\mysqldump.exe"
+            mysqldump_path = self._mysqldump
             
-            if not os.path.exists(mysqldump_path):
+            if not mysqldump_path:
                 QMessageBox.warning(
                     self,
                     "mysqldump Not Found",
-                    f"mysqldump not found at: {mysqldump_path}\n\n"
+                    f"mysqldump not found at: {MYSQLDUMP_PATH}\n\n"
                     "Please check your XAMPP installation."
                 )
                 return
             
-            # Show progress message
-            QApplication.setOverrideCursor(Qt.WaitCursor)
-            
-            # Execute mysqldump
             command = [
                 mysqldump_path,
+                *MYSQLDUMP_FLAGS,
                 "-u", "root",
                 "-h", "localhost",
                 db_name
             ]
             
-            with open(backup_path, 'w') as backup_file:
-                result = subprocess.run(
-                    command,
-                    stdout=backup_file,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-            
-            QApplication.restoreOverrideCursor()
-            
-            if result.returncode == 0:
-                # Get file size
-                size_bytes = os.path.getsize(backup_path)
+            # Dump and gzip on a worker thread; the result comes back in _on_backup_finished
+            worker = BackupWorker(command, backup_path, db_name)
+            worker.signals.finished.connect(self._on_backup_finished)
+            self._start_process_worker(worker)
+        
+        except Exception as e:
+            logger.exception("Backup exception: %s", e)
+            QMessageBox.critical(
+                self,
+                "Backup Error",
+                f"An error occurred during backup.\n\nError: {str(e)}"
+            )
+    
+    def _ensure_connected(self):
+        """Return the shared DatabaseManager, skipping the liveness check
+        if it was verified within the last 2 seconds"""
+        now = time.monotonic()
+        if self.db_manager and now - self._last_ping_ts < 2.0:
+            return self.db_manager
+        
+        self.db_manager = DBConnectionPool.acquire()
+        if not self.db_manager:
+            self._last_ping_ts = 0.0
+            raise ConnectionError("Could not connect to MySQL server")
+        
+        self._last_ping_ts = now
+        return self.db_manager
+    
+    def _resolve_tool(self, xampp_path, name):
+        """Locate a MySQL client tool: XAMPP install first, then PATH"""
+        if os.path.exists(xampp_path):
+            return xampp_path
+        return shutil.which(name)
+    
+    def _start_process_worker(self, worker):
+        """Run a backup/restore worker and lock the action buttons until it reports"""
+        self._process_worker = worker
+        self._set_actions_enabled(False)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _finish_process_worker(self):
+        """Forget the finished worker and unlock the action buttons"""
+        worker, self._process_worker = self._process_worker, None
+        self._set_actions_enabled(True)
+        return worker
+    
+    def _set_actions_enabled(self, enabled):
+        """Enable/disable the backup and restore buttons"""
+        self.btn_new_backup.setEnabled(enabled)
+        self.btn_restore.setEnabled(enabled)
+    
+    def _on_backup_finished(self, exit_code, size_bytes, error):
+        """Handle mysqldump completion reported by BackupWorker"""
+        worker = self._finish_process_worker()
+        db_name = worker.name
+        backup_filename = os.path.basename(worker.backup_path)
+        try:
+            if exit_code == 0:
                 if size_bytes >= 1024 * 1024:
                     size_str = f"{size_bytes / (1024 * 1024):.2f} MB"
                 elif size_bytes >= 1024:
@@ -585,7 +801,7 @@ class DashboardPage(QWidget):
                 else:
                     size_str = f"{size_bytes} B"
                 
-                print(f"[SUCCESS] Backup created: {backup_filename} ({size_str})")
+                logger.info("Backup created: %s (%s)", backup_filename, size_str)
                 
                 QMessageBox.information(
                     self,
@@ -596,20 +812,25 @@ class DashboardPage(QWidget):
                     f"Location: {self.backup_directory}/"
                 )
                 
-                # Refresh dashboard to show new backup
-                self.load_real_stats()
+                # Only the backup cards change - update them in place
+                self._backup_cache = None
+                backups_label = self.stat_cards['backups'].value_label
+                try:
+                    backups_label.setText(str(int(backups_label.text()) + 1))
+                    self.stat_cards['time'].value_label.setText("Just now")
+                except ValueError:
+                    # Stats not loaded yet, fall back to a full load
+                    self.load_real_stats()
             else:
-                print(f"[ERROR] Backup failed: {result.stderr}")
+                logger.error("Backup failed: %s", error)
                 QMessageBox.critical(
                     self,
                     "Backup Failed",
-                    f"Failed to backup database '{db_name}'.\n\nError: {result.stderr}"
+                    f"Failed to backup database '{db_name}'.\n\nError: {error}"
                 )
         
         except Exception as e:
-            QApplication.restoreOverrideCursor()
-            print(f"[ERROR] Backup exception: {e}")
-            traceback.print_exc()
+            logger.exception("Backup exception: %s", e)
             QMessageBox.critical(
                 self,
                 "Backup Error",
@@ -618,7 +839,7 @@ class DashboardPage(QWidget):
     
     def _handle_restore_database(self):
         """Handle Restore Database button - Show dialog to select backup file"""
-        print("[DEBUG] Restore Database action triggered")
+        logger.debug("Restore Database action triggered")
         
         try:
             # Get list of backup files
@@ -630,12 +851,9 @@ class DashboardPage(QWidget):
                 )
                 return
             
-            backup_files = []
-            for file in os.listdir(self.backup_directory):
-                if file.endswith('.sql') or file.endswith('.sql.gz'):
-                    backup_files.append(file)
+            backup_entries = self._list_backups()
             
-            if not backup_files:
+            if not backup_entries:
                 QMessageBox.warning(
                     self,
                     "No Backups",
@@ -644,10 +862,7 @@ class DashboardPage(QWidget):
                 return
             
             # Sort by modification time (newest first)
-            backup_files.sort(
-                key=lambda x: os.path.getmtime(os.path.join(self.backup_directory, x)),
-                reverse=True
-            )
+            backup_files = [name for _, name in sorted(backup_entries, reverse=True)]
             
             # Show backup selection dialog
             backup_file, ok = QInputDialog.getItem(
@@ -675,8 +890,7 @@ class DashboardPage(QWidget):
                     self._perform_restore(backup_file)
         
         except Exception as e:
-            print(f"[ERROR] Failed to show restore dialog: {e}")
-            traceback.print_exc()
+            logger.exception("Failed to show restore dialog: %s", e)
             QMessageBox.critical(
                 self,
                 "Error",
@@ -685,7 +899,7 @@ class DashboardPage(QWidget):
     
     def _perform_restore(self, backup_file):
         """Perform the actual restore operation"""
-        print(f"[DEBUG] Starting restore from backup: {backup_file}")
+        logger.debug("Starting restore from backup: %s", backup_file)
         
         try:
             backup_path = os.path.join(self.backup_directory, backup_file)
@@ -699,33 +913,32 @@ class DashboardPage(QWidget):
                 return
             
             # Extract database name from filename
-            restore_db_name = backup_file.split('_')[0]
+            restore_db_name = backup_file.partition('_')[0]
             
             # Path to mysql
-            mysql_path = r"C:\xampp\mysql\bin\mysql.exe"
+            mysql_path = self._mysql
             
-            if not os.path.exists(mysql_path):
+            if not mysql_path:
                 QMessageBox.warning(
                     self,
                     "mysql Not Found",
-                    f"mysql not found at: {mysql_path}\n\n"
+                    f"mysql not found at: {MYSQL_PATH}\n\n"
                     "Please check your XAMPP installation."
                 )
                 return
             
-            # Show progress message
-            QApplication.setOverrideCursor(Qt.WaitCursor)
-            
             # Create database if it doesn't exist
-            if not self.db_manager or not self.db_manager.connection or not self.db_manager.connection.is_connected():
-                self.db_manager = DatabaseManager()
-                self.db_manager.connect()
-            
-            cursor = self.db_manager.connection.cursor()
-            cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{restore_db_name}`")
+            create_sql = f"CREATE DATABASE IF NOT EXISTS `{restore_db_name}`"
+            try:
+                cursor = self._ensure_connected().connection.cursor()
+                cursor.execute(create_sql)
+            except OperationalError:
+                # Cached handle went stale inside the TTL - reconnect once
+                self._last_ping_ts = 0.0
+                cursor = self._ensure_connected().connection.cursor()
+                cursor.execute(create_sql)
             cursor.close()
             
-            # Execute mysql restore
             command = [
                 mysql_path,
                 "-u", "root",
@@ -733,18 +946,27 @@ class DashboardPage(QWidget):
                 restore_db_name
             ]
             
-            with open(backup_path, 'r') as backup_file_handle:
-                result = subprocess.run(
-                    command,
-                    stdin=backup_file_handle,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-            
-            QApplication.restoreOverrideCursor()
-            
-            if result.returncode == 0:
-                print(f"[SUCCESS] Database restored: {restore_db_name}")
+            # Decompress and import on a worker thread; see _on_restore_finished
+            worker = RestoreWorker(command, backup_path, restore_db_name)
+            worker.signals.finished.connect(self._on_restore_finished)
+            self._start_process_worker(worker)
+        
+        except Exception as e:
+            logger.exception("Restore exception: %s", e)
+            QMessageBox.critical(
+                self,
+                "Restore Error",
+                f"An error occurred during restore.\n\nError: {str(e)}"
+            )
+    
+    def _on_restore_finished(self, exit_code, _size, error):
+        """Handle mysql restore completion reported by RestoreWorker"""
+        worker = self._finish_process_worker()
+        restore_db_name = worker.name
+        backup_file = os.path.basename(worker.backup_path)
+        try:
+            if exit_code == 0:
+                logger.info("Database restored: %s", restore_db_name)
                 
                 QMessageBox.information(
                     self,
@@ -754,29 +976,36 @@ class DashboardPage(QWidget):
                     "You can now view it in the Databases page."
                 )
                 
-                # Refresh dashboard
-                self.load_real_stats()
+                # Only the database count can change - skip the full reload
+                self._update_database_count()
             else:
-                print(f"[ERROR] Restore failed: {result.stderr}")
+                logger.error("Restore failed: %s", error)
                 QMessageBox.critical(
                     self,
                     "Restore Failed",
-                    f"Failed to restore database.\n\nError: {result.stderr}"
+                    f"Failed to restore database.\n\nError: {error}"
                 )
         
         except Exception as e:
-            QApplication.restoreOverrideCursor()
-            print(f"[ERROR] Restore exception: {e}")
-            traceback.print_exc()
+            logger.exception("Restore exception: %s", e)
             QMessageBox.critical(
                 self,
                 "Restore Error",
                 f"An error occurred during restore.\n\nError: {str(e)}"
             )
     
+    def _update_database_count(self):
+        """Refresh the database count card with a single SHOW DATABASES"""
+        try:
+            databases = self._ensure_connected().get_databases()
+        except ConnectionError as e:
+            logger.exception("Could not refresh database count: %s", e)
+            return
+        self.stat_cards['databases'].value_label.setText(str(len(databases)))
+    
     def _handle_manage_databases(self):
         """Handle Manage Databases button - Navigate to Databases page"""
-        print("[DEBUG] Manage Databases action triggered")
+        logger.debug("Manage Databases action triggered")
         
         try:
             # Get the main window and switch to Databases page
@@ -785,7 +1014,7 @@ class DashboardPage(QWidget):
             # Find the stacked widget and switch to Databases page (index 1)
             if hasattr(main_window, 'stack'):
                 main_window.stack.setCurrentIndex(1)  # Databases page is at index 1
-                print("[SUCCESS] Navigated to Databases page")
+                logger.info("Navigated to Databases page")
             else:
                 QMessageBox.information(
                     self,
@@ -794,7 +1023,7 @@ class DashboardPage(QWidget):
                 )
         
         except Exception as e:
-            print(f"[ERROR] Failed to navigate: {e}")
+            logger.exception("Failed to navigate: %s", e)
             QMessageBox.information(
                 self,
                 "Navigate to Databases",
@@ -5,77 +5,263 @@ Version: 2.0 - Refactored for better debugging and maintainability
 from core.permission_checker import PermissionChecker
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame,
-    QPushButton, QTableWidget, QTableWidgetItem,
+    QPushButton, QTableWidget, QTableWidgetItem, QTableView,
     QHeaderView, QMessageBox, QDialog, QLineEdit,
-    QDialogButtonBox, QFormLayout, QComboBox, QCheckBox
+    QDialogButtonBox, QFormLayout, QComboBox
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QCursor
-from core.database import DatabaseManager
-import subprocess
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractTableModel, QModelIndex,
+    QObject, QRunnable, QThreadPool, QRegularExpression, QTimer,
+    QFileSystemWatcher
+)
+from PySide6.QtGui import QFontMetrics, QRegularExpressionValidator
+from core.backup_workers import BackupWorker, RestoreWorker, MYSQLDUMP_FLAGS
+from core.database import DBConnectionPool
+from ui.components.action_delegate import ActionColumnDelegate, pointing_cursor
+import logging
+import re
+import time
 import os
 from datetime import datetime
-import traceback
 
 
+logger = logging.getLogger(__name__)
+
+# Extensions recognised as backup files (str.endswith accepts a tuple)
+_BACKUP_EXTS = ('.sql', '.sql.gz')
+
+# Database/table names accepted when splicing an identifier into SQL text
+_IDENT_RE = re.compile(r"[A-Za-z0-9_$]{1,64}")
+
 
+def _ident(name):
+    """Backtick-quote a database or table name, rejecting anything unusual"""
+    if not _IDENT_RE.fullmatch(name or ""):
+        raise ValueError(f"Invalid identifier: {name!r}")
+    return f"`{name}`"
 
 
 # ============================================================================
 # HELPER CLASSES - Action Buttons and Dialogs
 # ============================================================================
 
+# Action button looks, set once on the page and matched through the
+# actionType property so buttons never carry a stylesheet of their own
+_ACTION_BTN_STYLE_NORMAL = """
+    QPushButton[actionType="normal"] {
+        background-color: #4A5578;
+        border: 1px solid #5A6588;
+        border-radius: 6px;
+        color: #E0E7FF;
+        font-size: 16px;
+        font-weight: 700;
+        padding: 0px;
+    }
+    QPushButton[actionType="normal"]:hover {
+        background-color: #0EA5E9;
+        border-color: #0EA5E9;
+        color: #FFFFFF;
+    }
+    QPushButton[actionType="normal"]:pressed {
+        background-color: #0284C7;
+    }
+"""
+
+_ACTION_BTN_STYLE_DESTRUCTIVE = """
+    QPushButton[actionType="destructive"] {
+        background-color: #4A5578;
+        border: 1px solid #5A6588;
+        border-radius: 6px;
+        color: #FF6B6B;
+        font-size: 18px;
+        font-weight: 700;
+        padding: 0px;
+    }
+    QPushButton[actionType="destructive"]:hover {
+        background-color: #EF4444;
+        border-color: #DC2626;
+        color: #FFFFFF;
+    }
+    QPushButton[actionType="destructive"]:pressed {
+        background-color: #DC2626;
+    }
+"""
+
+# Table dialog widgets, matched by object name. The dialogs are parented to the
+# page, so this is parsed once with the page stylesheet rather than per dialog.
+_TABLE_DIALOGS_STYLE = """
+    QLabel#viewTablesTitle {
+        font-weight: bold;
+        font-size: 16px;
+        color: #e6d9ff;
+    }
+    QLabel#tableDialogHint {
+        color: #b8a5d8;
+        font-size: 13px;
+    }
+    QLabel#createTableIntro {
+        color: #b8a5d8;
+        font-size: 13px;
+        margin-bottom: 8px;
+    }
+    QLabel#createTableLabel {
+        font-weight: bold;
+        color: #E0E7FF;
+        font-size: 14px;
+    }
+    QLabel#columnsHint {
+        color: #7C8BA8;
+        font-size: 12px;
+    }
+    QLineEdit#tableNameInput {
+        background-color: #2A2F4A;
+        border: 2px solid #3A4560;
+        border-radius: 6px;
+        padding: 0 12px;
+        color: #E0E7FF;
+        font-size: 14px;
+    }
+    QLineEdit#tableNameInput:focus {
+        border: 2px solid #0EA5E9;
+    }
+    QTableWidget#columnsTable {
+        background-color: #1E293B;
+        border: 1px solid #3A4560;
+        border-radius: 6px;
+    }
+    QTableWidget#columnsTable QHeaderView::section {
+        background-color: #2D3748;
+        color: #E0E7FF;
+        padding: 8px;
+        border: none;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QPushButton#addColumnBtn {
+        background-color: #4A5578;
+        color: #E0E7FF;
+        border: 1px solid #5A6588;
+        border-radius: 6px;
+        font-weight: 600;
+        font-size: 13px;
+    }
+    QPushButton#addColumnBtn:hover {
+        background-color: #5A6588;
+    }
+    QLineEdit#colName {
+        background-color: #2A2F4A;
+        border: 1px solid #3A4560;
+        border-radius: 4px;
+        padding: 4px 8px;
+        color: #E0E7FF;
+    }
+    QLineEdit#colName:focus {
+        border: 1px solid #0EA5E9;
+    }
+    QComboBox#colType {
+        background-color: #2A2F4A;
+        border: 1px solid #3A4560;
+        border-radius: 4px;
+        padding: 4px 8px;
+        color: #E0E7FF;
+    }
+    QPushButton#removeBtn {
+        background-color: #EF4444;
+        color: white;
+        border-radius: 4px;
+        font-weight: bold;
+        font-size: 16px;
+    }
+    QPushButton#removeBtn:hover {
+        background-color: #DC2626;
+    }
+"""
+
+DATABASES_PAGE_QSS = (
+    _ACTION_BTN_STYLE_NORMAL + _ACTION_BTN_STYLE_DESTRUCTIVE + _TABLE_DIALOGS_STYLE
+)
+
+# Shared by the PRIMARY and BACKUP section headings
+_SECTION_TITLE_STYLE = """
+    font-size: 20px;
+    font-weight: 700;
+    color: #e6d9ff;
+    letter-spacing: 0.5px;
+"""
+
+_CONFIRM_DLG_STYLE = """
+    QMessageBox {
+        background-color: #1E293B;
+        color: #E0E7FF;
+    }
+    QMessageBox QLabel {
+        color: #E0E7FF;
+        font-size: 14px;
+    }
+    QPushButton {
+        background-color: #4A5578;
+        border: 1px solid #5A6588;
+        border-radius: 6px;
+        color: #E0E7FF;
+        padding: 8px 20px;
+        font-weight: 600;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #0EA5E9;
+        border-color: #0EA5E9;
+    }
+    QPushButton[text="&Yes"] {
+        background-color: #DC2626;
+        border-color: #B91C1C;
+    }
+    QPushButton[text="&Yes"]:hover {
+        background-color: #EF4444;
+        border-color: #DC2626;
+    }
+"""
+
+
+# Flags for display-only table cells
+_READONLY_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+
+def _readonly_item(text):
+    """Non-editable QTableWidgetItem for a display cell"""
+    item = QTableWidgetItem(text)
+    item.setFlags(_READONLY_FLAGS)
+    return item
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def _human_size(size_bytes):
+    """Size text for backup files, e.g. 1.50 MB
+    
+    The unit comes straight from the bit length: every 10 bits is one
+    step up the 1024-based unit table.
+    """
+    i = min(max(0, (size_bytes.bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+    if not i:
+        return f"{size_bytes} B"
+    return f"{size_bytes / (1 << (10 * i)):.2f} {_SIZE_UNITS[i]}"
+
+
 class ActionButton(QPushButton):
-    """Custom action button with icon and enhanced hover effects"""
+    """Custom action button with icon and enhanced hover effects
+    
+    Styled by DATABASES_PAGE_QSS on the page, which reaches the page's
+    dialogs as well.
+    """
     
     def __init__(self, icon: str, tooltip: str, button_type: str = "normal", parent=None):
         super().__init__(icon, parent)
         self.setToolTip(tooltip)
-        self.setCursor(Qt.PointingHandCursor)
+        self.setCursor(pointing_cursor())
         self.setFixedSize(36, 36)
         self.button_type = button_type
-        
-        # Different styles for destructive actions
-        if button_type == "destructive":
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #4A5578;
-                    border: 1px solid #5A6588;
-                    border-radius: 6px;
-                    color: #FF6B6B;
-                    font-size: 18px;
-                    font-weight: 700;
-                    padding: 0px;
-                }
-                QPushButton:hover {
-                    background-color: #EF4444;
-                    border-color: #DC2626;
-                    color: #FFFFFF;
-                }
-                QPushButton:pressed {
-                    background-color: #DC2626;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #4A5578;
-                    border: 1px solid #5A6588;
-                    border-radius: 6px;
-                    color: #E0E7FF;
-                    font-size: 16px;
-                    font-weight: 700;
-                    padding: 0px;
-                }
-                QPushButton:hover {
-                    background-color: #0EA5E9;
-                    border-color: #0EA5E9;
-                    color: #FFFFFF;
-                }
-                QPushButton:pressed {
-                    background-color: #0284C7;
-                }
-            """)
+        self.setProperty("actionType", "destructive" if button_type == "destructive" else "normal")
 
 
 class ConfirmationDialog(QMessageBox):
@@ -92,44 +278,237 @@ class ConfirmationDialog(QMessageBox):
         self.setIcon(QMessageBox.Warning)
         self.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
         self.setDefaultButton(QMessageBox.No)
+        self.setStyleSheet(_CONFIRM_DLG_STYLE)
+
+
+# ============================================================================
+# DATABASES TABLE MODEL
+# ============================================================================
+
+# (key, glyph, tooltip, button_type) for each action painted in the databases table
+PRIMARY_ACTIONS = (
+    ("backup", "↓", "Backup Database", "normal"),
+    ("drop", "×", "Drop Database", "destructive"),
+    ("view", "☰", "View Tables & More", "normal"),
+)
+
+def _fix_table_sections(view, samples, actions_width=160, row_height=75):
+    """Size columns and rows once so refreshes never measure row contents
+    
+    Column 0 stretches, ``samples`` maps each following column to its widest
+    expected text and the last column holds the action buttons.
+    """
+    metrics = QFontMetrics(view.font())
+    header = view.horizontalHeader()
+    header.setSectionResizeMode(QHeaderView.Fixed)
+    header.setSectionResizeMode(0, QHeaderView.Stretch)
+    for column, sample in enumerate(samples, start=1):
+        header.resizeSection(column, max(metrics.horizontalAdvance(sample) + 40, 90))
+    header.resizeSection(len(samples) + 1, actions_width)
+    
+    rows = view.verticalHeader()
+    rows.setVisible(False)
+    rows.setSectionResizeMode(QHeaderView.Fixed)
+    rows.setDefaultSectionSize(row_height)
+
+
+class DatabasesModel(QAbstractTableModel):
+    """Read-only rows of (name, type, size, tables, status) for the databases table"""
+    
+    HEADERS = ("DATABASE NAME", "TYPE", "SIZE", "TABLES", "STATUS", "ACTIONS")
+    STATUS_COLUMN = 4
+    ACTIONS_COLUMN = 5
+    
+    def __init__(self, rows=(), parent=None):
+        super().__init__(parent)
+        self._rows = list(rows)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        column = index.column()
+        if column == self.ACTIONS_COLUMN:
+            return None
+        
+        if role == Qt.DisplayRole:
+            value = self._rows[index.row()][column]
+            return f"● {value}" if column == self.STATUS_COLUMN else value
+        if role == Qt.ForegroundRole and column == self.STATUS_COLUMN:
+            return Qt.GlobalColor.green
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignLeft | Qt.AlignVCenter)
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable if index.isValid() else Qt.NoItemFlags
+    
+    def set_rows(self, rows):
+        """Replace all rows"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+    
+    def database_name(self, row):
+        return self._rows[row][0]
+
+
+def _database_rows(db_manager):
+    """(name, type, size, tables, status) for every database db_manager can list"""
+    rows = []
+    for db_info in db_manager.get_all_database_info().values():
+        rows.append((
+            db_info["name"],
+            db_info["type"],
+            db_info["size"],
+            str(db_info["tables"]),
+            db_info["status"]
+        ))
+    return rows
+
+
+def _table_info(cursor, db_name):
+    """{table: (rows, size_bytes)} for every table in db_name from one
+    information_schema query
+    
+    InnoDB reports an estimated row count here, which avoids a COUNT(*)
+    scan per table. Views report None for both values.
+    """
+    cursor.execute(
+        "SELECT TABLE_NAME, TABLE_ROWS, DATA_LENGTH + INDEX_LENGTH "
+        "FROM information_schema.TABLES WHERE TABLE_SCHEMA = %s "
+        "ORDER BY TABLE_NAME",
+        (db_name,)
+    )
+    return {name: (rows, size) for name, rows, size in cursor.fetchall()}
+
+
+def _create_database(db_name):
+    """Return a DbWorker job that runs CREATE DATABASE for db_name"""
+    def create(db_manager):
+        cursor = db_manager.connection.cursor()
+        try:
+            cursor.execute(f"CREATE DATABASE {_ident(db_name)}")
+        finally:
+            cursor.close()
+        return db_name
+    return create
+
+
+def _create_table_job(table_name, create_sql, column_count):
+    """Return a DbWorker job that runs a prepared CREATE TABLE statement"""
+    def create(db_manager):
+        cursor = db_manager.connection.cursor()
+        try:
+            cursor.execute(create_sql)
+            db_manager.connection.commit()
+        finally:
+            cursor.close()
+        return table_name, column_count
+    return create
+
+
+class DbWorkerSignals(QObject):
+    """Signals emitted by DbWorker"""
+    finished = Signal(object)     # return value of the job
+    failed = Signal(object, str)  # worker key, error message
+
+
+class DbWorker(QRunnable):
+    """Runs fn(db_manager) off the UI thread
+    
+    Connections are not thread-safe, so each worker checks out its own
+    pooled connection and hands it back once fn returns.
+    """
+    
+    def __init__(self, fn, key=None):
+        super().__init__()
+        self.signals = DbWorkerSignals()
+        self._fn = fn
+        self._key = key
+    
+    def run(self):
+        try:
+            db_manager = DBConnectionPool.checkout()
+            if db_manager is None:
+                raise ConnectionError("Could not connect to MySQL")
+            
+            try:
+                result = self._fn(db_manager)
+            finally:
+                db_manager.release()
         
-        self.setStyleSheet("""
-            QMessageBox {
-                background-color: #1E293B;
-                color: #E0E7FF;
-            }
-            QMessageBox QLabel {
-                color: #E0E7FF;
-                font-size: 14px;
-            }
-            QPushButton {
-                background-color: #4A5578;
-                border: 1px solid #5A6588;
-                border-radius: 6px;
-                color: #E0E7FF;
-                padding: 8px 20px;
-                font-weight: 600;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #0EA5E9;
-                border-color: #0EA5E9;
-            }
-            QPushButton[text="&Yes"] {
-                background-color: #DC2626;
-                border-color: #B91C1C;
-            }
-            QPushButton[text="&Yes"]:hover {
-                background-color: #EF4444;
-                border-color: #DC2626;
-            }
-        """)
+        except Exception as e:
+            logger.exception("Database worker failed: %s", e)
+            self.signals.failed.emit(self._key, str(e))
+            return
+        
+        self.signals.finished.emit(result)
+
+
+class FileWorkerSignals(QObject):
+    """Signals emitted by FileWorker"""
+    finished = Signal(object)  # return value of fn
+    missing = Signal()         # the file does not exist
+    failed = Signal(str)       # error message
+
+
+class FileWorker(QRunnable):
+    """Runs fn(path) off the UI thread
+    
+    Keeps stat/remove calls on a slow or network-mounted backup directory
+    from stalling the event loop.
+    """
+    
+    def __init__(self, fn, path, name):
+        super().__init__()
+        self.signals = FileWorkerSignals()
+        self.fn = fn
+        self.path = path
+        self.name = name  # backup file name, for the result message
+    
+    def run(self):
+        try:
+            result = self.fn(self.path)
+        except FileNotFoundError:
+            self.signals.missing.emit()
+            return
+        except Exception as e:
+            logger.exception("File worker failed: %s", e)
+            self.signals.failed.emit(str(e))
+            return
+        
+        self.signals.finished.emit(result)
 
 
 # ============================================================================
 # DATABASE DIALOGS
 # ============================================================================
 
+# Unquoted MySQL identifier, at most 64 characters
+DB_NAME_PATTERN = QRegularExpression(r"^[A-Za-z_][A-Za-z0-9_]{0,63}$")
+_DB_NAME_VALIDATOR = None
+
+
+def _db_name_validator():
+    """Shared validator for database names, created on first use"""
+    global _DB_NAME_VALIDATOR
+    if _DB_NAME_VALIDATOR is None:
+        _DB_NAME_VALIDATOR = QRegularExpressionValidator(DB_NAME_PATTERN)
+    return _DB_NAME_VALIDATOR
+
+
 class NewDatabaseDialog(QDialog):
     """Dialog for creating a new database"""
     
@@ -138,7 +517,7 @@ class NewDatabaseDialog(QDialog):
         self.setWindowTitle("Create New Database")
         self.setMinimumWidth(400)
         self._init_ui()
-        print("[DEBUG] NewDatabaseDialog initialized")
+        logger.debug("NewDatabaseDialog initialized")
     
     def _init_ui(self):
         layout = QFormLayout(self)
@@ -146,6 +525,8 @@ class NewDatabaseDialog(QDialog):
         self.db_name_input = QLineEdit()
         self.db_name_input.setPlaceholderText("Enter database name (e.g., my_database)")
         self.db_name_input.setMinimumHeight(36)
+        # Invalid characters are rejected as they are typed
+        self.db_name_input.setValidator(_db_name_validator())
         
         layout.addRow("Database Name:", self.db_name_input)
         
@@ -155,11 +536,19 @@ class NewDatabaseDialog(QDialog):
         button_box.accepted.connect(self.accept)
         button_box.rejected.connect(self.reject)
         
+        # OK stays disabled until the name is acceptable
+        self.ok_button = button_box.button(QDialogButtonBox.Ok)
+        self.ok_button.setEnabled(False)
+        self.db_name_input.textChanged.connect(self._update_ok_button)
+        
         layout.addRow(button_box)
     
+    def _update_ok_button(self):
+        self.ok_button.setEnabled(self.db_name_input.hasAcceptableInput())
+    
     def get_database_name(self):
         name = self.db_name_input.text().strip()
-        print(f"[DEBUG] Database name entered: {name}")
+        logger.debug("Database name entered: %s", name)
         return name
 
 
@@ -170,15 +559,29 @@ class NewDatabaseDialog(QDialog):
 class CreateTableDialog(QDialog):
     """Dialog for creating a new table with columns"""
     
+    DATA_TYPES = (
+        "INT",
+        "VARCHAR(255)",
+        "TEXT",
+        "DATE",
+        "DATETIME",
+        "TIMESTAMP",
+        "DECIMAL(10,2)",
+        "BOOLEAN",
+        "BIGINT",
+        "FLOAT",
+        "DOUBLE",
+    )
+    
     def __init__(self, db_name, parent=None):
         super().__init__(parent)
         self.db_name = db_name
         self.setWindowTitle(f"Create New Table in '{db_name}'")
         self.setMinimumWidth(650)
         self.setMinimumHeight(450)
-        self.columns = []
+        self._columns = None  # filled by _validate_and_accept
         self._init_ui()
-        print(f"[DEBUG] CreateTableDialog initialized for database: {db_name}")
+        logger.debug("CreateTableDialog initialized for database: %s", db_name)
     
     def _init_ui(self):
         layout = QVBoxLayout(self)
@@ -186,7 +589,7 @@ class CreateTableDialog(QDialog):
         
         # Instructions
         instructions = QLabel("Create a new table by entering a name and defining at least one column:")
-        instructions.setStyleSheet("color: #b8a5d8; font-size: 13px; margin-bottom: 8px;")
+        instructions.setObjectName("createTableIntro")
         instructions.setWordWrap(True)
         layout.addWidget(instructions)
         
@@ -197,22 +600,10 @@ class CreateTableDialog(QDialog):
         self.table_name_input = QLineEdit()
         self.table_name_input.setPlaceholderText("e.g., users, products, orders")
         self.table_name_input.setMinimumHeight(40)
-        self.table_name_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #2A2F4A;
-                border: 2px solid #3A4560;
-                border-radius: 6px;
-                padding: 0 12px;
-                color: #E0E7FF;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #0EA5E9;
-            }
-        """)
+        self.table_name_input.setObjectName("tableNameInput")
         
         table_label = QLabel("Table Name:")
-        table_label.setStyleSheet("font-weight: bold; color: #E0E7FF; font-size: 14px;")
+        table_label.setObjectName("createTableLabel")
         form_layout.addRow(table_label, self.table_name_input)
         
         layout.addLayout(form_layout)
@@ -221,11 +612,11 @@ class CreateTableDialog(QDialog):
         # Columns section
         columns_header = QHBoxLayout()
         columns_label = QLabel("Columns:")
-        columns_label.setStyleSheet("font-weight: bold; font-size: 14px; color: #E0E7FF;")
+        columns_label.setObjectName("createTableLabel")
         columns_header.addWidget(columns_label)
         
         columns_hint = QLabel("(Define the structure of your table)")
-        columns_hint.setStyleSheet("color: #7C8BA8; font-size: 12px;")
+        columns_hint.setObjectName("columnsHint")
         columns_header.addWidget(columns_hint)
         columns_header.addStretch()
         
@@ -233,6 +624,7 @@ class CreateTableDialog(QDialog):
         
         # Columns table
         self.columns_table = QTableWidget()
+        self.columns_table.setObjectName("columnsTable")
         self.columns_table.setColumnCount(6)
         self.columns_table.setHorizontalHeaderLabels([
             "Column Name", "Data Type", "Primary Key", "Auto Increment", "NOT NULL", "Remove"
@@ -241,40 +633,17 @@ class CreateTableDialog(QDialog):
         self.columns_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.columns_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         self.columns_table.setMinimumHeight(200)
-        self.columns_table.setStyleSheet("""
-            QTableWidget {
-                background-color: #1E293B;
-                border: 1px solid #3A4560;
-                border-radius: 6px;
-            }
-            QHeaderView::section {
-                background-color: #2D3748;
-                color: #E0E7FF;
-                padding: 8px;
-                border: none;
-                font-weight: bold;
-                font-size: 12px;
-            }
-        """)
         layout.addWidget(self.columns_table)
         
         # Add column button
         btn_add_column = QPushButton("+ Add Column")
         btn_add_column.setMinimumHeight(38)
-        btn_add_column.setStyleSheet("""
-            QPushButton {
-                background-color: #4A5578;
-                color: #E0E7FF;
-                border: 1px solid #5A6588;
-                border-radius: 6px;
-                font-weight: 600;
-                font-size: 13px;
-            }
-            QPushButton:hover {
-                background-color: #5A6588;
-            }
-        """)
-        btn_add_column.clicked.connect(self._add_column_row)
+        btn_add_column.setObjectName("addColumnBtn")
+        # Throttle so a burst of clicks inserts one row per 100 ms window
+        self._add_column_timer = QTimer(self)
+        self._add_column_timer.setSingleShot(True)
+        self._add_column_timer.setInterval(100)
+        btn_add_column.clicked.connect(self._on_add_column_clicked)
         layout.addWidget(btn_add_column)
         
         # Add first column row by default
@@ -312,15 +681,9 @@ class CreateTableDialog(QDialog):
             self.table_name_input.setFocus()
             return
         
-        # Check if at least one column is defined
-        has_columns = False
-        for row in range(self.columns_table.rowCount()):
-            name_widget = self.columns_table.cellWidget(row, 0)
-            if name_widget and name_widget.text().strip():
-                has_columns = True
-                break
-        
-        if not has_columns:
+        # One pass over the rows; the result is kept for get_table_info()
+        self._columns = self._read_columns()
+        if not self._columns:
             QMessageBox.warning(
                 self,
                 "No Columns Defined",
@@ -332,98 +695,44 @@ class CreateTableDialog(QDialog):
         # If validation passes, accept the dialog
         self.accept()
     
+    def _on_add_column_clicked(self):
+        """Add a column row unless one was just added"""
+        if self._add_column_timer.isActive():
+            return
+        self._add_column_timer.start()
+        self._add_column_row()
+    
     def _add_column_row(self):
         """Add a new column definition row"""
         row = self.columns_table.rowCount()
         self.columns_table.insertRow(row)
-        print(f"[DEBUG] Adding column row {row}")
+        logger.debug("Adding column row %d", row)
         
         # Column name
         name_input = QLineEdit()
+        name_input.setObjectName("colName")
         name_input.setPlaceholderText(f"column_{row + 1}" if row > 0 else "id")
-        name_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #2A2F4A;
-                border: 1px solid #3A4560;
-                border-radius: 4px;
-                padding: 4px 8px;
-                color: #E0E7FF;
-            }
-            QLineEdit:focus {
-                border: 1px solid #0EA5E9;
-            }
-        """)
         self.columns_table.setCellWidget(row, 0, name_input)
         
         # Data type
         type_combo = QComboBox()
-        type_combo.addItems([
-            "INT", 
-            "VARCHAR(255)", 
-            "TEXT", 
-            "DATE", 
-            "DATETIME",
-            "TIMESTAMP",
-            "DECIMAL(10,2)", 
-            "BOOLEAN", 
-            "BIGINT", 
-            "FLOAT",
-            "DOUBLE"
-        ])
-        type_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #2A2F4A;
-                border: 1px solid #3A4560;
-                border-radius: 4px;
-                padding: 4px 8px;
-                color: #E0E7FF;
-            }
-        """)
+        type_combo.setObjectName("colType")
+        type_combo.addItems(self.DATA_TYPES)
         self.columns_table.setCellWidget(row, 1, type_combo)
         
-        # Primary Key checkbox
-        pk_check = QCheckBox()
-        pk_widget = QWidget()
-        pk_layout = QHBoxLayout(pk_widget)
-        pk_layout.addWidget(pk_check)
-        pk_layout.setAlignment(Qt.AlignCenter)
-        pk_layout.setContentsMargins(0, 0, 0, 0)
-        self.columns_table.setCellWidget(row, 2, pk_widget)
-        
-        # Auto Increment checkbox
-        ai_check = QCheckBox()
-        ai_widget = QWidget()
-        ai_layout = QHBoxLayout(ai_widget)
-        ai_layout.addWidget(ai_check)
-        ai_layout.setAlignment(Qt.AlignCenter)
-        ai_layout.setContentsMargins(0, 0, 0, 0)
-        self.columns_table.setCellWidget(row, 3, ai_widget)
-        
-        # NOT NULL checkbox
-        nn_check = QCheckBox()
-        nn_widget = QWidget()
-        nn_layout = QHBoxLayout(nn_widget)
-        nn_layout.addWidget(nn_check)
-        nn_layout.setAlignment(Qt.AlignCenter)
-        nn_layout.setContentsMargins(0, 0, 0, 0)
-        self.columns_table.setCellWidget(row, 4, nn_widget)
+        # Primary Key / Auto Increment / NOT NULL flags as checkable items
+        for col in (2, 3, 4):
+            flag_item = QTableWidgetItem()
+            flag_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
+            flag_item.setCheckState(Qt.Unchecked)
+            flag_item.setTextAlignment(Qt.AlignCenter)
+            self.columns_table.setItem(row, col, flag_item)
         
         # Remove button
         btn_remove = QPushButton("×")
+        btn_remove.setObjectName("removeBtn")
         btn_remove.setFixedSize(28, 28)
-        btn_remove.setStyleSheet("""
-            QPushButton {
-                background-color: #EF4444;
-                color: white;
-                border-radius: 4px;
-                font-weight: bold;
-                font-size: 16px;
-            }
-            QPushButton:hover {
-                background-color: #DC2626;
-            }
-        """)
-        btn_remove.clicked.connect(lambda: self.columns_table.removeRow(row))
+        btn_remove.clicked.connect(self._remove_sender_row)
         btn_widget = QWidget()
         btn_layout = QHBoxLayout(btn_widget)
         btn_layout.addWidget(btn_remove)
@@ -434,17 +743,32 @@ class CreateTableDialog(QDialog):
         # Set row height
         self.columns_table.setRowHeight(row, 45)
     
-    def get_table_info(self):
-        """Extract table name and column definitions"""
-        table_name = self.table_name_input.text().strip()
+    def _remove_sender_row(self):
+        """Remove the column row whose remove button was clicked
+        
+        The row is looked up from the button's position at click time, so it stays
+        correct after earlier rows have been removed.
+        """
+        btn = self.sender()
+        if btn is None:
+            return
+        viewport = self.columns_table.viewport()
+        index = self.columns_table.indexAt(btn.mapTo(viewport, btn.rect().center()))
+        if index.isValid():
+            logger.debug("Removing column row %d", index.row())
+            self.columns_table.removeRow(index.row())
+    
+    def _is_checked(self, row, col):
+        """Whether the checkable flag item at (row, col) is ticked"""
+        item = self.columns_table.item(row, col)
+        return item is not None and item.checkState() == Qt.Checked
+    
+    def _read_columns(self):
+        """Column definitions from the rows that have a name"""
         columns = []
-        
         for row in range(self.columns_table.rowCount()):
             name_widget = self.columns_table.cellWidget(row, 0)
             type_widget = self.columns_table.cellWidget(row, 1)
-            pk_widget = self.columns_table.cellWidget(row, 2).findChild(QCheckBox)
-            ai_widget = self.columns_table.cellWidget(row, 3).findChild(QCheckBox)
-            nn_widget = self.columns_table.cellWidget(row, 4).findChild(QCheckBox)
             
             if name_widget and type_widget:
                 col_name = name_widget.text().strip()
@@ -452,87 +776,190 @@ class CreateTableDialog(QDialog):
                     columns.append({
                         'name': col_name,
                         'type': type_widget.currentText(),
-                        'primary_key': pk_widget.isChecked() if pk_widget else False,
-                        'auto_increment': ai_widget.isChecked() if ai_widget else False,
-                        'not_null': nn_widget.isChecked() if nn_widget else False
+                        'primary_key': self._is_checked(row, 2),
+                        'auto_increment': self._is_checked(row, 3),
+                        'not_null': self._is_checked(row, 4)
                     })
+        return columns
+    
+    def get_table_info(self):
+        """Extract table name and column definitions"""
+        table_name = self.table_name_input.text().strip()
+        columns = self._columns if self._columns is not None else self._read_columns()
         
-        print(f"[DEBUG] Extracted table info: name='{table_name}', columns={len(columns)}")
+        logger.debug("Extracted table info: name='%s', columns=%s", table_name, len(columns))
         for col in columns:
-            print(f"[DEBUG] Column: {col}")
+            logger.debug("Column: %s", col)
         
         return table_name, columns
 
 
 
+class RowsModel(QAbstractTableModel):
+    """Read-only view over query result rows; cells are formatted only when painted"""
+    
+    def __init__(self, columns, rows, parent=None):
+        super().__init__(parent)
+        self._cols = list(columns)
+        self._rows = rows
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._cols)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        value = self._rows[index.row()][index.column()]
+        if role == Qt.DisplayRole:
+            return "NULL" if value is None else str(value)
+        if role == Qt.ForegroundRole and value is None:
+            return Qt.gray
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._cols[section]
+        return section + 1
+    
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable if index.isValid() else Qt.NoItemFlags
+
+
+class LazyRowsModel(RowsModel):
+    """RowsModel fed from an open unbuffered cursor, BATCH rows at a time as the view scrolls
+    
+    The model owns the cursor and the DatabaseManager it came from; close()
+    releases both and hands the connection back to the pool.
+    """
+    
+    BATCH = 50
+    
+    def __init__(self, columns, cursor, db_manager, parent=None):
+        super().__init__(columns, [], parent)
+        self._cursor = cursor
+        self._db_manager = db_manager
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._cursor is not None
+    
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._cursor is None:
+            return
+        
+        try:
+            batch = self._cursor.fetchmany(self.BATCH)
+        except Exception as e:
+            logger.error("Failed to fetch table rows: %s", e)
+            batch = []
+        if len(batch) < self.BATCH:
+            self.close()
+        if not batch:
+            return
+        
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(batch) - 1)
+        self._rows.extend(batch)
+        self.endInsertRows()
+    
+    def close(self):
+        """Release the cursor and its connection"""
+        cursor, self._cursor = self._cursor, None
+        if cursor is None:
+            return
+        
+        try:
+            try:
+                # An unbuffered cursor refuses to close with rows still unread
+                while cursor.fetchmany(self.BATCH):
+                    pass
+                cursor.close()
+            finally:
+                self._db_manager.release()
+        except Exception as e:
+            logger.error("Failed to close table data cursor: %s", e)
+
+
 class TableDataDialog(QDialog):
     """Dialog for viewing table data"""
     
-    def __init__(self, table_name, columns, rows, parent=None):
+    ROW_LIMIT = 100
+    
+    def __init__(self, table_name, model, parent=None):
         super().__init__(parent)
         self.setWindowTitle(f"Data in table '{table_name}'")
         self.setMinimumSize(800, 500)
-        self._init_ui(columns, rows)
-        print(f"[DEBUG] TableDataDialog showing {len(rows)} rows, {len(columns)} columns")
+        self._model = model
+        self._init_ui()
+        logger.debug("TableDataDialog showing %s columns", model.columnCount())
     
-    def _init_ui(self, columns, rows):
+    def _init_ui(self):
         layout = QVBoxLayout(self)
         
-        info_label = QLabel(f"Showing {len(rows)} rows (limited to 100)")
-        info_label.setStyleSheet("color: #b8a5d8; font-size: 13px;")
-        layout.addWidget(info_label)
-        
-        # Data table
-        table = QTableWidget()
-        table.setColumnCount(len(columns))
-        table.setHorizontalHeaderLabels(columns)
-        table.setRowCount(len(rows))
-        
-        for i, row in enumerate(rows):
-            for j, value in enumerate(row):
-                item = QTableWidgetItem(str(value) if value is not None else "NULL")
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                if value is None:
-                    item.setForeground(Qt.gray)
-                table.setItem(i, j, item)
+        self.info_label = QLabel()
+        self.info_label.setObjectName("tableDialogHint")
+        layout.addWidget(self.info_label)
         
+        # Data table; the model pulls further rows in as the view scrolls
+        table = QTableView()
+        self._model.setParent(table)
+        self._model.rowsInserted.connect(self._update_info_label)
+        table.setModel(self._model)
         table.horizontalHeader().setStretchLastSection(True)
         table.setAlternatingRowColors(True)
         layout.addWidget(table)
+        self._update_info_label()
         
         # Close button
         btn_close = QPushButton("Close")
         btn_close.setMinimumHeight(40)
         btn_close.clicked.connect(self.accept)
         layout.addWidget(btn_close)
+    
+    def _update_info_label(self):
+        self.info_label.setText(
+            f"Showing {self._model.rowCount()} rows (limited to {self.ROW_LIMIT})"
+        )
+    
+    def done(self, result):
+        """Give the connection back as soon as the dialog closes"""
+        self._model.close()
+        super().done(result)
 
 
 class ViewTablesDialog(QDialog):
     """Enhanced dialog for viewing and managing tables in a database"""
     
-    def __init__(self, db_name, tables, db_manager, parent=None):
+    def __init__(self, db_name, table_info, db_manager, parent=None):
         super().__init__(parent)
         self.db_name = db_name
         self.db_manager = db_manager
         self.backup_directory = "backups"
+        self._backup_workers = {}
+        self._create_worker = None
         self.setWindowTitle(f"Tables in '{db_name}'")
         self.setMinimumSize(800, 500)
-        self._init_ui(tables)
-        print(f"[DEBUG] ViewTablesDialog initialized for {db_name} with {len(tables)} tables")
+        self._init_ui(table_info)
+        logger.debug("ViewTablesDialog initialized for %s with %s tables", db_name, len(table_info))
     
-    def _init_ui(self, tables):
+    def _init_ui(self, table_info):
         layout = QVBoxLayout(self)
         
         # Header with title and New Table button
         header_layout = QHBoxLayout()
         
-        title = QLabel(f"Managing {len(tables)} tables in '{self.db_name}':")
-        title.setStyleSheet("font-weight: bold; font-size: 16px; color: #e6d9ff;")
+        title = QLabel(f"Managing {len(table_info)} tables in '{self.db_name}':")
+        title.setObjectName("viewTablesTitle")
         
         btn_new_table = QPushButton("+ New Table")
         btn_new_table.setObjectName("primaryButton")
         btn_new_table.setMinimumHeight(35)
-        btn_new_table.setCursor(Qt.PointingHandCursor)
+        btn_new_table.setCursor(pointing_cursor())
         btn_new_table.clicked.connect(self._create_table)
         
         header_layout.addWidget(title)
@@ -556,7 +983,7 @@ class ViewTablesDialog(QDialog):
         self.table_widget.setMinimumHeight(300)
         
         # Populate tables
-        self._populate_tables(tables)
+        self._populate_tables(table_info)
         
         layout.addWidget(self.table_widget)
         
@@ -567,82 +994,89 @@ class ViewTablesDialog(QDialog):
         btn_close.clicked.connect(self.accept)
         layout.addWidget(btn_close)
     
-    def _populate_tables(self, tables):
-        """Populate the table widget with tables and action buttons"""
-        self.table_widget.setRowCount(len(tables))
-        
-        for i, table_name in enumerate(tables):
-            # Table name
-            name_item = QTableWidgetItem(table_name)
-            name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-            self.table_widget.setItem(i, 0, name_item)
-            
-            # Get row count
-            try:
-                cursor = self.db_manager.connection.cursor()
-                cursor.execute(f"SELECT COUNT(*) FROM `{self.db_name}`.`{table_name}`")
-                row_count = cursor.fetchone()[0]
-                cursor.close()
+    def _populate_tables(self, table_info):
+        """Populate the table widget from a _table_info() dict"""
+        # Freeze the view while rows are rebuilt so it lays out and paints once
+        table = self.table_widget
+        sorting = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        table.blockSignals(True)
+        try:
+            table.setRowCount(len(table_info))
+            for i, (table_name, (row_count, _size)) in enumerate(table_info.items()):
+                # Table name
+                self.table_widget.setItem(i, 0, _readonly_item(table_name))
                 
-                count_item = QTableWidgetItem(str(row_count))
-                count_item.setFlags(count_item.flags() & ~Qt.ItemIsEditable)
-                self.table_widget.setItem(i, 1, count_item)
-                print(f"[DEBUG] Table {table_name} has {row_count} rows")
-            except Exception as e:
-                print(f"[ERROR] Failed to get row count for {table_name}: {e}")
-                count_item = QTableWidgetItem("N/A")
-                count_item.setFlags(count_item.flags() & ~Qt.ItemIsEditable)
-                self.table_widget.setItem(i, 1, count_item)
-            
-            # Action buttons
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(8, 6, 8, 6)
-            actions_layout.setSpacing(8)
-            
-            # Backup table button
-            btn_backup = ActionButton("↓", "Backup Table")
-            btn_backup.clicked.connect(lambda checked=False, tbl=table_name: self._backup_table(tbl))
-            
-            # Drop table button
-            btn_drop = ActionButton("×", "Drop Table", "destructive")
-            btn_drop.clicked.connect(lambda checked=False, tbl=table_name: self._drop_table(tbl))
-            
-            # View data button
-            btn_view = ActionButton("☰", "View Data")
-            btn_view.clicked.connect(lambda checked=False, tbl=table_name: self._view_table_data(tbl))
-            
-            actions_layout.addWidget(btn_backup)
-            actions_layout.addWidget(btn_drop)
-            actions_layout.addWidget(btn_view)
-            
-            self.table_widget.setCellWidget(i, 2, actions_widget)
-            self.table_widget.setRowHeight(i, 75)
+                # Row count
+                count_text = "N/A" if row_count is None else str(row_count)
+                self.table_widget.setItem(i, 1, _readonly_item(count_text))
+                
+                # Action buttons
+                actions_widget = QWidget()
+                actions_layout = QHBoxLayout(actions_widget)
+                actions_layout.setContentsMargins(8, 6, 8, 6)
+                actions_layout.setSpacing(8)
+                
+                # Backup table button
+                btn_backup = ActionButton("↓", "Backup Table")
+                btn_backup.setProperty("table_name", table_name)
+                btn_backup.clicked.connect(self._on_backup_table_clicked)
+                
+                # Drop table button
+                btn_drop = ActionButton("×", "Drop Table", "destructive")
+                btn_drop.setProperty("table_name", table_name)
+                btn_drop.clicked.connect(self._on_drop_table_clicked)
+                
+                # View data button
+                btn_view = ActionButton("☰", "View Data")
+                btn_view.setProperty("table_name", table_name)
+                btn_view.clicked.connect(self._on_view_table_clicked)
+                
+                actions_layout.addWidget(btn_backup)
+                actions_layout.addWidget(btn_drop)
+                actions_layout.addWidget(btn_view)
+                
+                self.table_widget.setCellWidget(i, 2, actions_widget)
+                self.table_widget.setRowHeight(i, 75)
+        finally:
+            table.blockSignals(False)
+            table.setSortingEnabled(sorting)
+            table.setUpdatesEnabled(True)
+    
+    # Row buttons carry their table in a "table_name" property, so one slot
+    # per action serves every row
+    def _on_backup_table_clicked(self):
+        self._backup_table(self.sender().property("table_name"))
+    
+    def _on_drop_table_clicked(self):
+        self._drop_table(self.sender().property("table_name"))
+    
+    def _on_view_table_clicked(self):
+        self._view_table_data(self.sender().property("table_name"))
     
     def _refresh_tables(self):
         """Refresh the table list"""
-        print(f"[DEBUG] Refreshing tables for {self.db_name}")
+        logger.debug("Refreshing tables for %s", self.db_name)
         try:
             cursor = self.db_manager.connection.cursor()
-            cursor.execute(f"USE `{self.db_name}`")
-            cursor.execute("SHOW TABLES")
-            tables = [table[0] for table in cursor.fetchall()]
-            cursor.close()
+            try:
+                table_info = _table_info(cursor, self.db_name)
+            finally:
+                cursor.close()
             
             self.table_widget.setRowCount(0)
-            self._populate_tables(tables)
-            print(f"[DEBUG] Refreshed: {len(tables)} tables")
+            self._populate_tables(table_info)
+            logger.debug("Refreshed: %s tables", len(table_info))
             
         except Exception as e:
-            print(f"[ERROR] Failed to refresh tables: {e}")
-            traceback.print_exc()
+            logger.exception("Failed to refresh tables: %s", e)
             QMessageBox.critical(self, "Error", f"Failed to refresh tables.\n\nError: {str(e)}")
     
     def _create_table(self):
         """Create a new table with improved validation"""
-        print(f"[DEBUG] Opening Create Table dialog for {self.db_name}")
-        dialog = CreateTableDialog(self.db_name, self)
-            # Check permission
+        logger.debug("Opening Create Table dialog for %s", self.db_name)
+        # Check permission
         if hasattr(self.parent(), 'permission_checker'):
             perm_checker = self.parent().permission_checker
             if perm_checker and not perm_checker.can_create_table(self.db_name):
@@ -653,18 +1087,18 @@ class ViewTablesDialog(QDialog):
                     f"Required permission: CREATE on '{self.db_name}'\n"
                     f"Please contact your administrator for access."
                 )
-                print(f"[PERMISSIONS] ✗ User denied CREATE TABLE in {self.db_name}")
+                logger.warning("Permission denied: CREATE TABLE in %s", self.db_name)
                 return
 
         dialog = CreateTableDialog(self.db_name, self)                   
         if dialog.exec() == QDialog.Accepted:
             table_name, columns = dialog.get_table_info()
             
-            print(f"[DEBUG] Table name: '{table_name}', Columns: {columns}")
+            logger.debug("Table name: '%s', Columns: %s", table_name, columns)
             
             # Validation
             if not table_name:
-                print("[ERROR] No table name provided")
+                logger.error("No table name provided")
                 QMessageBox.warning(
                     self, 
                     "Invalid Input", 
@@ -673,7 +1107,7 @@ class ViewTablesDialog(QDialog):
                 return
             
             if not columns or len(columns) == 0:
-                print("[ERROR] No columns defined")
+                logger.error("No columns defined")
                 QMessageBox.warning(
                     self, 
                     "Invalid Input", 
@@ -681,78 +1115,67 @@ class ViewTablesDialog(QDialog):
                 )
                 return
             
-            try:
-                # Ensure database connection is active
-                if not self.db_manager or not self.db_manager.connection.is_connected():
-                    print("[DEBUG] Reconnecting to database")
-                    from core.database import DatabaseManager
-                    self.db_manager = DatabaseManager()
-                    self.db_manager.connect()
-                
-                # Build CREATE TABLE statement
-                column_defs = []
-                for col in columns:
-                    col_def = f"`{col['name']}` {col['type']}"
-                    
-                    if col.get('primary_key'):
-                        col_def += " PRIMARY KEY"
-                    if col.get('auto_increment'):
-                        col_def += " AUTO_INCREMENT"
-                    if col.get('not_null'):
-                        col_def += " NOT NULL"
-                    
-                    column_defs.append(col_def)
-                    print(f"[DEBUG] Column definition: {col_def}")
-                
-                # Create SQL statement
-                create_sql = f"CREATE TABLE `{self.db_name}`.`{table_name}` ({', '.join(column_defs)})"
-                print(f"[DEBUG] Executing SQL: {create_sql}")
-                
-                # Execute CREATE TABLE
-                cursor = self.db_manager.connection.cursor()
-                cursor.execute(create_sql)
-                self.db_manager.connection.commit()  # Ensure changes are committed
-                cursor.close()
-                
-                print(f"[SUCCESS] Table '{table_name}' created successfully in database '{self.db_name}'")
-                
-                # Show success message
-                QMessageBox.information(
-                    self,
-                    "✓ Success",
-                    f"Table '{table_name}' has been created successfully in database '{self.db_name}'!\n\n"
-                    f"Columns: {len(columns)}\n"
-                    f"You can now view it in phpMyAdmin."
-                )
+            # Build CREATE TABLE statement
+            column_defs = []
+            for col in columns:
+                col_def = f"`{col['name']}` {col['type']}"
                 
-                # Refresh the tables list
-                self._refresh_tables()
+                if col.get('primary_key'):
+                    col_def += " PRIMARY KEY"
+                if col.get('auto_increment'):
+                    col_def += " AUTO_INCREMENT"
+                if col.get('not_null'):
+                    col_def += " NOT NULL"
                 
-            except Exception as e:
-                print(f"[ERROR] Failed to create table: {e}")
-                import traceback
-                traceback.print_exc()
-                QMessageBox.critical(
-                    self,
-                    "✗ Error Creating Table",
-                    f"Failed to create table '{table_name}' in database '{self.db_name}'.\n\n"
-                    f"Error: {str(e)}\n\n"
-                    "Common issues:\n"
-                    "• Table already exists\n"
-                    "• Invalid column name or data type\n"
-                    "• Connection to MySQL lost"
-                )
-
+                column_defs.append(col_def)
+                logger.debug("Column definition: %s", col_def)
+            
+            create_sql = f"CREATE TABLE `{self.db_name}`.`{table_name}` ({', '.join(column_defs)})"
+            logger.debug("Executing SQL: %s", create_sql)
+            
+            # Runs on a pooled connection so a busy server never blocks the dialog
+            worker = DbWorker(_create_table_job(table_name, create_sql, len(columns)), key=table_name)
+            worker.signals.finished.connect(self._on_table_created)
+            worker.signals.failed.connect(self._on_table_create_failed)
+            self._create_worker = worker
+            QThreadPool.globalInstance().start(worker)
+    
+    def _on_table_created(self, result):
+        """Report a table created by DbWorker and reload the list"""
+        self._create_worker = None
+        table_name, column_count = result
+        logger.info("Table '%s' created successfully in database '%s'", table_name, self.db_name)
+        
+        QMessageBox.information(
+            self,
+            "✓ Success",
+            f"Table '{table_name}' has been created successfully in database '{self.db_name}'!\n\n"
+            f"Columns: {column_count}\n"
+            f"You can now view it in phpMyAdmin."
+        )
+        
+        # Refresh the tables list
+        self._refresh_tables()
+    
+    def _on_table_create_failed(self, table_name, error):
+        """Report a CREATE TABLE that failed in DbWorker"""
+        self._create_worker = None
+        logger.error("Failed to create table: %s", error)
+        QMessageBox.critical(
+            self,
+            "✗ Error Creating Table",
+            f"Failed to create table '{table_name}' in database '{self.db_name}'.\n\n"
+            f"Error: {error}\n\n"
+            "Common issues:\n"
+            "• Table already exists\n"
+            "• Invalid column name or data type\n"
+            "• Connection to MySQL lost"
+        )
     
     def _backup_table(self, table_name):
         """Backup a specific table using mysqldump"""
-        print(f"[DEBUG] Starting backup for table {table_name}")
+        logger.debug("Starting backup for table %s", table_name)
         try:
-            # Create backup directory
-            if not os.path.exists(self.backup_directory):
-                os.makedirs(self.backup_directory)
-                print(f"[DEBUG] Created backup directory: {self.backup_directory}")
-            
             # Generate backup filename
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_filename = f"{self.db_name}_{table_name}_backup_{timestamp}.sql"
@@ -762,7 +1185,7 @@ class ViewTablesDialog(QDialog):
             mysqldump_path = r"C:\xampp\mysql\bin\mysqldump.exe"
             
             if not os.path.exists(mysqldump_path):
-                print(f"[ERROR] mysqldump not found at: {mysqldump_path}")
+                logger.error("mysqldump not found at: %s", mysqldump_path)
                 QMessageBox.warning(
                     self,
                     "mysqldump Not Found",
@@ -773,54 +1196,60 @@ class ViewTablesDialog(QDialog):
             # Execute mysqldump
             command = [
                 mysqldump_path,
+                *MYSQLDUMP_FLAGS,
                 "-u", "root",
                 "-h", "localhost",
                 self.db_name,
                 table_name
             ]
             
-            print(f"[DEBUG] Running command: {' '.join(command)}")
-            
-            with open(backup_path, 'w') as backup_file:
-                result = subprocess.run(
-                    command,
-                    stdout=backup_file,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
+            logger.debug("Running command: %s", command)
             
-            if result.returncode == 0:
-                size_bytes = os.path.getsize(backup_path)
-                size_str = f"{size_bytes / 1024:.2f} KB" if size_bytes >= 1024 else f"{size_bytes} B"
-                
-                print(f"[SUCCESS] Backup created: {backup_filename} ({size_str})")
-                QMessageBox.information(
-                    self,
-                    "Backup Successful",
-                    f"Table '{table_name}' has been backed up successfully!\n\n"
-                    f"Backup file: {backup_filename}\n"
-                    f"Size: {size_str}"
-                )
-            else:
-                print(f"[ERROR] mysqldump failed: {result.stderr}")
-                QMessageBox.critical(
-                    self,
-                    "Backup Failed",
-                    f"Failed to backup table.\n\nError: {result.stderr}"
-                )
+            # The dump runs on a worker thread; the result comes back as a signal
+            worker = BackupWorker(command, backup_path, table_name)
+            worker.signals.finished.connect(self._on_table_backup_finished)
+            self._backup_workers[worker.signals] = worker
+            QThreadPool.globalInstance().start(worker)
                 
         except Exception as e:
-            print(f"[ERROR] Backup exception: {e}")
-            traceback.print_exc()
+            logger.exception("Backup exception: %s", e)
             QMessageBox.critical(
                 self,
                 "Backup Error",
                 f"An error occurred during backup.\n\nError: {str(e)}"
             )
     
+    def _on_table_backup_finished(self, returncode, size_bytes, stderr):
+        """Report the result of a table backup started by _backup_table"""
+        worker = self._backup_workers.pop(self.sender(), None)
+        if worker is None:
+            return
+        
+        table_name = worker.name
+        backup_filename = os.path.basename(worker.backup_path)
+        
+        if returncode == 0:
+            size_str = _human_size(size_bytes)
+            
+            logger.info("Backup created: %s (%s)", backup_filename, size_str)
+            QMessageBox.information(
+                self,
+                "Backup Successful",
+                f"Table '{table_name}' has been backed up successfully!\n\n"
+                f"Backup file: {backup_filename}\n"
+                f"Size: {size_str}"
+            )
+        else:
+            logger.error("mysqldump failed: %s", stderr)
+            QMessageBox.critical(
+                self,
+                "Backup Failed",
+                f"Failed to backup table.\n\nError: {stderr}"
+            )
+    
     def _drop_table(self, table_name):
         """Drop a table with confirmation"""
-        print(f"[DEBUG] Drop table requested: {table_name}")
+        logger.debug("Drop table requested: %s", table_name)
 
         # ========== PERMISSION CHECK - ADD THIS AT THE START ==========
         # Check if user has permission to drop tables in this database
@@ -834,7 +1263,7 @@ class ViewTablesDialog(QDialog):
                     f"Required permission: DELETE on '{self.db_name}'\n"
                     f"Please contact your administrator for access."
                 )
-                print(f"[PERMISSIONS] ✗ User denied DROP TABLE {table_name} in {self.db_name}")
+                logger.warning("Permission denied: DROP TABLE %s in %s", table_name, self.db_name)
                 return  # STOP HERE - Do not proceed
         # ========== END PERMISSION CHECK ==========
 
@@ -852,9 +1281,9 @@ class ViewTablesDialog(QDialog):
         if reply == QMessageBox.Yes:
             try:
                 cursor = self.db_manager.connection.cursor()
-                cursor.execute(f"DROP TABLE `{self.db_name}`.`{table_name}`")
+                cursor.execute(f"DROP TABLE {_ident(self.db_name)}.{_ident(table_name)}")
                 cursor.close()
-                print(f"[SUCCESS] Table {table_name} dropped successfully")
+                logger.info("Table %s dropped successfully", table_name)
 
                 QMessageBox.information(
                     self,
@@ -863,8 +1292,7 @@ class ViewTablesDialog(QDialog):
                 )
                 self._refresh_tables()
             except Exception as e:
-                print(f"[ERROR] Failed to drop table: {e}")
-                traceback.print_exc()
+                logger.exception("Failed to drop table: %s", e)
                 QMessageBox.critical(
                     self,
                     "Error Dropping Table",
@@ -873,26 +1301,31 @@ class ViewTablesDialog(QDialog):
     
     def _view_table_data(self, table_name):
         """View table data (first 100 rows)"""
-        print(f"[DEBUG] Viewing data for table {table_name}")
+        logger.debug("Viewing data for table %s", table_name)
         try:
-            cursor = self.db_manager.connection.cursor()
-            cursor.execute(f"SELECT * FROM `{self.db_name}`.`{table_name}` LIMIT 100")
-            rows = cursor.fetchall()
-            
-            # Get column names
-            cursor.execute(f"DESCRIBE `{self.db_name}`.`{table_name}`")
-            columns = [col[0] for col in cursor.fetchall()]
-            cursor.close()
+            query = f"SELECT * FROM {_ident(self.db_name)}.{_ident(table_name)} LIMIT %s"
             
-            print(f"[DEBUG] Fetched {len(rows)} rows with {len(columns)} columns")
+            # Rows are streamed from an unbuffered cursor while the dialog is open,
+            # so it gets its own connection rather than tying up the shared one
+            data_manager = DBConnectionPool.checkout()
+            if data_manager is None:
+                raise ConnectionError("Could not connect to MySQL")
+            try:
+                cursor = data_manager.connection.cursor(prepared=True)
+                cursor.execute(query, (TableDataDialog.ROW_LIMIT,))
+                # Column names come with the result set, no DESCRIBE round trip
+                columns = [col[0] for col in cursor.description]
+            except Exception:
+                data_manager.release()
+                raise
             
             # Show data dialog
-            data_dialog = TableDataDialog(table_name, columns, rows, self)
+            model = LazyRowsModel(columns, cursor, data_manager)
+            data_dialog = TableDataDialog(table_name, model, self)
             data_dialog.exec()
             
         except Exception as e:
-            print(f"[ERROR] Failed to load table data: {e}")
-            traceback.print_exc()
+            logger.exception("Failed to load table data: %s", e)
             QMessageBox.critical(
                 self,
                 "Error Loading Data",
@@ -915,16 +1348,55 @@ class DatabasesPage(QWidget):
     delete_backup_requested = Signal(str)
     view_details_requested = Signal(str)
     
+    DB_CACHE_TTL = 5.0  # seconds cached database rows are trusted without a signature check
+    REFRESH_DEBOUNCE_MS = 250  # refresh requests this close together run once
+    
     def __init__(self, parent=None, user_data=None):
         super().__init__(parent)
         self.db_manager = None
         self.backup_directory = "backups"
+        # Created once here; backups, table backups and listings assume it exists
+        os.makedirs(self.backup_directory, exist_ok=True)
+        # Backup file paths are built by concatenation; see _backup_path
+        self._backup_dir_prefix = os.path.join(self.backup_directory, "")
+        # Backup file name -> os.stat_result from the last directory scan
+        self._backup_stat_cache = {}
         self.user_data = user_data or {}
         self.permission_checker = None
-        print("[DEBUG] DatabasesPage initialized")
+        # Database rows and permission answers, dropped whenever databases change
+        self._db_cache = None
+        self._db_cache_sig = None
+        self._db_cache_checked = 0.0
+        self._perm_cache = {}
+        self._list_worker = None
+        self._db_worker = None
+        self._process_workers = {}  # signals -> running backup/restore worker
+        self._file_workers = {}  # signals -> (running backup file worker, error title)
+        self._confirm_dlg = None
+        # Refresh clicks arm this timer; it fires _do_refresh once they settle
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        self._refresh_running = False
+        # Files added or removed outside the app reload the backup list once
+        # the burst of change notifications settles
+        self._backup_reload_timer = QTimer(self)
+        self._backup_reload_timer.setSingleShot(True)
+        self._backup_reload_timer.setInterval(200)
+        self._backup_reload_timer.timeout.connect(self.load_backup_files)
+        self._backup_watcher = QFileSystemWatcher([self.backup_directory], self)
+        self._backup_watcher.directoryChanged.connect(self._backup_reload_timer.start)
+        logger.debug("DatabasesPage initialized")
         self._init_ui()
+        # Connect and list after the first paint so the page shows up immediately
+        QTimer.singleShot(0, self._initial_load)
+    
+    def _initial_load(self):
+        """Deferred first load; permissions need the connection it opens"""
         self.load_real_databases()
-        self._init_permissions()  
+        self._init_permissions()
+        self.primary_loading.hide()
 
 
     def _init_permissions(self):
@@ -937,12 +1409,13 @@ class DatabasesPage(QWidget):
                 username,
                 role
             )
-            print(f"[PERMISSIONS] ✓ Initialized for {username} ({role})")
+            logger.debug("Permissions initialized for %s (%s)", username, role)
 
     
     def _init_ui(self):
         """Initialize UI components"""
-        print("[DEBUG] Initializing DatabasesPage UI")
+        logger.debug("Initializing DatabasesPage UI")
+        self.setStyleSheet(DATABASES_PAGE_QSS)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(48, 48, 48, 48)
         layout.setSpacing(40)
@@ -960,40 +1433,21 @@ class DatabasesPage(QWidget):
     
     def load_real_databases(self):
         """Load real databases from MySQL"""
-        print("[DEBUG] Loading real databases from MySQL")
+        logger.debug("Loading real databases from MySQL")
         try:
-            self.db_manager = DatabaseManager(
-                host="localhost",
-                port=3306,
-                user="root",
-                password=""
-            )
+            # Reuses the shared pooled connection instead of a fresh handshake
+            self._ensure_connection()
+            databases = self._get_databases()
+            logger.debug("Found %s databases", len(databases))
             
-            if self.db_manager.connect():
-                databases = self.db_manager.get_databases()
-                print(f"[DEBUG] Found {len(databases)} databases: {databases}")
-                
-                if databases:
-                    self.primary_table.setRowCount(0)
-                    
-                    for db_name in databases:
-                        db_info = self.db_manager.get_database_info(db_name)
-                        if db_info:
-                            self._add_primary_database_row(
-                                db_info["name"],
-                                db_info["type"],
-                                db_info["size"],
-                                str(db_info["tables"]),
-                                db_info["status"]
-                            )
-                    
-                    print(f"[SUCCESS] Loaded {len(databases)} databases")
-                
-                self.load_backup_files()
+            if databases:
+                self._set_primary_databases(databases)
+                logger.info("Loaded %s databases", len(databases))
+            
+            self.load_backup_files()
                 
         except Exception as e:
-            print(f"[ERROR] Failed to load databases: {e}")
-            traceback.print_exc()
+            logger.exception("Failed to load databases: %s", e)
             QMessageBox.warning(
                 self,
                 "Connection Error",
@@ -1003,89 +1457,85 @@ class DatabasesPage(QWidget):
     
     def load_backup_files(self):
         """Load backup files"""
-        print("[DEBUG] Loading backup files")
+        logger.debug("Loading backup files")
         try:
-            if not os.path.exists(self.backup_directory):
-                os.makedirs(self.backup_directory)
-            
-            self.backup_table.setRowCount(0)
-            
-            backup_files = []
-            if os.path.exists(self.backup_directory):
-                for file in os.listdir(self.backup_directory):
-                    if file.endswith('.sql') or file.endswith('.sql.gz'):
-                        file_path = os.path.join(self.backup_directory, file)
-                        backup_files.append(file_path)
+            # One scandir pass; each entry's stat is reused for sorting and display
+            with os.scandir(self.backup_directory) as it:
+                backup_files = [
+                    (entry.name, entry.stat())
+                    for entry in it
+                    if entry.is_file() and entry.name.endswith(_BACKUP_EXTS)
+                ]
+            self._backup_stat_cache = dict(backup_files)
             
             if backup_files:
-                backup_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
+                backup_files.sort(key=lambda f: f[1].st_mtime, reverse=True)
                 
-                for file_path in backup_files:
-                    file_name = os.path.basename(file_path)
-                    source_db = file_name.split('_')[0] if '_' in file_name else "Unknown"
-                    
-                    mod_time = os.path.getmtime(file_path)
-                    date_time = datetime.fromtimestamp(mod_time).strftime("%m/%d %H:%M")
-                    
-                    size_bytes = os.path.getsize(file_path)
-                    if size_bytes >= 1024 * 1024:
-                        size_str = f"{size_bytes / (1024 * 1024):.2f}MB"
-                    elif size_bytes >= 1024:
-                        size_str = f"{size_bytes / 1024:.2f}KB"
-                    else:
-                        size_str = f"{size_bytes}B"
-                    
-                    self._add_backup_database_row(file_name, source_db, date_time, size_str)
+                # Resize in place so rows that already exist keep their items and
+                # action widgets; only the surplus is created or destroyed
+                table = self.backup_table
+                sorting = table.isSortingEnabled()
+                table.setUpdatesEnabled(False)
+                table.setSortingEnabled(False)
+                table.blockSignals(True)
+                try:
+                    table.setRowCount(len(backup_files))
+                    for row, (file_name, stat) in enumerate(backup_files):
+                        source_db = file_name.split('_')[0] if '_' in file_name else "Unknown"
+                        
+                        date_time = datetime.fromtimestamp(stat.st_mtime).strftime("%m/%d %H:%M")
+                        
+                        self._add_backup_database_row(
+                            row, file_name, source_db, date_time, _human_size(stat.st_size)
+                        )
+                finally:
+                    table.blockSignals(False)
+                    table.setSortingEnabled(sorting)
+                    table.setUpdatesEnabled(True)
                 
-                print(f"[SUCCESS] Loaded {len(backup_files)} backup files")
+                logger.info("Loaded %s backup files", len(backup_files))
+            else:
+                self.backup_table.setRowCount(0)
                 
         except Exception as e:
-            print(f"[ERROR] Failed to load backup files: {e}")
-            traceback.print_exc()
+            logger.exception("Failed to load backup files: %s", e)
 
     def refresh_all(self):
+        """Schedule a refresh of databases and backups
+        
+        Requests made while one is pending or running are dropped, so rapid
+        clicks cost one round of queries.
+        """
+        if self._refresh_running or self._refresh_timer.isActive():
+            return
+        self._refresh_timer.start()
+    
+    def _do_refresh(self):
         """Refresh all databases and backups"""
-        print("[DEBUG] Refresh all triggered")
+        logger.debug("Refresh all triggered")
+        self._refresh_running = True
         
         # Show loading message
         from PySide6.QtWidgets import QApplication
         QApplication.setOverrideCursor(Qt.WaitCursor)
         
+        # Permissions may have changed elsewhere; database rows are re-read
+        # by _get_databases if the server's signature moved
+        self._perm_cache.clear()
+        
         try:
-            # Reconnect to database if needed
-            if not self.db_manager or not self.db_manager.connection.is_connected():
-                print("[DEBUG] Reconnecting to MySQL")
-                from core.database import DatabaseManager
-                self.db_manager = DatabaseManager(
-                    host="localhost",
-                    port=3306,
-                    user="root",
-                    password=""
-                )
-                self.db_manager.connect()
+            self._ensure_connection()
             
             # Refresh databases
-            print("[DEBUG] Refreshing primary databases")
-            databases = self.db_manager.get_databases()
+            logger.debug("Refreshing primary databases")
+            databases = self._get_databases()
             
             if databases:
-                self.primary_table.setRowCount(0)
-                
-                for db_name in databases:
-                    db_info = self.db_manager.get_database_info(db_name)
-                    if db_info:
-                        self._add_primary_database_row(
-                            db_info["name"],
-                            db_info["type"],
-                            db_info["size"],
-                            str(db_info["tables"]),
-                            db_info["status"]
-                        )
-                
-                print(f"[SUCCESS] Refreshed {len(databases)} databases")
+                self._set_primary_databases(databases)
+                logger.info("Refreshed %s databases", len(databases))
             
             # Refresh backups
-            print("[DEBUG] Refreshing backup files")
+            logger.debug("Refreshing backup files")
             self.load_backup_files()
             
             # Show success message
@@ -1098,12 +1548,10 @@ class DatabasesPage(QWidget):
                 "All data is now up to date."
             )
             
-            print("[SUCCESS] Refresh completed")
+            logger.info("Refresh completed")
             
         except Exception as e:
-            print(f"[ERROR] Refresh failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Refresh failed: %s", e)
             QMessageBox.warning(
                 self,
                 "Refresh Error",
@@ -1116,6 +1564,7 @@ class DatabasesPage(QWidget):
         finally:
             # Restore cursor
             QApplication.restoreOverrideCursor()
+            self._refresh_running = False
 
     
     def _create_page_header(self):
@@ -1152,7 +1601,7 @@ class DatabasesPage(QWidget):
         btn_refresh.setObjectName("secondaryButton")
         btn_refresh.setMinimumHeight(44)
         btn_refresh.setMinimumWidth(120)
-        btn_refresh.setCursor(Qt.PointingHandCursor)
+        btn_refresh.setCursor(pointing_cursor())
         btn_refresh.setToolTip("Refresh databases and backups from MySQL")
         btn_refresh.clicked.connect(self.refresh_all)
         btn_refresh.setStyleSheet("""
@@ -1193,43 +1642,36 @@ class DatabasesPage(QWidget):
         header_layout = QHBoxLayout()
         
         section_title = QLabel("PRIMARY DATABASES")
-        section_title.setStyleSheet("""
-            font-size: 20px;
-            font-weight: 700;
-            color: #e6d9ff;
-            letter-spacing: 0.5px;
-        """)
+        section_title.setStyleSheet(_SECTION_TITLE_STYLE)
         
         btn_new_db = QPushButton("+ New Database")
         btn_new_db.setObjectName("primaryButton")
         btn_new_db.setMinimumHeight(44)
-        btn_new_db.setCursor(Qt.PointingHandCursor)
+        btn_new_db.setCursor(pointing_cursor())
         btn_new_db.clicked.connect(self._handle_new_database)
         
+        # Shown until the deferred first load has filled the table
+        self.primary_loading = QLabel("Loading…")
+        self.primary_loading.setStyleSheet("color: #b8a5d8; font-size: 14px;")
+        
         header_layout.addWidget(section_title)
+        header_layout.addWidget(self.primary_loading)
         header_layout.addStretch()
         header_layout.addWidget(btn_new_db)
         
         primary_layout.addLayout(header_layout)
         
-        self.primary_table = QTableWidget()
-        self.primary_table.setColumnCount(6)
-        self.primary_table.setRowCount(0)
-        self.primary_table.setHorizontalHeaderLabels([
-            "DATABASE NAME", "TYPE", "SIZE", "TABLES", "STATUS", "ACTIONS"
-        ])
+        self.primary_model = DatabasesModel(parent=self)
+        self.primary_table = QTableView()
+        self.primary_table.setModel(self.primary_model)
         
-        self.primary_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.primary_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.primary_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        self.primary_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        self.primary_table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeToContents)
-        self.primary_table.horizontalHeader().setSectionResizeMode(5, QHeaderView.Fixed)
-        self.primary_table.horizontalHeader().resizeSection(5, 160)
-        
-        self.primary_table.verticalHeader().setVisible(False)
-        self.primary_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.primary_table.setSelectionMode(QTableWidget.SingleSelection)
+        _fix_table_sections(self.primary_table, ("MySQL", "0000.00MB", "0000", "● Online"))
+        self.primary_actions = ActionColumnDelegate(
+            self.primary_table, DatabasesModel.ACTIONS_COLUMN, PRIMARY_ACTIONS
+        )
+        self.primary_actions.action_clicked.connect(self._handle_primary_action)
+        self.primary_table.setSelectionBehavior(QTableView.SelectRows)
+        self.primary_table.setSelectionMode(QTableView.SingleSelection)
         self.primary_table.setShowGrid(False)
         self.primary_table.setMinimumHeight(280)
         
@@ -1237,58 +1679,105 @@ class DatabasesPage(QWidget):
         
         return primary_frame
     
-    def _add_primary_database_row(self, db_name: str, db_type: str, size: str, tables: str, status: str):
-        """Add database row with action buttons"""
-        row = self.primary_table.rowCount()
-        self.primary_table.insertRow(row)
-        
-        # Database name
-        name_item = QTableWidgetItem(db_name)
-        name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-        self.primary_table.setItem(row, 0, name_item)
-        
-        # Type
-        type_item = QTableWidgetItem(db_type)
-        type_item.setFlags(type_item.flags() & ~Qt.ItemIsEditable)
-        self.primary_table.setItem(row, 1, type_item)
-        
-        # Size
-        size_item = QTableWidgetItem(size)
-        size_item.setFlags(size_item.flags() & ~Qt.ItemIsEditable)
-        self.primary_table.setItem(row, 2, size_item)
-        
-        # Tables
-        tables_item = QTableWidgetItem(tables)
-        tables_item.setFlags(tables_item.flags() & ~Qt.ItemIsEditable)
-        self.primary_table.setItem(row, 3, tables_item)
-        
-        # Status
-        status_item = QTableWidgetItem(f"● {status}")
-        status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-        status_item.setForeground(Qt.GlobalColor.green)
-        self.primary_table.setItem(row, 4, status_item)
-        
-        # Actions
-        actions_widget = QWidget()
-        actions_layout = QHBoxLayout(actions_widget)
-        actions_layout.setContentsMargins(8, 6, 8, 6)
-        actions_layout.setSpacing(8)
-        
-        btn_backup = ActionButton("↓", "Backup Database")
-        btn_backup.clicked.connect(lambda checked=False, name=db_name: self._handle_backup(name))
-        
-        btn_drop = ActionButton("×", "Drop Database", "destructive")
-        btn_drop.clicked.connect(lambda checked=False, name=db_name: self._handle_drop(name))
-        
-        btn_view = ActionButton("☰", "View Tables & More")
-        btn_view.clicked.connect(lambda checked=False, name=db_name: self._handle_view_tables(name))
-        
-        actions_layout.addWidget(btn_backup)
-        actions_layout.addWidget(btn_drop)
-        actions_layout.addWidget(btn_view)
-        
-        self.primary_table.setCellWidget(row, 5, actions_widget)
-        self.primary_table.setRowHeight(row, 75)
+    def _ensure_connection(self):
+        """Return the page's live connection, re-acquiring the shared pooled one if it dropped"""
+        manager = self.db_manager
+        if not manager or not manager.connection or not manager.connection.is_connected():
+            logger.debug("Reconnecting to MySQL")
+            manager = DBConnectionPool.acquire()
+            if manager is None:
+                raise ConnectionError("Could not connect to MySQL server")
+            self.db_manager = manager
+        return manager.connection
+    
+    def _database_signature(self):
+        """One-row fingerprint of the server's schemas and tables, or None if unreadable"""
+        try:
+            cursor = self._ensure_connection().cursor()
+            try:
+                cursor.execute(
+                    "SELECT (SELECT COUNT(*) FROM information_schema.SCHEMATA), "
+                    "COUNT(*), MAX(UPDATE_TIME), SUM(TABLE_ROWS), "
+                    "SUM(DATA_LENGTH + INDEX_LENGTH) "
+                    "FROM information_schema.TABLES"
+                )
+                return cursor.fetchone()
+            finally:
+                cursor.close()
+        except Exception as e:
+            logger.error("Failed to read database signature: %s", e)
+            return None
+    
+    def _get_databases(self):
+        """Return database rows, re-listing them only when MySQL may have changed
+        
+        Cached rows are trusted for DB_CACHE_TTL seconds. After that a
+        signature query decides whether the full listing has to run again.
+        """
+        now = time.monotonic()
+        if self._db_cache is not None and now - self._db_cache_checked < self.DB_CACHE_TTL:
+            return self._db_cache
+        
+        signature = self._database_signature()
+        if self._db_cache is None or signature is None or signature != self._db_cache_sig:
+            self._db_cache = _database_rows(self.db_manager)
+            self._db_cache_sig = signature
+        self._db_cache_checked = now
+        return self._db_cache
+    
+    def _refresh_databases_async(self):
+        """Reload database rows on a worker thread; the table updates when done"""
+        worker = DbWorker(_database_rows)
+        worker.signals.finished.connect(self._on_databases_listed)
+        self._list_worker = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_databases_listed(self, rows):
+        """Apply rows delivered by the database list worker"""
+        self._list_worker = None
+        self._db_cache = rows
+        self._db_cache_sig = None  # unknown; the next check past the TTL re-lists
+        self._db_cache_checked = time.monotonic()
+        self._set_primary_databases(rows)
+        logger.info("Loaded %s databases", len(rows))
+    
+    def _invalidate_caches(self):
+        """Forget cached databases and permissions after a change"""
+        self._db_cache = None
+        self._db_cache_sig = None
+        self._perm_cache.clear()
+    
+    def _can_drop_database(self, db_name: str) -> bool:
+        """Memoized PermissionChecker.can_drop_database"""
+        key = (self.user_data.get('username'), db_name)
+        if key not in self._perm_cache:
+            self._perm_cache[key] = self.permission_checker.can_drop_database(db_name)
+        return self._perm_cache[key]
+    
+    def _set_primary_databases(self, rows):
+        """Fill the databases model in one reset instead of inserting row by row"""
+        self.primary_model.set_rows(rows)
+    
+    def _confirm(self, title, message, warning=None) -> bool:
+        """Ask a yes/no question with one ConfirmationDialog reused for every call"""
+        if self._confirm_dlg is None:
+            self._confirm_dlg = ConfirmationDialog(self, title, message, warning)
+        else:
+            self._confirm_dlg.setWindowTitle(title)
+            self._confirm_dlg.setText(message)
+            self._confirm_dlg.setInformativeText(warning or "")
+            self._confirm_dlg.setDefaultButton(QMessageBox.No)
+        return self._confirm_dlg.exec() == QMessageBox.Yes
+    
+    def _handle_primary_action(self, action: str, row: int):
+        """Dispatch a click on a painted database action button"""
+        db_name = self.primary_model.database_name(row)
+        if action == "backup":
+            self._handle_backup(db_name)
+        elif action == "drop":
+            self._handle_drop(db_name)
+        elif action == "view":
+            self._handle_view_tables(db_name)
     
     def _create_backup_databases(self):
         """Create backup databases section"""
@@ -1299,12 +1788,7 @@ class DatabasesPage(QWidget):
         backup_layout.setSpacing(24)
         
         section_title = QLabel("BACKUP DATABASES")
-        section_title.setStyleSheet("""
-            font-size: 20px;
-            font-weight: 700;
-            color: #e6d9ff;
-            letter-spacing: 0.5px;
-        """)
+        section_title.setStyleSheet(_SECTION_TITLE_STYLE)
         
         backup_layout.addWidget(section_title)
         
@@ -1315,14 +1799,7 @@ class DatabasesPage(QWidget):
             "BACKUP NAME", "SOURCE", "DATE/TIME", "SIZE", "ACTIONS"
         ])
         
-        self.backup_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
-        self.backup_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        self.backup_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        self.backup_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        self.backup_table.horizontalHeader().setSectionResizeMode(4, QHeaderView.Fixed)
-        self.backup_table.horizontalHeader().resizeSection(4, 160)
-        
-        self.backup_table.verticalHeader().setVisible(False)
+        _fix_table_sections(self.backup_table, ("M" * 14, "00/00 00:00", "0000.00 MB"))
         self.backup_table.setSelectionBehavior(QTableWidget.SelectRows)
         self.backup_table.setSelectionMode(QTableWidget.SingleSelection)
         self.backup_table.setShowGrid(False)
@@ -1332,48 +1809,58 @@ class DatabasesPage(QWidget):
         
         return backup_frame
     
-    def _add_backup_database_row(self, backup_name: str, source: str, datetime: str, size: str):
-        """Add backup row with action buttons"""
-        row = self.backup_table.rowCount()
-        self.backup_table.insertRow(row)
-        
-        name_item = QTableWidgetItem(backup_name)
-        name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-        self.backup_table.setItem(row, 0, name_item)
-        
-        source_item = QTableWidgetItem(source)
-        source_item.setFlags(source_item.flags() & ~Qt.ItemIsEditable)
-        self.backup_table.setItem(row, 1, source_item)
-        
-        datetime_item = QTableWidgetItem(datetime)
-        datetime_item.setFlags(datetime_item.flags() & ~Qt.ItemIsEditable)
-        self.backup_table.setItem(row, 2, datetime_item)
-        
-        size_item = QTableWidgetItem(size)
-        size_item.setFlags(size_item.flags() & ~Qt.ItemIsEditable)
-        self.backup_table.setItem(row, 3, size_item)
+    def _add_backup_database_row(self, row: int, backup_name: str, source: str, datetime: str, size: str):
+        """Fill an already allocated backup row, reusing the items and action
+        buttons a previous load left in it"""
+        table = self.backup_table
+        for col, text in enumerate((backup_name, source, datetime, size)):
+            item = table.item(row, col)
+            if item is None:
+                table.setItem(row, col, _readonly_item(text))
+            else:
+                item.setText(text)
         
-        # Actions
+        actions_widget = table.cellWidget(row, 4)
+        if actions_widget is None:
+            actions_widget = self._create_backup_actions()
+            table.setCellWidget(row, 4, actions_widget)
+        actions_widget.setProperty("backup_name", backup_name)
+    
+    def _create_backup_actions(self):
+        """Build the action buttons of one backup row"""
         actions_widget = QWidget()
         actions_layout = QHBoxLayout(actions_widget)
         actions_layout.setContentsMargins(8, 6, 8, 6)
         actions_layout.setSpacing(8)
         
         btn_restore = ActionButton("↶", "Restore Database")
-        btn_restore.clicked.connect(lambda checked=False, name=backup_name: self._handle_restore(name))
+        btn_restore.clicked.connect(self._on_restore_clicked)
         
         btn_delete = ActionButton("×", "Delete Backup", "destructive")
-        btn_delete.clicked.connect(lambda checked=False, name=backup_name: self._handle_delete_backup(name))
+        btn_delete.clicked.connect(self._on_delete_backup_clicked)
         
         btn_details = ActionButton("i", "View Details")
-        btn_details.clicked.connect(lambda checked=False, name=backup_name: self._handle_details(name))
+        btn_details.clicked.connect(self._on_details_clicked)
         
         actions_layout.addWidget(btn_restore)
         actions_layout.addWidget(btn_delete)
         actions_layout.addWidget(btn_details)
         
-        self.backup_table.setCellWidget(row, 4, actions_widget)
-        self.backup_table.setRowHeight(row, 75)
+        return actions_widget
+    
+    # Backup row action widgets carry their file in a "backup_name" property,
+    # so one slot per action serves every row
+    def _sender_backup_name(self):
+        return self.sender().parentWidget().property("backup_name")
+    
+    def _on_restore_clicked(self):
+        self._handle_restore(self._sender_backup_name())
+    
+    def _on_delete_backup_clicked(self):
+        self._handle_delete_backup(self._sender_backup_name())
+    
+    def _on_details_clicked(self):
+        self._handle_details(self._sender_backup_name())
     
     # ========================================================================
     # EVENT HANDLERS - Database Operations
@@ -1381,7 +1868,7 @@ class DatabasesPage(QWidget):
     
     def _handle_new_database(self):
         """Create new database"""
-        print("[DEBUG] New database dialog opened")
+        logger.debug("New database dialog opened")
 
         # Check permission
         if self.permission_checker and not self.permission_checker.can_create_database():
@@ -1392,7 +1879,7 @@ class DatabasesPage(QWidget):
                 f"Only administrators can create new databases.\n"
                 f"Please contact your administrator for access."
             )
-            print(f"[PERMISSIONS] ✗ {self.user_data.get('username')} denied CREATE DATABASE")
+            logger.warning("Permission denied: %s may not CREATE DATABASE", self.user_data.get('username'))
             return
 
         dialog = NewDatabaseDialog(self)
@@ -1401,46 +1888,50 @@ class DatabasesPage(QWidget):
             if not db_name:
                 QMessageBox.warning(self, "Invalid Input", "Please enter a database name.")
                 return
-            try:
-                if not self.db_manager or not self.db_manager.connection.is_connected():
-                    self.db_manager = DatabaseManager()
-                    self.db_manager.connect()
-                cursor = self.db_manager.connection.cursor()
-                cursor.execute(f"CREATE DATABASE `{db_name}`")
-                cursor.close()
-                print(f"[SUCCESS] Database {db_name} created")
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    f"Database '{db_name}' has been created successfully!"
-                )
-                self.load_real_databases()
-            except Exception as e:
-                print(f"[ERROR] Failed to create database: {e}")
-                traceback.print_exc()
-                QMessageBox.critical(
-                    self,
-                    "Error Creating Database",
-                    f"Failed to create database '{db_name}'.\n\nError: {str(e)}"
-                )
+            
+            # Runs on a pooled connection so MySQL latency never blocks the UI
+            worker = DbWorker(_create_database(db_name), key=db_name)
+            worker.signals.finished.connect(self._on_database_created)
+            worker.signals.failed.connect(self._on_database_create_failed)
+            self._db_worker = worker
+            QThreadPool.globalInstance().start(worker)
+    
+    def _on_database_created(self, db_name):
+        """Report a database created by DbWorker and reload the list"""
+        self._db_worker = None
+        self._invalidate_caches()
+        logger.info("Database %s created", db_name)
+        QMessageBox.information(
+            self,
+            "Success",
+            f"Database '{db_name}' has been created successfully!"
+        )
+        self._refresh_databases_async()
+    
+    def _on_database_create_failed(self, db_name, error):
+        """Report a CREATE DATABASE that failed in DbWorker"""
+        self._db_worker = None
+        logger.error("Failed to create database: %s", error)
+        QMessageBox.critical(
+            self,
+            "Error Creating Database",
+            f"Failed to create database '{db_name}'.\n\nError: {error}"
+        )
     
     def _handle_backup(self, db_name: str):
         """Backup database using mysqldump"""
-        print(f"[DEBUG] Backup requested for database: {db_name}")
+        logger.debug("Backup requested for database: %s", db_name)
         self.backup_requested.emit(db_name)
         
         try:
-            if not os.path.exists(self.backup_directory):
-                os.makedirs(self.backup_directory)
-            
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_filename = f"{db_name}_backup_{timestamp}.sql"
+            backup_filename = f"{db_name}_backup_{timestamp}.sql.gz"
             backup_path = os.path.join(self.backup_directory, backup_filename)
             
             mysqldump_path = r"C:\xampp\mysql\bin\mysqldump.exe"
             
             if not os.path.exists(mysqldump_path):
-                print(f"[ERROR] mysqldump not found at: {mysqldump_path}")
+                logger.error("mysqldump not found at: %s", mysqldump_path)
                 QMessageBox.warning(
                     self,
                     "mysqldump Not Found",
@@ -1450,54 +1941,59 @@ class DatabasesPage(QWidget):
             
             command = [
                 mysqldump_path,
+                *MYSQLDUMP_FLAGS,
                 "-u", "root",
                 "-h", "localhost",
                 db_name
             ]
             
-            print(f"[DEBUG] Running: {' '.join(command)}")
-            
-            with open(backup_path, 'w') as backup_file:
-                result = subprocess.run(
-                    command,
-                    stdout=backup_file,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
+            logger.debug("Running: %s", ' '.join(command))
             
-            if result.returncode == 0:
-                print(f"[SUCCESS] Backup created: {backup_filename}")
-                QMessageBox.information(
-                    self,
-                    "Backup Successful",
-                    f"Database '{db_name}' has been backed up successfully!\n\n"
-                    f"Backup file: {backup_filename}"
-                )
-                
-                self.load_backup_files()
-            else:
-                print(f"[ERROR] mysqldump failed: {result.stderr}")
-                QMessageBox.critical(
-                    self,
-                    "Backup Failed",
-                    f"Failed to backup database.\n\nError: {result.stderr}"
-                )
+            # mysqldump can run for minutes; the result comes back in _on_backup_finished
+            worker = BackupWorker(command, backup_path, db_name)
+            worker.signals.finished.connect(self._on_backup_finished)
+            self._process_workers[worker.signals] = worker
+            QThreadPool.globalInstance().start(worker)
                 
         except Exception as e:
-            print(f"[ERROR] Backup exception: {e}")
-            traceback.print_exc()
+            logger.exception("Backup exception: %s", e)
             QMessageBox.critical(
                 self,
                 "Backup Error",
                 f"An error occurred during backup.\n\nError: {str(e)}"
             )
     
+    def _on_backup_finished(self, returncode, size_bytes, stderr):
+        """Report the result of a database backup started by _handle_backup"""
+        worker = self._process_workers.pop(self.sender(), None)
+        if worker is None:
+            return
+        
+        backup_filename = os.path.basename(worker.backup_path)
+        if returncode == 0:
+            logger.info("Backup created: %s", backup_filename)
+            QMessageBox.information(
+                self,
+                "Backup Successful",
+                f"Database '{worker.name}' has been backed up successfully!\n\n"
+                f"Backup file: {backup_filename}"
+            )
+            
+            self.load_backup_files()
+        else:
+            logger.error("mysqldump failed: %s", stderr)
+            QMessageBox.critical(
+                self,
+                "Backup Failed",
+                f"Failed to backup database.\n\nError: {stderr}"
+            )
+    
     def _handle_drop(self, db_name: str):
         """Drop database with confirmation"""
-        print(f"[DEBUG] Drop requested for database: {db_name}")
+        logger.debug("Drop requested for database: %s", db_name)
 
         # Check permission
-        if self.permission_checker and not self.permission_checker.can_drop_database(db_name):
+        if self.permission_checker and not self._can_drop_database(db_name):
             QMessageBox.warning(
                 self,
                 "🔒 Permission Denied",
@@ -1505,35 +2001,31 @@ class DatabasesPage(QWidget):
                 f"Required permission: DELETE on '{db_name}'\n"
                 f"Please contact your administrator for access."
             )
-            print(f"[PERMISSIONS] ✗ {self.user_data.get('username')} denied DROP DATABASE {db_name}")
+            logger.warning("Permission denied: %s may not DROP DATABASE %s", self.user_data.get('username'), db_name)
             return
 
-        dialog = ConfirmationDialog(
-            self,
+        if self._confirm(
             "⚠️ Confirm Database Drop",
             f"Are you sure you want to drop database '{db_name}'?",
             "This will permanently delete the database and all its data.\nThis action cannot be undone."
-        )
-        reply = dialog.exec()
-        if reply == QMessageBox.Yes:
+        ):
             try:
-                if not self.db_manager or not self.db_manager.connection.is_connected():
-                    self.db_manager = DatabaseManager()
-                    self.db_manager.connect()
-                cursor = self.db_manager.connection.cursor()
-                cursor.execute(f"DROP DATABASE `{db_name}`")
-                cursor.close()
+                cursor = self._ensure_connection().cursor()
+                try:
+                    cursor.execute(f"DROP DATABASE {_ident(db_name)}")
+                finally:
+                    cursor.close()
+                self._invalidate_caches()
                 self.drop_requested.emit(db_name)
-                print(f"[SUCCESS] Database {db_name} dropped")
+                logger.info("Database %s dropped", db_name)
                 QMessageBox.information(
                     self,
                     "Database Dropped",
                     f"Database '{db_name}' has been successfully dropped."
                 )
-                self.load_real_databases()
+                self._refresh_databases_async()
             except Exception as e:
-                print(f"[ERROR] Failed to drop database: {e}")
-                traceback.print_exc()
+                logger.exception("Failed to drop database: %s", e)
                 QMessageBox.critical(
                     self,
                     "Error Dropping Database",
@@ -1543,29 +2035,24 @@ class DatabasesPage(QWidget):
     
     def _handle_view_tables(self, db_name: str):
         """View and manage tables in database"""
-        print(f"[DEBUG] View tables requested for database: {db_name}")
+        logger.debug("View tables requested for database: %s", db_name)
         self.view_tables_requested.emit(db_name)
         
         try:
-            if not self.db_manager or not self.db_manager.connection.is_connected():
-                self.db_manager = DatabaseManager()
-                self.db_manager.connect()
-            
-            cursor = self.db_manager.connection.cursor()
-            cursor.execute(f"USE `{db_name}`")
-            cursor.execute("SHOW TABLES")
-            tables = [table[0] for table in cursor.fetchall()]
-            cursor.close()
+            cursor = self._ensure_connection().cursor()
+            try:
+                table_info = _table_info(cursor, db_name)
+            finally:
+                cursor.close()
             
-            print(f"[DEBUG] Found {len(tables)} tables in {db_name}")
+            logger.debug("Found %s tables in %s", len(table_info), db_name)
             
             # Show enhanced tables dialog
-            dialog = ViewTablesDialog(db_name, tables, self.db_manager, self)
+            dialog = ViewTablesDialog(db_name, table_info, self.db_manager, self)
             dialog.exec()
                 
         except Exception as e:
-            print(f"[ERROR] Failed to load tables: {e}")
-            traceback.print_exc()
+            logger.exception("Failed to load tables: %s", e)
             QMessageBox.critical(
                 self,
                 "Error Loading Tables",
@@ -1574,17 +2061,12 @@ class DatabasesPage(QWidget):
     
     def _handle_restore(self, backup_name: str):
         """Restore database from backup file"""
-        print(f"[DEBUG] Restore requested for: {backup_name}")
-        dialog = ConfirmationDialog(
-            self,
+        logger.debug("Restore requested for: %s", backup_name)
+        if self._confirm(
             "⚠️ Confirm Restore",
             f"Are you sure you want to restore '{backup_name}'?",
             "This will create a new database or overwrite an existing one.\nChoose carefully to avoid data loss."
-        )
-        
-        reply = dialog.exec()
-        
-        if reply == QMessageBox.Yes:
+        ):
             try:
                 backup_path = os.path.join(self.backup_directory, backup_name)
                 
@@ -1597,7 +2079,7 @@ class DatabasesPage(QWidget):
                 mysql_path = r"C:\xampp\mysql\bin\mysql.exe"
                 
                 if not os.path.exists(mysql_path):
-                    print(f"[ERROR] mysql not found at: {mysql_path}")
+                    logger.error("mysql not found at: %s", mysql_path)
                     QMessageBox.warning(
                         self,
                         "mysql Not Found",
@@ -1605,13 +2087,11 @@ class DatabasesPage(QWidget):
                     )
                     return
                 
-                if not self.db_manager or not self.db_manager.connection.is_connected():
-                    self.db_manager = DatabaseManager()
-                    self.db_manager.connect()
-                
-                cursor = self.db_manager.connection.cursor()
-                cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{restore_db_name}`")
-                cursor.close()
+                cursor = self._ensure_connection().cursor()
+                try:
+                    cursor.execute(f"CREATE DATABASE IF NOT EXISTS {_ident(restore_db_name)}")
+                finally:
+                    cursor.close()
                 
                 command = [
                     mysql_path,
@@ -1620,116 +2100,147 @@ class DatabasesPage(QWidget):
                     restore_db_name
                 ]
                 
-                print(f"[DEBUG] Running: {' '.join(command)}")
-                
-                with open(backup_path, 'r') as backup_file:
-                    result = subprocess.run(
-                        command,
-                        stdin=backup_file,
-                        stderr=subprocess.PIPE,
-                        text=True
-                    )
+                logger.debug("Running: %s", ' '.join(command))
                 
-                if result.returncode == 0:
-                    self.restore_requested.emit(backup_name)
-                    print(f"[SUCCESS] Database restored from {backup_name}")
-                    QMessageBox.information(
-                        self,
-                        "Restore Successful",
-                        f"Database '{restore_db_name}' has been restored successfully from '{backup_name}'!"
-                    )
-                    
-                    self.load_real_databases()
-                else:
-                    print(f"[ERROR] mysql restore failed: {result.stderr}")
-                    QMessageBox.critical(
-                        self,
-                        "Restore Failed",
-                        f"Failed to restore database.\n\nError: {result.stderr}"
-                    )
+                # The import runs in the background; see _on_restore_finished
+                worker = RestoreWorker(command, backup_path, restore_db_name)
+                worker.signals.finished.connect(self._on_restore_finished)
+                self._process_workers[worker.signals] = worker
+                QThreadPool.globalInstance().start(worker)
                     
             except Exception as e:
-                print(f"[ERROR] Restore exception: {e}")
-                traceback.print_exc()
+                logger.exception("Restore exception: %s", e)
                 QMessageBox.critical(
                     self,
                     "Restore Error",
                     f"An error occurred during restore.\n\nError: {str(e)}"
                 )
     
+    def _on_restore_finished(self, returncode, _size, stderr):
+        """Report the result of a restore started by _handle_restore"""
+        worker = self._process_workers.pop(self.sender(), None)
+        if worker is None:
+            return
+        
+        backup_name = os.path.basename(worker.backup_path)
+        if returncode == 0:
+            self._invalidate_caches()
+            self.restore_requested.emit(backup_name)
+            logger.info("Database restored from %s", backup_name)
+            QMessageBox.information(
+                self,
+                "Restore Successful",
+                f"Database '{worker.name}' has been restored successfully from '{backup_name}'!"
+            )
+            
+            self._refresh_databases_async()
+        else:
+            logger.error("mysql restore failed: %s", stderr)
+            QMessageBox.critical(
+                self,
+                "Restore Failed",
+                f"Failed to restore database.\n\nError: {stderr}"
+            )
+    
     def _handle_delete_backup(self, backup_name: str):
         """Delete backup file"""
-        print(f"[DEBUG] Delete backup requested: {backup_name}")
-        dialog = ConfirmationDialog(
-            self,
+        logger.debug("Delete backup requested: %s", backup_name)
+        if self._confirm(
             "⚠️ Confirm Backup Deletion",
             f"Are you sure you want to delete backup '{backup_name}'?",
             "This will permanently delete the backup file.\nThis action cannot be undone."
-        )
+        ):
+            self._start_file_worker(os.remove, backup_name, self._on_backup_deleted, "Delete Error")
+    
+    def _on_backup_deleted(self, _result):
+        """Report a deletion started by _handle_delete_backup"""
+        worker, _ = self._file_workers.pop(self.sender(), (None, None))
+        if worker is None:
+            return
         
-        reply = dialog.exec()
+        self._backup_stat_cache.pop(worker.name, None)
+        self.delete_backup_requested.emit(worker.name)
+        logger.info("Backup deleted: %s", worker.name)
+        QMessageBox.information(
+            self,
+            "Backup Deleted",
+            f"Backup '{worker.name}' has been successfully deleted."
+        )
         
-        if reply == QMessageBox.Yes:
-            try:
-                file_path = os.path.join(self.backup_directory, backup_name)
-                
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    self.delete_backup_requested.emit(backup_name)
-                    
-                    print(f"[SUCCESS] Backup deleted: {backup_name}")
-                    QMessageBox.information(
-                        self,
-                        "Backup Deleted",
-                        f"Backup '{backup_name}' has been successfully deleted."
-                    )
-                    
-                    self.load_backup_files()
-                else:
-                    QMessageBox.warning(self, "File Not Found", f"Backup file '{backup_name}' not found.")
-                    
-            except Exception as e:
-                print(f"[ERROR] Failed to delete backup: {e}")
-                traceback.print_exc()
-                QMessageBox.critical(
-                    self,
-                    "Delete Error",
-                    f"Failed to delete backup.\n\nError: {str(e)}"
-                )
+        self.load_backup_files()
     
     def _handle_details(self, backup_name: str):
         """Show backup file details"""
-        print(f"[DEBUG] Details requested for: {backup_name}")
+        logger.debug("Details requested for: %s", backup_name)
         self.view_details_requested.emit(backup_name)
         
-        file_path = os.path.join(self.backup_directory, backup_name)
-        
-        if os.path.exists(file_path):
-            size_bytes = os.path.getsize(file_path)
-            mod_time = os.path.getmtime(file_path)
-            date_time = datetime.fromtimestamp(mod_time).strftime("%m/%d/%Y %H:%M:%S")
-            
-            if size_bytes >= 1024 * 1024:
-                size_str = f"{size_bytes / (1024 * 1024):.2f} MB"
-            elif size_bytes >= 1024:
-                size_str = f"{size_bytes / 1024:.2f} KB"
-            else:
-                size_str = f"{size_bytes} B"
-            
-            source_db = backup_name.split('_')[0] if '_' in backup_name else "Unknown"
-            
-            details_dialog = QMessageBox(self)
-            details_dialog.setWindowTitle("Backup Details")
-            details_dialog.setText(f"Details for backup: {backup_name}")
-            details_dialog.setInformativeText(
-                f"Source Database: {source_db}\n"
-                f"Backup Date: {date_time}\n"
-                f"File Size: {size_str}\n"
-                f"File Format: {'Compressed (.gz)' if backup_name.endswith('.gz') else 'SQL (.sql)'}\n"
-                f"Status: Complete\n"
-                f"File Path: {file_path}"
-            )
-            details_dialog.setIcon(QMessageBox.Information)
-            details_dialog.exec()
+        # The last directory scan usually has the stat already
+        stat = self._backup_stat_cache.get(backup_name)
+        if stat is not None:
+            file_path = self._backup_path(backup_name)
+            self._show_backup_details(backup_name, file_path, stat)
         else:
-            QMessageBox.warning(self, "File Not Found", f"Backup file '{backup_name}' not found.")
+            self._start_file_worker(os.stat, backup_name, self._on_backup_stat, "Details Error")
+    
+    def _on_backup_stat(self, stat):
+        """Show details for a backup the cache did not know about"""
+        worker, _ = self._file_workers.pop(self.sender(), (None, None))
+        if worker is None:
+            return
+        self._backup_stat_cache[worker.name] = stat
+        self._show_backup_details(worker.name, worker.path, stat)
+    
+    def _show_backup_details(self, backup_name, file_path, stat):
+        """Show the details dialog for one backup file"""
+        date_time = datetime.fromtimestamp(stat.st_mtime).strftime("%m/%d/%Y %H:%M:%S")
+        
+        size_str = _human_size(stat.st_size)
+        
+        source_db = backup_name.split('_')[0] if '_' in backup_name else "Unknown"
+        
+        details_dialog = QMessageBox(self)
+        details_dialog.setWindowTitle("Backup Details")
+        details_dialog.setText(f"Details for backup: {backup_name}")
+        details_dialog.setInformativeText(
+            f"Source Database: {source_db}\n"
+            f"Backup Date: {date_time}\n"
+            f"File Size: {size_str}\n"
+            f"File Format: {'Compressed (.gz)' if backup_name.endswith('.gz') else 'SQL (.sql)'}\n"
+            f"Status: Complete\n"
+            f"File Path: {file_path}"
+        )
+        details_dialog.setIcon(QMessageBox.Information)
+        details_dialog.exec()
+    
+    def _backup_path(self, backup_name):
+        """Path of a file in the backup directory; backup_name must be a bare file name"""
+        if os.sep in backup_name or (os.altsep and os.altsep in backup_name):
+            raise ValueError(f"Invalid backup file name: {backup_name!r}")
+        return self._backup_dir_prefix + backup_name
+    
+    def _start_file_worker(self, fn, backup_name, on_finished, error_title):
+        """Run fn on a backup file in the thread pool; on_finished gets its result"""
+        file_path = self._backup_path(backup_name)
+        worker = FileWorker(fn, file_path, backup_name)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.missing.connect(self._on_backup_file_missing)
+        worker.signals.failed.connect(self._on_file_worker_failed)
+        self._file_workers[worker.signals] = (worker, error_title)
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_backup_file_missing(self):
+        worker, _ = self._file_workers.pop(self.sender(), (None, None))
+        if worker is None:
+            return
+        QMessageBox.warning(self, "File Not Found", f"Backup file '{worker.name}' not found.")
+    
+    def _on_file_worker_failed(self, error):
+        worker, error_title = self._file_workers.pop(self.sender(), (None, None))
+        if worker is None:
+            return
+        logger.error("Backup file operation failed for %s: %s", worker.name, error)
+        QMessageBox.critical(
+            self,
+            error_title,
+            f"Failed to access backup '{worker.name}'.\n\nError: {error}"
+        )
@@ -7,8 +7,166 @@ from PySide6.QtWidgets import (
     QLineEdit, QPushButton, QCheckBox, QComboBox, 
     QGridLayout, QFileDialog, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QCursor
+from PySide6.QtCore import Qt, Signal, QObject, QRunnable, QThreadPool, QTimer
+from PySide6.QtGui import QCursor, QIntValidator
+
+from core.database import DatabaseManager
+
+
+# Matches Settings.COMPRESSION_TYPE options
+_COMPRESSION_CHOICES = ("gzip", "zip", "None")
+
+# Every settings widget is styled from this one sheet, applied to the page,
+# instead of a setStyleSheet call per widget
+_SETTINGS_QSS = """
+    QLabel#settingsTitle {
+        font-size: 36px;
+        font-weight: 700;
+        color: #e6d9ff;
+        letter-spacing: -1.2px;
+    }
+    QLabel#settingsSubtitle {
+        color: #b8a5d8;
+        font-size: 16px;
+        font-weight: 500;
+    }
+    QLabel#settingsSectionTitle {
+        font-size: 20px;
+        font-weight: 700;
+        color: #e6d9ff;
+        letter-spacing: 0.5px;
+    }
+    QLabel#formLabel {
+        font-size: 14px;
+        font-weight: 600;
+        color: #b8a5d8;
+    }
+    QLineEdit#settingsInput {
+        background-color: #2A2F4A;
+        border: 1px solid #3A4560;
+        border-radius: 8px;
+        padding: 0 16px;
+        color: #E0E7FF;
+        font-size: 14px;
+        min-height: 44px;
+    }
+    QLineEdit#settingsInput:focus {
+        border: 1px solid #0EA5E9;
+        background-color: #323852;
+    }
+    QPushButton#passwordToggle {
+        background-color: #4A5578;
+        border: 1px solid #5A6588;
+        border-radius: 8px;
+        color: #E0E7FF;
+        font-size: 16px;
+        font-weight: 700;
+    }
+    QPushButton#passwordToggle:hover {
+        background-color: #0EA5E9;
+        border-color: #0EA5E9;
+    }
+    QCheckBox#settingToggle {
+        color: #E0E7FF;
+        font-size: 14px;
+        font-weight: 500;
+        spacing: 8px;
+    }
+    QCheckBox#settingToggle::indicator {
+        width: 20px;
+        height: 20px;
+        border: 2px solid #5A6588;
+        border-radius: 4px;
+        background-color: #2A2F4A;
+    }
+    QCheckBox#themeToggle {
+        color: #E0E7FF;
+        font-size: 15px;
+        font-weight: 500;
+        spacing: 12px;
+        padding: 8px 0;
+    }
+    QCheckBox#themeToggle::indicator {
+        width: 24px;
+        height: 24px;
+        border: 2px solid #5A6588;
+        border-radius: 6px;
+        background-color: #2A2F4A;
+    }
+    QCheckBox#settingToggle::indicator:hover, QCheckBox#themeToggle::indicator:hover {
+        border-color: #0EA5E9;
+        background-color: #323852;
+    }
+    QCheckBox#settingToggle::indicator:checked, QCheckBox#themeToggle::indicator:checked {
+        background-color: #0EA5E9;
+        border-color: #0EA5E9;
+    }
+    QComboBox#settingsCombo {
+        background-color: #2A2F4A;
+        border: 1px solid #3A4560;
+        border-radius: 8px;
+        padding: 0 16px;
+        color: #E0E7FF;
+        font-size: 14px;
+        font-weight: 500;
+        min-height: 44px;
+    }
+    QComboBox#settingsCombo:hover {
+        border: 1px solid #0EA5E9;
+        background-color: #323852;
+    }
+    QComboBox#settingsCombo::drop-down {
+        border: none;
+        padding-right: 10px;
+    }
+    QComboBox#settingsCombo QAbstractItemView {
+        background-color: #2A2F4A;
+        border: 1px solid #3A4560;
+        selection-background-color: #0EA5E9;
+        selection-color: #FFFFFF;
+        color: #E0E7FF;
+        padding: 4px;
+    }
+    QLabel#settingsHint {
+        color: #7C8BA8;
+        font-size: 13px;
+        padding-left: 36px;
+    }
+"""
+
+
+class _ConnTestSignals(QObject):
+    """Signals emitted by _ConnTestTask"""
+    done = Signal(bool, str)  # success, message
+
+
+class _ConnTestTask(QRunnable):
+    """Runs DatabaseManager.test_connection() off the UI thread
+    
+    An unreachable host would otherwise freeze the page for the OS connect
+    timeout; CONNECT_TIMEOUT bounds the wait instead.
+    """
+    
+    CONNECT_TIMEOUT = 3  # seconds
+    
+    def __init__(self, connection_data):
+        super().__init__()
+        self.signals = _ConnTestSignals()
+        self.connection_data = connection_data
+    
+    def run(self):
+        db_manager = DatabaseManager(
+            host=self.connection_data["host"],
+            port=self.connection_data["port"],
+            user=self.connection_data["username"],
+            password=self.connection_data["password"],
+            connect_timeout=self.CONNECT_TIMEOUT
+        )
+        try:
+            success, message = db_manager.test_connection()
+        except Exception as e:
+            success, message = False, str(e)
+        self.signals.done.emit(success, message)
 
 
 class SettingsPage(QWidget):
@@ -20,10 +178,13 @@ class SettingsPage(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._conn_test = None  # running _ConnTestTask
+        self._port = 3306  # last valid port_input value
         self._init_ui()
     
     def _init_ui(self):
         """Initialize settings page UI"""
+        self.setStyleSheet(_SETTINGS_QSS)
         layout = QVBoxLayout(self)
         layout.setContentsMargins(48, 48, 48, 48)
         layout.setSpacing(40)
@@ -36,23 +197,31 @@ class SettingsPage(QWidget):
         conn_frame = self._create_connection_settings()
         layout.addWidget(conn_frame)
         
-        # Backup settings
-        backup_frame = self._create_backup_settings()
-        layout.addWidget(backup_frame)
-        
-        # Theme settings
-        theme_frame = self._create_theme_settings()
-        layout.addWidget(theme_frame)
-        
-        # Save button
-        btn_save = QPushButton("↓ Save All Settings")
-        btn_save.setObjectName("primaryButton")
-        btn_save.setMinimumHeight(50)
-        btn_save.setCursor(Qt.PointingHandCursor)
-        btn_save.clicked.connect(self._handle_save_settings)
-        layout.addWidget(btn_save)
+        # Save button; enabled once every section it reads exists
+        self.btn_save = QPushButton("↓ Save All Settings")
+        self.btn_save.setObjectName("primaryButton")
+        self.btn_save.setMinimumHeight(50)
+        self.btn_save.setCursor(Qt.PointingHandCursor)
+        self.btn_save.setEnabled(False)
+        self.btn_save.clicked.connect(self._handle_save_settings)
+        layout.addWidget(self.btn_save)
         
         layout.addStretch()
+        
+        # Backup and theme settings sit below the fold; build them after the
+        # first event-loop tick so the page can paint sooner
+        self._deferred_sections = [self._create_backup_settings, self._create_theme_settings]
+        QTimer.singleShot(0, self._build_deferred_sections)
+    
+    def _build_deferred_sections(self):
+        """Insert the deferred sections above the save button"""
+        layout = self.layout()
+        index = layout.indexOf(self.btn_save)
+        for create_section in self._deferred_sections:
+            layout.insertWidget(index, create_section())
+            index += 1
+        self._deferred_sections = []
+        self.btn_save.setEnabled(True)
     
     def _create_page_header(self):
         """Create clean page header matching other pages"""
@@ -62,19 +231,10 @@ class SettingsPage(QWidget):
         header_layout.setSpacing(12)
         
         title = QLabel("Settings")
-        title.setStyleSheet("""
-            font-size: 36px;
-            font-weight: 700;
-            color: #e6d9ff;
-            letter-spacing: -1.2px;
-        """)
+        title.setObjectName("settingsTitle")
         
         subtitle = QLabel("Configure application preferences and database connections")
-        subtitle.setStyleSheet("""
-            color: #b8a5d8;
-            font-size: 16px;
-            font-weight: 500;
-        """)
+        subtitle.setObjectName("settingsSubtitle")
         
         header_layout.addWidget(title)
         header_layout.addWidget(subtitle)
@@ -91,12 +251,7 @@ class SettingsPage(QWidget):
         
         # Section title
         conn_title = QLabel("CONNECTION SETTINGS")
-        conn_title.setStyleSheet("""
-            font-size: 20px;
-            font-weight: 700;
-            color: #e6d9ff;
-            letter-spacing: 0.5px;
-        """)
+        conn_title.setObjectName("settingsSectionTitle")
         conn_layout.addWidget(conn_title)
         
         # Form layout
@@ -104,66 +259,42 @@ class SettingsPage(QWidget):
         form_layout.setSpacing(16)
         form_layout.setColumnStretch(1, 1)
         
-        # Labels styling
-        label_style = """
-            font-size: 14px;
-            font-weight: 600;
-            color: #b8a5d8;
-        """
-        
-        # Input styling
-        input_style = """
-            QLineEdit {
-                background-color: #2A2F4A;
-                border: 1px solid #3A4560;
-                border-radius: 8px;
-                padding: 0 16px;
-                color: #E0E7FF;
-                font-size: 14px;
-                min-height: 44px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #0EA5E9;
-                background-color: #323852;
-            }
-            QLineEdit::placeholder {
-                color: #7C8BA8;
-            }
-        """
-        
         # Host
         host_label = QLabel("Host:")
-        host_label.setStyleSheet(label_style)
+        host_label.setObjectName("formLabel")
         form_layout.addWidget(host_label, 0, 0, Qt.AlignRight | Qt.AlignTop)
         
         self.host_input = QLineEdit("localhost")
-        self.host_input.setStyleSheet(input_style)
+        self.host_input.setObjectName("settingsInput")
         self.host_input.setPlaceholderText("Enter database host")
         form_layout.addWidget(self.host_input, 0, 1)
         
         # Port
         port_label = QLabel("Port:")
-        port_label.setStyleSheet(label_style)
+        port_label.setObjectName("formLabel")
         form_layout.addWidget(port_label, 1, 0, Qt.AlignRight | Qt.AlignTop)
         
         self.port_input = QLineEdit("3306")
-        self.port_input.setStyleSheet(input_style)
+        self.port_input.setObjectName("settingsInput")
         self.port_input.setPlaceholderText("MySQL default: 3306")
+        # Only 1-65535 can be typed, so the cached port is always a valid int
+        self.port_input.setValidator(QIntValidator(1, 65535, self.port_input))
+        self.port_input.editingFinished.connect(self._on_port_edited)
         form_layout.addWidget(self.port_input, 1, 1)
         
         # Username
         user_label = QLabel("Username:")
-        user_label.setStyleSheet(label_style)
+        user_label.setObjectName("formLabel")
         form_layout.addWidget(user_label, 2, 0, Qt.AlignRight | Qt.AlignTop)
         
         self.user_input = QLineEdit("root")
-        self.user_input.setStyleSheet(input_style)
+        self.user_input.setObjectName("settingsInput")
         self.user_input.setPlaceholderText("Database username")
         form_layout.addWidget(self.user_input, 2, 1)
         
         # Password
         pass_label = QLabel("Password:")
-        pass_label.setStyleSheet(label_style)
+        pass_label.setObjectName("formLabel")
         form_layout.addWidget(pass_label, 3, 0, Qt.AlignRight | Qt.AlignTop)
         
         password_layout = QHBoxLayout()
@@ -171,7 +302,7 @@ class SettingsPage(QWidget):
         
         self.pass_input = QLineEdit()
         self.pass_input.setEchoMode(QLineEdit.Password)
-        self.pass_input.setStyleSheet(input_style)
+        self.pass_input.setObjectName("settingsInput")
         self.pass_input.setPlaceholderText("Database password")
         
         self.toggle_password_btn = QPushButton("◉")
@@ -179,20 +310,7 @@ class SettingsPage(QWidget):
         self.toggle_password_btn.setToolTip("Show/Hide Password")
         self.toggle_password_btn.setCursor(Qt.PointingHandCursor)
         self.toggle_password_btn.clicked.connect(self._toggle_password_visibility)
-        self.toggle_password_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4A5578;
-                border: 1px solid #5A6588;
-                border-radius: 8px;
-                color: #E0E7FF;
-                font-size: 16px;
-                font-weight: 700;
-            }
-            QPushButton:hover {
-                background-color: #0EA5E9;
-                border-color: #0EA5E9;
-            }
-        """)
+        self.toggle_password_btn.setObjectName("passwordToggle")
         
         password_layout.addWidget(self.pass_input)
         password_layout.addWidget(self.toggle_password_btn)
@@ -202,12 +320,12 @@ class SettingsPage(QWidget):
         conn_layout.addLayout(form_layout)
         
         # Test connection button
-        btn_test_conn = QPushButton(" Test Connection")
-        btn_test_conn.setObjectName("secondaryButton")
-        btn_test_conn.setMinimumHeight(44)
-        btn_test_conn.setCursor(Qt.PointingHandCursor)
-        btn_test_conn.clicked.connect(self._handle_test_connection)
-        conn_layout.addWidget(btn_test_conn)
+        self.btn_test_conn = QPushButton(" Test Connection")
+        self.btn_test_conn.setObjectName("secondaryButton")
+        self.btn_test_conn.setMinimumHeight(44)
+        self.btn_test_conn.setCursor(Qt.PointingHandCursor)
+        self.btn_test_conn.clicked.connect(self._handle_test_connection)
+        conn_layout.addWidget(self.btn_test_conn)
         
         return conn_frame
     
@@ -221,12 +339,7 @@ class SettingsPage(QWidget):
         
         # Section title
         backup_title = QLabel("BACKUP SETTINGS")
-        backup_title.setStyleSheet("""
-            font-size: 20px;
-            font-weight: 700;
-            color: #e6d9ff;
-            letter-spacing: 0.5px;
-        """)
+        backup_title.setObjectName("settingsSectionTitle")
         backup_layout.addWidget(backup_title)
         
         # Form layout
@@ -234,36 +347,16 @@ class SettingsPage(QWidget):
         backup_form.setSpacing(16)
         backup_form.setColumnStretch(1, 1)
         
-        label_style = """
-            font-size: 14px;
-            font-weight: 600;
-            color: #b8a5d8;
-        """
-        
         # Default location
         location_label = QLabel("Default Location:")
-        location_label.setStyleSheet(label_style)
+        location_label.setObjectName("formLabel")
         backup_form.addWidget(location_label, 0, 0, Qt.AlignRight | Qt.AlignTop)
         
         location_layout = QHBoxLayout()
         location_layout.setSpacing(8)
         
         self.location_input = QLineEdit("/backups")
-        self.location_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #2A2F4A;
-                border: 1px solid #3A4560;
-                border-radius: 8px;
-                padding: 0 16px;
-                color: #E0E7FF;
-                font-size: 14px;
-                min-height: 44px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #0EA5E9;
-                background-color: #323852;
-            }
-        """)
+        self.location_input.setObjectName("settingsInput")
         
         btn_browse = QPushButton("◰ Browse")
         btn_browse.setObjectName("secondaryButton")
@@ -279,71 +372,23 @@ class SettingsPage(QWidget):
         
         # Auto-backup
         auto_label = QLabel("Auto-backup:")
-        auto_label.setStyleSheet(label_style)
+        auto_label.setObjectName("formLabel")
         backup_form.addWidget(auto_label, 1, 0, Qt.AlignRight | Qt.AlignTop)
         
         self.auto_checkbox = QCheckBox("Enable automatic backups daily")
-        self.auto_checkbox.setStyleSheet("""
-            QCheckBox {
-                color: #E0E7FF;
-                font-size: 14px;
-                font-weight: 500;
-                spacing: 8px;
-            }
-            QCheckBox::indicator {
-                width: 20px;
-                height: 20px;
-                border: 2px solid #5A6588;
-                border-radius: 4px;
-                background-color: #2A2F4A;
-            }
-            QCheckBox::indicator:hover {
-                border-color: #0EA5E9;
-                background-color: #323852;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #0EA5E9;
-                border-color: #0EA5E9;
-            }
-        """)
+        self.auto_checkbox.setObjectName("settingToggle")
         backup_form.addWidget(self.auto_checkbox, 1, 1)
         
         # Compression
         compression_label = QLabel("Compression:")
-        compression_label.setStyleSheet(label_style)
+        compression_label.setObjectName("formLabel")
         backup_form.addWidget(compression_label, 2, 0, Qt.AlignRight | Qt.AlignTop)
         
         self.compression_combo = QComboBox()
-        self.compression_combo.addItems(["gzip", "zip", "None"])
+        self.compression_combo.addItems(_COMPRESSION_CHOICES)
+        self.compression_combo.view().setUniformItemSizes(True)
         self.compression_combo.setCursor(Qt.PointingHandCursor)
-        self.compression_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #2A2F4A;
-                border: 1px solid #3A4560;
-                border-radius: 8px;
-                padding: 0 16px;
-                color: #E0E7FF;
-                font-size: 14px;
-                font-weight: 500;
-                min-height: 44px;
-            }
-            QComboBox:hover {
-                border: 1px solid #0EA5E9;
-                background-color: #323852;
-            }
-            QComboBox::drop-down {
-                border: none;
-                padding-right: 10px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #2A2F4A;
-                border: 1px solid #3A4560;
-                selection-background-color: #0EA5E9;
-                selection-color: #FFFFFF;
-                color: #E0E7FF;
-                padding: 4px;
-            }
-        """)
+        self.compression_combo.setObjectName("settingsCombo")
         backup_form.addWidget(self.compression_combo, 2, 1)
         
         backup_layout.addLayout(backup_form)
@@ -360,50 +405,18 @@ class SettingsPage(QWidget):
         
         # Section title
         theme_title = QLabel("APPEARANCE")
-        theme_title.setStyleSheet("""
-            font-size: 20px;
-            font-weight: 700;
-            color: #e6d9ff;
-            letter-spacing: 0.5px;
-        """)
+        theme_title.setObjectName("settingsSectionTitle")
         theme_layout.addWidget(theme_title)
         
         # Dark mode toggle
         self.theme_toggle = QCheckBox("◐ Dark Mode (Currently Enabled)")
         self.theme_toggle.setChecked(True)
-        self.theme_toggle.setStyleSheet("""
-            QCheckBox {
-                color: #E0E7FF;
-                font-size: 15px;
-                font-weight: 500;
-                spacing: 12px;
-                padding: 8px 0;
-            }
-            QCheckBox::indicator {
-                width: 24px;
-                height: 24px;
-                border: 2px solid #5A6588;
-                border-radius: 6px;
-                background-color: #2A2F4A;
-            }
-            QCheckBox::indicator:hover {
-                border-color: #0EA5E9;
-                background-color: #323852;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #0EA5E9;
-                border-color: #0EA5E9;
-            }
-        """)
+        self.theme_toggle.setObjectName("themeToggle")
         theme_layout.addWidget(self.theme_toggle)
         
         # Theme description
         theme_desc = QLabel("Switch between light and dark color schemes")
-        theme_desc.setStyleSheet("""
-            color: #7C8BA8;
-            font-size: 13px;
-            padding-left: 36px;
-        """)
+        theme_desc.setObjectName("settingsHint")
         theme_layout.addWidget(theme_desc)
         
         return theme_frame
@@ -421,25 +434,40 @@ class SettingsPage(QWidget):
     
     def _handle_test_connection(self):
         """Handle test connection button click"""
-        from core.database import DatabaseManager
+        if self._conn_test is not None:
+            return
+        
+        # editingFinished never fires for a cleared or half-typed port, so
+        # check the field itself rather than trusting the cached value
+        if not self.port_input.hasAcceptableInput():
+            QMessageBox.warning(
+                self,
+                "Invalid Port",
+                "Please enter a port number between 1 and 65535."
+            )
+            return
+        self._on_port_edited()
         
         # Get connection details from inputs
         connection_data = {
             "host": self.host_input.text(),
-            "port": int(self.port_input.text()),
+            "port": self._port,
             "username": self.user_input.text(),
             "password": self.pass_input.text()
         }
         
-        # Test connection
-        db_manager = DatabaseManager(
-            host=connection_data["host"],
-            port=connection_data["port"],
-            user=connection_data["username"],
-            password=connection_data["password"]
-        )
-        
-        success, message = db_manager.test_connection()
+        # Test on a worker thread; _on_connection_tested reports the result
+        self._conn_test = _ConnTestTask(connection_data)
+        self._conn_test.signals.done.connect(self._on_connection_tested)
+        self.btn_test_conn.setEnabled(False)
+        self.btn_test_conn.setText(" Testing…")
+        QThreadPool.globalInstance().start(self._conn_test)
+    
+    def _on_connection_tested(self, success, message):
+        """Show the result of a connection test started by _handle_test_connection"""
+        self._conn_test = None
+        self.btn_test_conn.setEnabled(True)
+        self.btn_test_conn.setText(" Test Connection")
         
         if success:
             QMessageBox.information(
@@ -458,6 +486,10 @@ class SettingsPage(QWidget):
             )
 
     
+    def _on_port_edited(self):
+        """Cache the port once the validator accepts the field"""
+        self._port = int(self.port_input.text())
+    
     def _handle_browse_location(self):
         """Handle browse button click"""
         directory = QFileDialog.getExistingDirectory(
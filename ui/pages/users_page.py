@@ -6,81 +6,148 @@ Users and access control page with user selection and permission editing
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame,
-    QPushButton, QTableWidget, QTableWidgetItem, QGridLayout,
+    QPushButton, QTableView, QGridLayout,
     QCheckBox, QHeaderView, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QCursor
+from PySide6.QtCore import Qt, Signal, QAbstractTableModel, QModelIndex
 from datetime import datetime
 
+from ui.components.action_delegate import ActionColumnDelegate
+
+
+# Every users page widget, including the confirmation dialog, is styled from
+# this one sheet applied to the page instead of a setStyleSheet call per widget
+USERS_PAGE_QSS = """
+    QLabel#usersTitle {
+        font-size: 36px;
+        font-weight: 700;
+        color: #e6d9ff;
+        letter-spacing: -1.2px;
+    }
+    QLabel#userBadge {
+        background-color: #065F46;
+        color: #D1FAE5;
+        font-size: 13px;
+        font-weight: 600;
+        padding: 6px 14px;
+        border-radius: 16px;
+        margin-left: 16px;
+    }
+    QLabel#usersSubtitle {
+        color: #b8a5d8;
+        font-size: 16px;
+        font-weight: 500;
+    }
+    QLabel#usersSectionTitle {
+        font-size: 20px;
+        font-weight: 700;
+        color: #e6d9ff;
+        letter-spacing: 0.5px;
+    }
+    QLabel#permHeader {
+        font-size: 14px;
+        font-weight: 700;
+        color: #b8a5d8;
+        letter-spacing: 0.5px;
+    }
+    QLabel#permDatabase {
+        font-size: 14px;
+        font-weight: 600;
+        color: #E0E7FF;
+    }
+    QCheckBox#permCheckbox::indicator {
+        width: 20px;
+        height: 20px;
+        border: 2px solid #5A6588;
+        border-radius: 4px;
+        background-color: #2A2F4A;
+    }
+    QCheckBox#permCheckbox::indicator:hover {
+        border-color: #0EA5E9;
+        background-color: #323852;
+    }
+    QCheckBox#permCheckbox::indicator:checked {
+        background-color: #0EA5E9;
+        border-color: #0EA5E9;
+    }
+    ConfirmationDialog {
+        background-color: #1E293B;
+        color: #E0E7FF;
+    }
+    ConfirmationDialog QLabel {
+        color: #E0E7FF;
+        font-size: 14px;
+    }
+    ConfirmationDialog QPushButton {
+        background-color: #4A5578;
+        border: 1px solid #5A6588;
+        border-radius: 6px;
+        color: #E0E7FF;
+        padding: 8px 20px;
+        font-weight: 600;
+        min-width: 80px;
+    }
+    ConfirmationDialog QPushButton:hover {
+        background-color: #0EA5E9;
+        border-color: #0EA5E9;
+    }
+    ConfirmationDialog QPushButton[text="&Yes"] {
+        background-color: #DC2626;
+        border-color: #B91C1C;
+    }
+    ConfirmationDialog QPushButton[text="&Yes"]:hover {
+        background-color: #EF4444;
+        border-color: #DC2626;
+    }
+"""
+
+
+# (key, glyph, tooltip, button_type) for each action painted in the users table
+USER_ACTIONS = (
+    ("edit", "E", "Edit User Permissions", "normal"),
+    ("delete", "X", "Delete User", "destructive"),
+)
 
-class ActionButton(QPushButton):
-    """Custom action button with icon and enhanced hover effects"""
-
-    def __init__(self, icon: str, tooltip: str, button_type: str = "normal", parent=None):
-        super().__init__(icon, parent)
-        self.setToolTip(tooltip)
-        self.setCursor(Qt.PointingHandCursor)
-        self.setFixedSize(36, 36)
-        self.button_type = button_type
-
-        # Different styles for destructive actions
-        if button_type == "destructive":
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #4A5578;
-                    border: 1px solid #5A6588;
-                    border-radius: 6px;
-                    color: #FF6B6B;
-                    font-size: 18px;
-                    font-weight: 700;
-                    padding: 0px;
-                }
-                QPushButton:hover {
-                    background-color: #EF4444;
-                    border-color: #DC2626;
-                    color: #FFFFFF;
-                    transform: scale(1.05);
-                }
-                QPushButton:pressed {
-                    background-color: #DC2626;
-                    transform: scale(0.95);
-                }
-                QPushButton:disabled {
-                    background-color: #3A4558;
-                    border-color: #4A5578;
-                    color: #6B7280;
-                    opacity: 0.5;
-                }
-            """)
-        else:
-            self.setStyleSheet("""
-                QPushButton {
-                    background-color: #4A5578;
-                    border: 1px solid #5A6588;
-                    border-radius: 6px;
-                    color: #E0E7FF;
-                    font-size: 16px;
-                    font-weight: 700;
-                    padding: 0px;
-                }
-                QPushButton:hover {
-                    background-color: #0EA5E9;
-                    border-color: #0EA5E9;
-                    color: #FFFFFF;
-                    transform: scale(1.05);
-                }
-                QPushButton:pressed {
-                    background-color: #0284C7;
-                    transform: scale(0.95);
-                }
-                QPushButton:disabled {
-                    background-color: #3A4558;
-                    border-color: #4A5578;
-                    color: #6B7280;
-                    opacity: 0.5;
-                }
-            """)
+
+class UsersTableModel(QAbstractTableModel):
+    """Read-only rows of (username, role, last login) for the users table"""
+    
+    HEADERS = ("USER", "ROLE", "LAST LOGIN", "ACTIONS")
+    ACTIONS_COLUMN = 3
+    
+    def __init__(self, rows=(), parent=None):
+        super().__init__(parent)
+        self._rows = list(rows)
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.column() == self.ACTIONS_COLUMN:
+            return None
+        if role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+    
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable if index.isValid() else Qt.NoItemFlags
+    
+    def set_rows(self, rows):
+        """Replace all rows"""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+    
+    def username(self, row):
+        return self._rows[row][0]
 
 
 class ConfirmationDialog(QMessageBox):
@@ -96,38 +163,6 @@ class ConfirmationDialog(QMessageBox):
         self.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
         self.setDefaultButton(QMessageBox.No)
 
-        # Style the dialog
-        self.setStyleSheet("""
-            QMessageBox {
-                background-color: #1E293B;
-                color: #E0E7FF;
-            }
-            QMessageBox QLabel {
-                color: #E0E7FF;
-                font-size: 14px;
-            }
-            QPushButton {
-                background-color: #4A5578;
-                border: 1px solid #5A6588;
-                border-radius: 6px;
-                color: #E0E7FF;
-                padding: 8px 20px;
-                font-weight: 600;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #0EA5E9;
-                border-color: #0EA5E9;
-            }
-            QPushButton[text="&Yes"] {
-                background-color: #DC2626;
-                border-color: #B91C1C;
-            }
-            QPushButton[text="&Yes"]:hover {
-                background-color: #EF4444;
-                border-color: #DC2626;
-            }
-        """)
 
 
 class UsersPage(QWidget):
@@ -155,21 +190,15 @@ class UsersPage(QWidget):
 
     def _init_ui(self):
         """Initialize users page UI"""
+        self.setStyleSheet(USERS_PAGE_QSS)
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(0, 0, 0, 0)
         self.main_layout.setSpacing(0)
 
-        # Show content directly
-        self._show_content()
-
-    def _show_content(self):
-        """Display the actual users page content"""
-        # Clear existing content
-        while self.main_layout.count():
-            item = self.main_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+        self._build_content_once()
 
+    def _build_content_once(self):
+        """Build the page widgets; later updates go through refresh()"""
         # Create content widget
         self.content_widget = QWidget()
         content_layout = QVBoxLayout(self.content_widget)
@@ -192,6 +221,12 @@ class UsersPage(QWidget):
 
         self.main_layout.addWidget(self.content_widget)
 
+    def refresh(self):
+        """Reload the users list and the selected user's permissions in place"""
+        self._load_users_from_database()
+        if self.selected_user:
+            self._load_user_permissions(self.selected_user)
+
     def _create_page_header(self):
         """Create page header"""
         header_frame = QFrame()
@@ -203,35 +238,18 @@ class UsersPage(QWidget):
         title_container = QHBoxLayout()
 
         title = QLabel("Users & Access Control")
-        title.setStyleSheet("""
-            font-size: 36px;
-            font-weight: 700;
-            color: #e6d9ff;
-            letter-spacing: -1.2px;
-        """)
+        title.setObjectName("usersTitle")
 
         # User badge
         user_badge = QLabel(f"Logged in as {self.authenticated_admin}")
-        user_badge.setStyleSheet("""
-            background-color: #065F46;
-            color: #D1FAE5;
-            font-size: 13px;
-            font-weight: 600;
-            padding: 6px 14px;
-            border-radius: 16px;
-            margin-left: 16px;
-        """)
+        user_badge.setObjectName("userBadge")
 
         title_container.addWidget(title)
         title_container.addWidget(user_badge)
         title_container.addStretch()
 
         subtitle = QLabel("Manage database users and their permissions")
-        subtitle.setStyleSheet("""
-            color: #b8a5d8;
-            font-size: 16px;
-            font-weight: 500;
-        """)
+        subtitle.setObjectName("usersSubtitle")
 
         header_layout.addLayout(title_container)
         header_layout.addWidget(subtitle)
@@ -250,12 +268,7 @@ class UsersPage(QWidget):
         header_layout = QHBoxLayout()
 
         users_title = QLabel("DATABASE USERS")
-        users_title.setStyleSheet("""
-            font-size: 20px;
-            font-weight: 700;
-            color: #e6d9ff;
-            letter-spacing: 0.5px;
-        """)
+        users_title.setObjectName("usersSectionTitle")
 
         btn_add_user = QPushButton("+ New User")
         btn_add_user.setObjectName("primaryButton")
@@ -269,12 +282,14 @@ class UsersPage(QWidget):
 
         users_layout.addLayout(header_layout)
 
-        # Users table
-        self.users_table = QTableWidget()
-        self.users_table.setColumnCount(4)
-        self.users_table.setHorizontalHeaderLabels([
-            "USER", "ROLE", "LAST LOGIN", "ACTIONS"
-        ])
+        # Users table; the action buttons are painted by a delegate, not widgets
+        self.users_model = UsersTableModel(parent=self)
+        self.users_table = QTableView()
+        self.users_table.setModel(self.users_model)
+        self.users_actions = ActionColumnDelegate(
+            self.users_table, UsersTableModel.ACTIONS_COLUMN, USER_ACTIONS
+        )
+        self.users_actions.action_clicked.connect(self._handle_user_action)
 
         # Column sizing
         self.users_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
@@ -284,13 +299,14 @@ class UsersPage(QWidget):
         self.users_table.horizontalHeader().resizeSection(3, 120)
 
         self.users_table.verticalHeader().setVisible(False)
-        self.users_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.users_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.users_table.verticalHeader().setDefaultSectionSize(75)
+        self.users_table.setSelectionBehavior(QTableView.SelectRows)
+        self.users_table.setSelectionMode(QTableView.SingleSelection)
         self.users_table.setShowGrid(False)
         self.users_table.setMinimumHeight(280)
 
         # Connect row click to select user
-        self.users_table.cellClicked.connect(self._on_user_row_clicked)
+        self.users_table.clicked.connect(self._on_user_row_clicked)
 
         # Load users
         self._load_users_from_database()
@@ -299,46 +315,6 @@ class UsersPage(QWidget):
 
         return users_frame
 
-    def _add_user_row(self, username: str, role: str, last_login: str):
-        """Add a row to users table"""
-        row = self.users_table.rowCount()
-        self.users_table.insertRow(row)
-
-        # Username
-        user_item = QTableWidgetItem(username)
-        user_item.setFlags(user_item.flags() & ~Qt.ItemIsEditable)
-        self.users_table.setItem(row, 0, user_item)
-
-        # Role
-        role_item = QTableWidgetItem(role)
-        role_item.setFlags(role_item.flags() & ~Qt.ItemIsEditable)
-        self.users_table.setItem(row, 1, role_item)
-
-        # Last Login
-        login_item = QTableWidgetItem(last_login)
-        login_item.setFlags(login_item.flags() & ~Qt.ItemIsEditable)
-        self.users_table.setItem(row, 2, login_item)
-
-        # Actions
-        actions_widget = QWidget()
-        actions_layout = QHBoxLayout(actions_widget)
-        actions_layout.setContentsMargins(8, 6, 8, 6)
-        actions_layout.setSpacing(8)
-
-        # Edit button (now selects user)
-        btn_edit = ActionButton("E", "Edit User Permissions")
-        btn_edit.clicked.connect(lambda checked=False, name=username: self._select_user(name))
-
-        # Delete button
-        btn_delete = ActionButton("X", "Delete User", "destructive")
-        btn_delete.clicked.connect(lambda checked=False, name=username: self._handle_delete_user(name))
-
-        actions_layout.addWidget(btn_edit)
-        actions_layout.addWidget(btn_delete)
-
-        self.users_table.setCellWidget(row, 3, actions_widget)
-        self.users_table.setRowHeight(row, 75)
-
     def _create_permissions_grid(self):
         """Create permissions grid section"""
         permissions_frame = QFrame()
@@ -349,12 +325,7 @@ class UsersPage(QWidget):
 
         # Title (will be updated when user is selected)
         self.perm_title = QLabel(self._get_permissions_title())
-        self.perm_title.setStyleSheet("""
-            font-size: 20px;
-            font-weight: 700;
-            color: #e6d9ff;
-            letter-spacing: 0.5px;
-        """)
+        self.perm_title.setObjectName("usersSectionTitle")
         permissions_layout.addWidget(self.perm_title)
 
         # Permissions grid
@@ -365,26 +336,14 @@ class UsersPage(QWidget):
 
         # Headers
         header_label = QLabel("DATABASE/TABLE")
-        header_label.setStyleSheet("""
-            font-size: 14px;
-            font-weight: 700;
-            color: #b8a5d8;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        """)
+        header_label.setObjectName("permHeader")
         perm_grid.addWidget(header_label, 0, 0)
 
         permissions = ["INSERT", "DELETE", "UPDATE", "CREATE"]
         for col, perm in enumerate(permissions, 1):
             label = QLabel(perm)
             label.setAlignment(Qt.AlignCenter)
-            label.setStyleSheet("""
-                font-size: 14px;
-                font-weight: 700;
-                color: #b8a5d8;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-            """)
+            label.setObjectName("permHeader")
             perm_grid.addWidget(label, 0, col)
 
         # Database rows
@@ -393,11 +352,7 @@ class UsersPage(QWidget):
 
         for row, db in enumerate(databases, 1):
             db_label = QLabel(db)
-            db_label.setStyleSheet("""
-                font-size: 14px;
-                font-weight: 600;
-                color: #E0E7FF;
-            """)
+            db_label.setObjectName("permDatabase")
             perm_grid.addWidget(db_label, row, 0)
 
             self.permission_checkboxes[db] = {}
@@ -406,23 +361,7 @@ class UsersPage(QWidget):
                 checkbox = QCheckBox()
                 checkbox.setChecked(False)
                 checkbox.setCursor(Qt.PointingHandCursor)
-                checkbox.setStyleSheet("""
-                    QCheckBox::indicator {
-                        width: 20px;
-                        height: 20px;
-                        border: 2px solid #5A6588;
-                        border-radius: 4px;
-                        background-color: #2A2F4A;
-                    }
-                    QCheckBox::indicator:hover {
-                        border-color: #0EA5E9;
-                        background-color: #323852;
-                    }
-                    QCheckBox::indicator:checked {
-                        background-color: #0EA5E9;
-                        border-color: #0EA5E9;
-                    }
-                """)
+                checkbox.setObjectName("permCheckbox")
 
                 checkbox_container = QWidget()
                 checkbox_layout = QHBoxLayout(checkbox_container)
@@ -453,12 +392,19 @@ class UsersPage(QWidget):
         else:
             return "PERMISSIONS (SELECT A USER TO MANAGE)"
 
-    def _on_user_row_clicked(self, row, column):
+    def _on_user_row_clicked(self, index):
         """Handle user row click"""
-        username_item = self.users_table.item(row, 0)
-        if username_item:
-            username = username_item.text()
+        # Clicks on the action buttons are handled by _handle_user_action
+        if index.column() != UsersTableModel.ACTIONS_COLUMN:
+            self._select_user(self.users_model.username(index.row()))
+
+    def _handle_user_action(self, action: str, row: int):
+        """Dispatch a click on one of the painted row action buttons"""
+        username = self.users_model.username(row)
+        if action == "edit":
             self._select_user(username)
+        elif action == "delete":
+            self._handle_delete_user(username)
 
     def _select_user(self, username: str):
         """Select a user and load their permissions"""
@@ -576,8 +522,8 @@ class UsersPage(QWidget):
 
     def _load_users_from_database(self):
         """Load users from database"""
-        # Clear existing rows
-        self.users_table.setRowCount(0)
+        # Collected here and applied in one model reset at the end
+        rows = []
 
         try:
             if not self.db_manager:
@@ -637,13 +583,13 @@ class UsersPage(QWidget):
                             except Exception:
                                 last_login_str = "Never"
 
-                        self._add_user_row(f"• {username}", role, last_login_str)
+                        rows.append((f"• {username}", role, last_login_str))
                 else:
-                    self._load_mysql_users(cursor)
+                    rows = self._load_mysql_users(cursor)
 
             except Exception as e:
                 print(f"users table not found: {e}")
-                self._load_mysql_users(cursor)
+                rows = self._load_mysql_users(cursor)
 
             cursor.close()
 
@@ -655,8 +601,12 @@ class UsersPage(QWidget):
                 f"Failed to load users: {str(e)}"
             )
 
+        finally:
+            self.users_model.set_rows(rows)
+
     def _load_mysql_users(self, cursor):
-        """Load users from MySQL user table"""
+        """(username, role, last login) rows from the MySQL user table"""
+        rows = []
         try:
             query = """
                 SELECT User, Host
@@ -672,9 +622,10 @@ class UsersPage(QWidget):
                     username = user['User']
                     host = user['Host']
                     role = "Administrator" if username == 'root' else "Database User"
-                    self._add_user_row(f"• {username}@{host}", role, "Never")
+                    rows.append((f"• {username}@{host}", role, "Never"))
         except Exception as e:
             print(f"Error loading MySQL users: {e}")
+        return rows
 
     def _get_databases_list(self):
         """Get list of databases"""